@@ -120,6 +120,13 @@ REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    # JSON은 orjson(설치된 경우), Accept: application/msgpack이면 MessagePack (core/renderers.py)
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'core.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_CONTENT_NEGOTIATION_CLASS': 'core.renderers.AvailableRendererNegotiation',
 }
 
 # Spectacular 설정
@@ -242,6 +249,33 @@ DATABASES = {
 }
 
 
+# Cache
+# CACHE_BACKEND: 'locmem' (프로세스별 메모리) 또는 'file' (CACHE_LOCATION 디렉터리, 여러 프로세스가 공유)
+CACHE_BACKEND = env("CACHE_BACKEND", default='locmem')
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND],
+        'LOCATION': env(
+            "CACHE_LOCATION",
+            default=str(BASE_DIR / '.cache') if CACHE_BACKEND == 'file' else 'infobridge'
+        ),
+        'OPTIONS': {'MAX_ENTRIES': env.int("CACHE_MAX_ENTRIES", default=5000)},
+    },
+    # 응답 캐시 버전 토큰 (response_cache.py). 웹 서버와 워커(관리 명령) 프로세스가 모두 보는 저장소여야
+    # 무효화가 전달되므로, CACHE_BACKEND와 상관없이 파일 캐시를 사용합니다.
+    'response-versions': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': env("RESPONSE_CACHE_VERSION_LOCATION", default=str(BASE_DIR / '.cache' / 'response-versions')),
+        'OPTIONS': {'MAX_ENTRIES': env.int("RESPONSE_CACHE_VERSION_MAX_ENTRIES", default=10000)},
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -282,3 +316,74 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# 외부 데이터 설정
+# 매칭에 사용하는 외부 API 데이터 파일 (변경 시 mtime/size 기준으로 자동 재로드)
+EXTERNAL_DATA_PATH = env("EXTERNAL_DATA_PATH", default=str(BASE_DIR / 'dummy_data.json'))
+# 아주 큰 덤프(JSON 배열/NDJSON, gzip/zstd)는 메모리에 올리지 않고 요청마다 청크 단위로 스트리밍
+EXTERNAL_DATA_STREAMING = env.bool("EXTERNAL_DATA_STREAMING", default=False)
+EXTERNAL_DATA_CHUNK_SIZE = env.int("EXTERNAL_DATA_CHUNK_SIZE", default=64 * 1024)
+# 키워드 매칭용 전문 검색 인덱스 (SQLite FTS5 trigram). 비워 두면 순차 검사
+EXTERNAL_DATA_FTS_PATH = env("EXTERNAL_DATA_FTS_PATH", default=str(BASE_DIR / 'external_data_fts.sqlite3'))
+# 외부 데이터 매칭 결과로 아이템/추천을 만들 때 bulk_create 배치 크기
+BULK_CREATE_BATCH_SIZE = env.int("BULK_CREATE_BATCH_SIZE", default=500)
+
+
+# 요약 LLM 응답 캐시 (같은 모델/프롬프트/입력이면 AIRequest.output 재사용)
+# TTL(초)이 0이면 캐시를 사용하지 않음
+SUMMARY_CACHE_TTL = env.int("SUMMARY_CACHE_TTL", default=24 * 60 * 60)
+SUMMARY_CACHE_MAX_ENTRIES = env.int("SUMMARY_CACHE_MAX_ENTRIES", default=1000)
+# 맵리듀스 요약: 입력 토큰 추정치가 SUMMARY_MAX_INPUT_TOKENS를 넘으면 (mode=auto)
+# 아이템을 SUMMARY_CHUNK_TOKEN_BUDGET 단위 청크로 나눠 부분 요약 후 통합
+SUMMARY_MAX_INPUT_TOKENS = env.int("SUMMARY_MAX_INPUT_TOKENS", default=30000)
+SUMMARY_CHUNK_TOKEN_BUDGET = env.int("SUMMARY_CHUNK_TOKEN_BUDGET", default=8000)
+# 비동기 요약 작업 (process_summary_jobs)
+# 임대 시간(초): running 작업이 이 시간 동안 갱신되지 않으면 워커가 죽은 것으로 보고 다시 대기열에 넣음
+# 최대 시도 횟수를 넘으면 실패 처리. LLM 호출 한도(429/503)로 실패하면 지연(초) 후 다시 시도
+SUMMARY_JOB_LEASE_SECONDS = env.int("SUMMARY_JOB_LEASE_SECONDS", default=600)
+SUMMARY_JOB_MAX_ATTEMPTS = env.int("SUMMARY_JOB_MAX_ATTEMPTS", default=3)
+SUMMARY_JOB_RETRY_DELAY = env.float("SUMMARY_JOB_RETRY_DELAY", default=30.0)
+
+
+# LLM 클라이언트 (core/llm.py)
+# LLM_BACKEND: 'gemini', 'fake'(네트워크 없는 로컬 백엔드) 또는 LLMClient 하위 클래스의 dotted path
+LLM_BACKEND = env("LLM_BACKEND", default='gemini')
+LLM_MODEL_NAME = env("LLM_MODEL_NAME", default='gemini-1.5-flash')
+LLM_API_KEY = env("GEMINI_API_KEY", default='')
+# 호출당 타임아웃(초), 일시적 오류 재시도 횟수와 백오프 기본 간격(초)
+LLM_TIMEOUT = env.float("LLM_TIMEOUT", default=60.0)
+LLM_MAX_RETRIES = env.int("LLM_MAX_RETRIES", default=2)
+LLM_RETRY_BACKOFF = env.float("LLM_RETRY_BACKOFF", default=0.5)
+# fake 백엔드의 응답 지연(초)
+LLM_FAKE_LATENCY = env.float("LLM_FAKE_LATENCY", default=0.0)
+# 프로세스 전체 LLM 호출 제한: 동시 호출 수(0이면 무제한), 대기열 크기, 대기 시간(초)
+# 초당 호출 수(0이면 무제한)와 순간 허용량. 넘으면 429(빈도)/503(대기열) 응답
+LLM_MAX_CONCURRENCY = env.int("LLM_MAX_CONCURRENCY", default=8)
+LLM_MAX_QUEUE = env.int("LLM_MAX_QUEUE", default=32)
+LLM_QUEUE_TIMEOUT = env.float("LLM_QUEUE_TIMEOUT", default=10.0)
+LLM_RATE_LIMIT = env.float("LLM_RATE_LIMIT", default=0.0)
+LLM_RATE_BURST = env.int("LLM_RATE_BURST", default=10)
+# 같은 요약 요청이 먼저 들어온 요청의 결과를 기다리는 최대 시간(초, 0이면 무제한)
+# 기다리는 동안 LLM 대기열(LLM_MAX_QUEUE) 자리를 차지하며, 대기열이 가득 찼거나 시간을 넘으면 503
+LLM_FLIGHT_TIMEOUT = env.float("LLM_FLIGHT_TIMEOUT", default=120.0)
+
+
+# AIRequest.input/output, Summary.content 등 큰 텍스트의 압축 코덱 ('zstd' 또는 'zlib')
+# zstandard 패키지가 없으면 zstd 대신 zlib을 사용
+BLOB_STORAGE_CODEC = env("BLOB_STORAGE_CODEC", default='zstd')
+
+
+# 요약 Markdown 렌더링 (바뀌면 저장된 HTML을 다시 렌더링: python manage.py render_summaries)
+MARKDOWN_EXTENSIONS = ['extra', 'codehilite']
+# 프로세스 안에 유지하는 렌더링 결과 수
+MARKDOWN_RENDER_CACHE_SIZE = env.int("MARKDOWN_RENDER_CACHE_SIZE", default=512)
+
+
+# 프로젝트 상세 응답(GET /api/projects/{id}/)에 포함하는 하위 목록(자료/아이템/요약/추천)별 최대 개수
+# 전체 목록은 각 목록의 *_url(페이지네이션 엔드포인트)에서 조회
+PROJECT_DETAIL_NESTED_LIMIT = env.int("PROJECT_DETAIL_NESTED_LIMIT", default=20)
+
+
+# 조회 API 응답 캐시 (프로젝트별 버전 토큰으로 무효화, 0이면 사용 안 함)
+RESPONSE_CACHE_TIMEOUT = env.int("RESPONSE_CACHE_TIMEOUT", default=300)
@@ -1,8 +1,8 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
-import markdown
-from .models import Project, ProjectMaterial, AIRequest, Summary, Item, Recommendation
+from .markdown_render import rendered_html
+from .models import Project, ProjectMaterial, AIRequest, Summary, RenderedMarkdown, SummaryChunk, SummaryJob, Item, Recommendation
 
 
 @admin.register(Project)
@@ -27,11 +27,15 @@ class ProjectMaterialAdmin(admin.ModelAdmin):
     list_display = ('material_type', 'project', 'material_link', 'created_at')
     list_filter = ('material_type', 'created_at', 'updated_at')
     search_fields = ('project__project_name', 'material_link', 'project__project_code')
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('keyword_watermark', 'code_watermark', 'created_at', 'updated_at')
     fieldsets = (
         ('기본 정보', {
             'fields': ('project', 'material_type', 'material_link')
         }),
+        ('매칭 워터마크', {
+            'fields': ('keyword_watermark', 'code_watermark'),
+            'classes': ('collapse',)
+        }),
         ('시간 정보', {
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
@@ -41,14 +45,18 @@ class ProjectMaterialAdmin(admin.ModelAdmin):
 
 @admin.register(AIRequest)
 class AIRequestAdmin(admin.ModelAdmin):
-    list_display = ('id', 'description', 'created_at')
-    list_filter = ('created_at',)
-    readonly_fields = ('created_at',)
-    search_fields = ('input', 'output', 'description')
+    list_display = ('id', 'description', 'model_name', 'created_at')
+    list_filter = ('model_name', 'created_at')
+    readonly_fields = ('model_name', 'content_hash', 'created_at')
+    search_fields = ('description', 'content_hash')
     fieldsets = (
         ('AI 요청 정보', {
             'fields': ('input', 'output', 'description')
         }),
+        ('캐시 정보', {
+            'fields': ('model_name', 'content_hash'),
+            'classes': ('collapse',)
+        }),
         ('시간 정보', {
             'fields': ('created_at',),
             'classes': ('collapse',)
@@ -60,7 +68,7 @@ class AIRequestAdmin(admin.ModelAdmin):
 class SummaryAdmin(admin.ModelAdmin):
     list_display = ('project', 'ai_request', 'created_at')
     list_filter = ('created_at', 'updated_at')
-    search_fields = ('project__project_name', 'content', 'project__project_code')
+    search_fields = ('project__project_name', 'project__project_code')
     readonly_fields = ('created_at', 'updated_at', 'content_preview')
     fieldsets = (
         ('요약 정보', {
@@ -78,8 +86,8 @@ class SummaryAdmin(admin.ModelAdmin):
     
     def content_preview(self, obj):
         if obj.content:
-            # Markdown을 HTML로 변환
-            html_content = markdown.markdown(obj.content, extensions=['extra', 'codehilite'])
+            # Markdown을 HTML로 변환 (원문별로 한 번만 렌더링해 저장된 결과 사용)
+            html_content = rendered_html(obj)
             
             # CSS 스타일을 별도 변수로 정의
             css_style = '''
@@ -207,6 +215,39 @@ class SummaryAdmin(admin.ModelAdmin):
     content_preview.short_description = "Markdown 미리보기"
 
 
+@admin.register(RenderedMarkdown)
+class RenderedMarkdownAdmin(admin.ModelAdmin):
+    list_display = ('content_hash', 'renderer', 'created_at')
+    list_filter = ('created_at',)
+    search_fields = ('content_hash', 'renderer')
+    readonly_fields = ('content_hash', 'renderer', 'html', 'created_at')
+
+
+@admin.register(SummaryJob)
+class SummaryJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'project', 'status', 'mode', 'attempts', 'summary', 'created_at', 'finished_at')
+    list_filter = ('status', 'mode', 'created_at')
+    search_fields = ('project__project_name', 'project__project_code', 'error')
+    readonly_fields = ('attempts', 'started_at', 'finished_at', 'created_at', 'updated_at')
+    fieldsets = (
+        ('작업 정보', {
+            'fields': ('project', 'status', 'mode', 'summary', 'error', 'attempts')
+        }),
+        ('시간 정보', {
+            'fields': ('run_after', 'started_at', 'finished_at', 'created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    )
+
+
+@admin.register(SummaryChunk)
+class SummaryChunkAdmin(admin.ModelAdmin):
+    list_display = ('chunk_hash', 'project', 'ai_request', 'created_at')
+    list_filter = ('created_at',)
+    search_fields = ('chunk_hash', 'project__project_name', 'project__project_code')
+    readonly_fields = ('chunk_hash', 'item_ids', 'created_at')
+
+
 @admin.register(Item)
 class ItemAdmin(admin.ModelAdmin):
     list_display = ('title', 'body', 'project', 'project_material', 'is_fixed', 'is_active', 'created_at')
@@ -1,195 +1,553 @@
+from datetime import timedelta
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import Count, Max, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
-import json
-import os
-from .models import Project, ProjectMaterial, AIRequest, Summary, Item, Recommendation
+from .external_data import (
+    ExternalDataError, ExternalDataset, canonicalize_link, get_external_dataset, record_updated_at,
+    stream_external_records,
+)
+from .conditional import ConditionalGetMixin
+from .external_search import search_external_records
+from .keyword_matcher import get_keyword_matcher, normalize_text
+from .models import Project, ProjectMaterial, AIRequest, Summary, SummaryJob, Item, Recommendation
+from .pagination import PageOrCursorPagination
+from .response_cache import ResponseCacheMixin, bump_project_version, cached_action
 from .serializers import (
     ProjectSerializer, ProjectDetailSerializer,
     ProjectMaterialSerializer, ProjectMaterialDetailSerializer,
-    AIRequestSerializer, SummarySerializer, ItemSerializer, RecommendationSerializer
+    AIRequestSerializer, SummarySerializer, SummaryJobSerializer, ItemSerializer, RecommendationSerializer
 )
+from .sparse_fields import SparseFieldsViewMixin
+from .summarization import SUMMARY_MODES, SummarizationError, summarize_project_items
+
+
+# 직렬화기가 읽는 관계 (목록에서 행마다 추가 쿼리가 나가지 않도록 select_related에 사용)
+ITEM_RELATIONS = ('project', 'project_material')
+RECOMMENDATION_RELATIONS = ('project', 'item')
+
+# 이미 같은 링크의 아이템이 있어 건너뛴 매칭의 오류 메시지
+ITEM_EXISTS_ERROR = 'Item already exists'
 
-import google.generativeai as genai
+
+def project_count_subquery(model):
+    """프로젝트별 행 수 서브쿼리 (여러 역참조를 JOIN으로 세면 행이 곱해지므로 따로 셉니다)"""
+    counts = (
+        model.objects.filter(project=OuterRef('pk'))
+        .order_by().values('project').annotate(count=Count('id')).values('count')
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def project_updated_subquery(model):
+    """프로젝트별 최근 updated_at 서브쿼리"""
+    updated = (
+        model.objects.filter(project=OuterRef('pk'))
+        .order_by().values('project').annotate(updated=Max('updated_at')).values('updated')
+    )
+    return Subquery(updated)
 
 
-# 프로젝트에 종속되지 않는 독립적인 API 키를 사용해야 합니다.
-# 실제 API 키는 환경 변수로 관리하는 것을 권장합니다.
-# genai.configure(api_key=os.environ.get("GEMINI_API_KEY"))
+def project_detail_validator(pk):
+    """
+    프로젝트 상세 응답의 조건부 GET 검증 값. 프로젝트와 하위 목록별 행 수/최근 updated_at을 쿼리 한 번으로 계산합니다.
+    프로젝트가 없으면 None.
+    """
+    nested = {'materials': ProjectMaterial, 'items': Item, 'summaries': Summary, 'recommendations': Recommendation}
+    annotations = {}
+    for name, model in nested.items():
+        annotations[f"{name}_count"] = project_count_subquery(model)
+        annotations[f"{name}_updated"] = project_updated_subquery(model)
+    validator = Project.objects.filter(pk=pk).annotate(**annotations).values('updated_at', *annotations).first()
+    if validator is not None:
+        validator['nested_limit'] = settings.PROJECT_DETAIL_NESTED_LIMIT
+    return validator
 
 
-# 예제용 더미 키
-genai.configure(api_key="xxxx-xxxx")
+def project_detail_queryset(queryset, fields=None):
+    """
+    ProjectDetailSerializer용 쿼리셋. fields(출력할 필드 이름)가 주어지면 포함된 하위 목록과 개수만 가져옵니다.
+    하위 목록은 최신순으로 PROJECT_DETAIL_NESTED_LIMIT개만 recent_<목록> 속성에 Prefetch하고
+    전체 개수는 <목록>_count로 annotate하므로, 프로젝트의 데이터 양과 관계없이 쿼리 수가 일정합니다. (프로젝트 1 + 하위 목록 4)
+    """
+    limit = settings.PROJECT_DETAIL_NESTED_LIMIT
+    nested = {
+        'materials': ProjectMaterial.objects.select_related('project'),
+        'items': Item.objects.select_related(*ITEM_RELATIONS),
+        'summaries': Summary.objects.with_blobs().select_related('project'),
+        'recommendations': Recommendation.objects.select_related(*RECOMMENDATION_RELATIONS),
+    }
+    if fields is None:
+        fields = [name for name in nested] + [f"{name}_count" for name in nested]
+    return queryset.annotate(**{
+        f"{name}_count": project_count_subquery(related.model)
+        for name, related in nested.items() if f"{name}_count" in fields
+    }).prefetch_related(*[
+        Prefetch(name, queryset=related.order_by('-created_at', '-id')[:limit], to_attr=f"recent_{name}")
+        for name, related in nested.items() if name in fields
+    ])
 
 
 def load_external_data():
-    """외부 API 데이터를 로드합니다."""
-    try:
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        file_path = os.path.join(base_dir, 'dummy_data.json')
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"외부 데이터 로드 실패: {e}")
-        return []
+    """외부 API 데이터를 로드합니다. (프로세스 단위 캐시 사용)"""
+    return list(get_external_dataset())
+
+
+def get_external_data():
+    """
+    매칭에 사용할 외부 데이터를 반환합니다.
+
+    EXTERNAL_DATA_STREAMING이 켜져 있으면 파일을 청크 단위로 읽는 레코드 제너레이터를,
+    아니면 프로세스 캐시에 올라간 스냅샷을 반환합니다.
+    """
+    if settings.EXTERNAL_DATA_STREAMING:
+        return stream_external_records()
+    return get_external_dataset()
+
+
+def iter_material_records(materials, external_data, since=None, seen=None):
+    """
+    (자료, 해당 자료의 외부 레코드) 쌍을 생성합니다.
+
+    since({자료 ID: 워터마크})가 주어지면 워터마크보다 새로운(updated_at이 큰) 레코드만 생성하고,
+    seen이 주어지면 자료별로 확인한 레코드의 최대 updated_at을 기록합니다.
+    """
+    if isinstance(external_data, ExternalDataset):
+        # 인덱스에서 같은 자료의 외부 데이터만 가져옴
+        pairs = (
+            (material, external_item)
+            for material in materials
+            for external_item in external_data.find(material.material_type, material.material_link)
+        )
+    else:
+        # 스트리밍: 레코드를 한 번만 훑으면서 자료별로 나눔
+        materials_by_key = {}
+        for material in materials:
+            key = (material.material_type, canonicalize_link(material.material_link))
+            materials_by_key.setdefault(key, []).append(material)
+        pairs = (
+            (material, external_item)
+            for external_item in external_data
+            for material in materials_by_key.get(
+                (external_item.get('material_type'), canonicalize_link(external_item.get('material_link'))), ()
+            )
+        )
+    
+    if since is None and seen is None:
+        yield from pairs
+        return
+    
+    for material, external_item in pairs:
+        updated_at = record_updated_at(external_item)
+        if updated_at is not None:
+            if seen is not None and (seen.get(material.id) is None or updated_at > seen[material.id]):
+                seen[material.id] = updated_at
+            watermark = since.get(material.id) if since else None
+            if watermark is not None and updated_at <= watermark:
+                continue
+        yield material, external_item
+
+
+def advance_watermarks(seen, field, errors=()):
+    """
+    자료별 워터마크를 앞으로만 이동합니다. field는 'keyword_watermark' 또는 'code_watermark'.
+
+    errors(create_items_from_matches의 오류 목록)에 생성 실패가 있으면, 다음 증분 매칭에서 다시 시도하도록
+    해당 자료의 워터마크를 실패한 레코드 중 가장 이른 updated_at 직전까지만 이동합니다.
+    ('Item already exists'는 실패가 아니므로 무시합니다.)
+    """
+    failed = {}
+    for error in errors:
+        if error['error'] == ITEM_EXISTS_ERROR or 'project_material_id' not in error:
+            continue
+        updated_at = record_updated_at(error['external_data'])
+        if updated_at is None:
+            # updated_at이 없는 레코드는 워터마크와 상관없이 매번 확인합니다.
+            continue
+        material_id = error['project_material_id']
+        if material_id not in failed or updated_at < failed[material_id]:
+            failed[material_id] = updated_at
+    
+    moved = []
+    for material_id, updated_at in seen.items():
+        if material_id in failed:
+            updated_at = min(updated_at, failed[material_id] - timedelta(microseconds=1))
+        # update()는 auto_now를 갱신하지 않으므로 조건부 GET 검증 값을 위해 updated_at도 바꿉니다.
+        if ProjectMaterial.objects.filter(id=material_id).filter(
+            Q(**{f'{field}__isnull': True}) | Q(**{f'{field}__lt': updated_at})
+        ).update(**{field: updated_at, 'updated_at': timezone.now()}):
+            moved.append(material_id)
+    # update()는 시그널을 보내지 않으므로 응답 캐시를 직접 무효화합니다.
+    for project_id in set(ProjectMaterial.objects.filter(id__in=moved).values_list('project_id', flat=True)):
+        bump_project_version(project_id)
+
+
+RENDERED_HTML_PARAMETER = OpenApiParameter(
+    name='rendered_html', type=bool, description='렌더링된 Markdown HTML(rendered_html) 포함 (한 번 렌더링 후 캐시)'
+)
+SPARSE_FIELDS_PARAMETERS = [
+    OpenApiParameter(name='fields', type=str, description='응답에 포함할 필드 (쉼표로 구분, 예: id,title)'),
+    OpenApiParameter(
+        name='expand', type=str,
+        description='관련 모델을 읽는 필드 포함 (쉼표로 구분, 예: project_name,item_title). 요청한 경우에만 JOIN합니다.'
+    ),
+]
 
 
-def find_matching_external_data(project):
+def query_flag(request, name):
+    """쿼리 파라미터를 bool로 해석합니다."""
+    return request.query_params.get(name, '').lower() in ('1', 'true', 'yes')
+
+
+def iter_matching_external_data(project, external_data=None, incremental=False, seen=None):
+    """
+    프로젝트 키워드와 매칭되는 외부 데이터를 하나씩 생성합니다.
+    incremental이면 자료별 keyword_watermark 이후에 갱신된 외부 데이터만 확인합니다.
+    """
+    if external_data is None:
+        external_data = get_external_data()
+    
+    # 프로젝트 키워드로 만든 매처 (키워드 문자열별로 캐시됨)
+    matcher = get_keyword_matcher(project.project_keyword)
+    
+    # 전문 검색 인덱스가 있으면 키워드가 포함된 레코드만 후보로 사용
+    if isinstance(external_data, ExternalDataset):
+        positions = search_external_records(external_data, matcher.keywords)
+        if positions is not None:
+            external_data = external_data.subset(positions)
+    
+    # 프로젝트의 자료들을 확인
+    materials = list(project.materials.all())
+    since = {material.id: material.keyword_watermark for material in materials} if incremental else None
+    for material, external_item in iter_material_records(materials, external_data, since, seen):
+        # 키워드 매칭 확인 (로드 시 정규화해 둔 제목과 본문을 한 번씩만 훑음)
+        matched_keyword, matched_keywords = matcher.match(external_item.title_norm, external_item.body_norm)
+        if matched_keyword is not None:
+            yield {
+                'project_id': project.id,
+                'project_name': project.project_name,
+                'project_keyword': project.project_keyword,
+                'project_material_id': material.id,
+                'material_type': material.material_type,
+                'material_link': material.material_link,
+                'external_data': external_item,
+                'matched_keyword': matched_keyword,
+                'matched_keywords': matched_keywords
+            }
+
+
+def find_matching_external_data(project, external_data=None, incremental=False, seen=None):
     """프로젝트와 매칭되는 외부 데이터를 찾습니다."""
-    external_data = load_external_data()
-    matching_data = []
+    return list(iter_matching_external_data(project, external_data, incremental, seen))
+
+
+def iter_matching_external_data_by_code(project, external_data=None, incremental=False, seen=None):
+    """
+    프로젝트 코드와 매칭되는 외부 데이터를 하나씩 생성합니다.
+    incremental이면 자료별 code_watermark 이후에 갱신된 외부 데이터만 확인합니다.
+    """
+    if external_data is None:
+        external_data = get_external_data()
     
-    # 프로젝트의 키워드를 분리
-    keywords = [kw.strip() for kw in project.project_keyword.split(',') if kw.strip()]
+    # 프로젝트 코드 (외부 데이터와 같은 방식으로 정규화)
+    project_code = normalize_text(project.project_code)
     
     # 프로젝트의 자료들을 확인
-    for material in project.materials.all():
-        material_type = material.material_type
-        material_link = material.material_link
+    materials = list(project.materials.all())
+    since = {material.id: material.code_watermark for material in materials} if incremental else None
+    for material, external_item in iter_material_records(materials, external_data, since, seen):
+        # 프로젝트 코드 매칭 확인
+        title = external_item.title_norm
+        body = external_item.body_norm
         
-        # 외부 데이터에서 매칭되는 항목 찾기
-        for external_item in external_data:
-            if (external_item.get('material_type') == material_type and 
-                external_item.get('material_link') == material_link):
-                
-                # 키워드 매칭 확인
-                title = external_item.get('title', '').lower()
-                body = external_item.get('body', '').lower()
-                
-                for keyword in keywords:
-                    keyword_lower = keyword.lower()
-                    if keyword_lower in title or keyword_lower in body:
-                        matching_data.append({
-                            'project_id': project.id,
-                            'project_name': project.project_name,
-                            'project_keyword': project.project_keyword,
-                            'project_material_id': material.id,
-                            'material_type': material_type,
-                            'material_link': material_link,
-                            'external_data': external_item,
-                            'matched_keyword': keyword
-                        })
-                        break  # 한 키워드가 매칭되면 다음 외부 항목으로
-    
-    return matching_data
-
-
-def find_matching_external_data_by_code(project):
+        if project_code in title or project_code in body:
+            yield {
+                'project_id': project.id,
+                'project_name': project.project_name,
+                'project_code': project.project_code,
+                'project_material_id': material.id,
+                'material_type': material.material_type,
+                'material_link': material.material_link,
+                'external_data': external_item,
+                'matched_in': 'title' if project_code in title else 'body'
+            }
+
+
+def find_matching_external_data_by_code(project, external_data=None, incremental=False, seen=None):
     """프로젝트 코드와 매칭되는 외부 데이터를 찾습니다."""
-    external_data = load_external_data()
-    matching_data = []
+    return list(iter_matching_external_data_by_code(project, external_data, incremental, seen))
+
+
+def create_items_from_matches(project, matching_data, is_fixed, create_recommendations=False, batch_size=None):
+    """
+    매칭 결과로 items(와 recommendations) 행을 한 트랜잭션 안에서 일괄 생성합니다.
+
+    기존 아이템 확인과 생성 모두 batch_size 단위로 처리합니다.
+    (링크 조회는 batch_size개씩 나눈 link__in 쿼리, 생성은 bulk_create)
+    (created_items, created_recommendations, errors)를 반환합니다.
+    생성에 실패한 항목의 오류에는 external_data와 project_material_id가 들어 있습니다. (advance_watermarks에서 사용)
+    """
+    batch_size = batch_size or settings.BULK_CREATE_BATCH_SIZE
+    created_items = []
+    created_recommendations = []
+    errors = []
     
-    # 프로젝트 코드
-    project_code = project.project_code.lower()
+    # 기존에 동일한 링크를 가진 아이템을 batch_size개씩 조회 (SQLite 변수 개수 제한)
+    links = list({match['external_data'].get('link') for match in matching_data})
+    existing_items = {}
+    for start in range(0, len(links), batch_size):
+        existing_items.update(
+            ((material_id, link), item_id)
+            for item_id, material_id, link in Item.objects.filter(
+                project=project, link__in=links[start:start + batch_size]
+            ).values_list('id', 'project_material_id', 'link')
+        )
     
-    # 프로젝트의 자료들을 확인
-    for material in project.materials.all():
-        material_type = material.material_type
-        material_link = material.material_link
+    new_items = []
+    duplicated = []  # 이번 요청 안에서 중복된 링크 (생성 후 item_id를 채움)
+    failures = {}  # 행 단위 재시도에서 실패한 아이템의 id() -> 오류 메시지
+    for match in matching_data:
+        external_data = match['external_data']
+        try:
+            key = (match['project_material_id'], external_data['link'])
+            if key in existing_items:
+                error = {
+                    'error': ITEM_EXISTS_ERROR,
+                    'link': external_data['link'],
+                    'item_id': existing_items[key]
+                }
+                if isinstance(existing_items[key], Item):
+                    duplicated.append((error, external_data))
+                errors.append(error)
+                continue
+            
+            item = Item(
+                project=project,
+                project_material_id=match['project_material_id'],
+                title=external_data['title'],
+                body=external_data['body'],
+                link=external_data['link'],
+                is_fixed=is_fixed,
+                origin_data_created_at=external_data['created_at'],
+                origin_data_updated_at=external_data['updated_at']
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            errors.append({
+                'error': str(e),
+                'external_data': external_data,
+                'project_material_id': match['project_material_id']
+            })
+            continue
         
-        # 외부 데이터에서 매칭되는 항목 찾기
-        for external_item in external_data:
-            if (external_item.get('material_type') == material_type and 
-                external_item.get('material_link') == material_link):
-                
-                # 프로젝트 코드 매칭 확인
-                title = external_item.get('title', '').lower()
-                body = external_item.get('body', '').lower()
-                
-                if project_code in title or project_code in body:
-                    matching_data.append({
-                        'project_id': project.id,
-                        'project_name': project.project_name,
-                        'project_code': project.project_code,
-                        'project_material_id': material.id,
-                        'material_type': material_type,
-                        'material_link': material_link,
-                        'external_data': external_item,
-                        'matched_in': 'title' if project_code in title else 'body'
+        existing_items[key] = item
+        new_items.append((item, external_data))
+    
+    try:
+        with transaction.atomic():
+            items = [item for item, _ in new_items]
+            Item.objects.bulk_create(items, batch_size=batch_size)
+            recommendations = []
+            if create_recommendations:
+                recommendations = Recommendation.objects.bulk_create([
+                    Recommendation(
+                        project=project,
+                        item=item,
+                        project_material_id=item.project_material_id,
+                        is_active=True
+                    )
+                    for item in items
+                ], batch_size=batch_size)
+        saved = list(zip(items, recommendations or [None] * len(items)))
+    except DatabaseError:
+        # 배치가 실패하면 행 단위로 다시 시도해 어떤 행이 실패했는지 보고합니다.
+        saved = []
+        with transaction.atomic():
+            for item, external_data in new_items:
+                try:
+                    with transaction.atomic():
+                        item.pk = None
+                        item._state.adding = True
+                        item.save()
+                        recommendation = None
+                        if create_recommendations:
+                            recommendation = Recommendation.objects.create(
+                                project=project,
+                                item=item,
+                                project_material_id=item.project_material_id,
+                                is_active=True
+                            )
+                    saved.append((item, recommendation))
+                except DatabaseError as e:
+                    failures[id(item)] = str(e)
+                    errors.append({
+                        'error': str(e),
+                        'external_data': external_data,
+                        'project_material_id': item.project_material_id
                     })
     
-    return matching_data
+    for error, external_data in duplicated:
+        item = error['item_id']
+        if id(item) in failures:
+            # 첫 번째 항목의 생성이 실패했으면 중복 항목도 같은 실패로 보고합니다.
+            error.clear()
+            error.update({
+                'error': failures[id(item)],
+                'external_data': external_data,
+                'project_material_id': item.project_material_id
+            })
+        else:
+            error['item_id'] = item.id
+    
+    # bulk_create는 시그널을 보내지 않으므로 응답 캐시를 직접 무효화합니다.
+    if saved:
+        bump_project_version(project.id)
+    
+    for item, recommendation in saved:
+        created_items.append({
+            'item_id': item.id,
+            'title': item.title,
+            'link': item.link,
+            'is_fixed': item.is_fixed,
+            'origin_data_created_at': item.origin_data_created_at,
+            'origin_data_updated_at': item.origin_data_updated_at
+        })
+        if recommendation is not None:
+            created_recommendations.append({
+                'recommendation_id': recommendation.id,
+                'item_id': item.id,
+                'is_active': recommendation.is_active
+            })
+    
+    return created_items, created_recommendations, errors
 
 
 @extend_schema_view(
-    list=extend_schema(description="프로젝트 목록을 조회합니다.", tags=["프로젝트 관리"]),
+    list=extend_schema(description="프로젝트 목록을 조회합니다.", parameters=SPARSE_FIELDS_PARAMETERS, tags=["프로젝트 관리"]),
     create=extend_schema(description="새로운 프로젝트를 생성합니다.", tags=["프로젝트 관리"]),
-    retrieve=extend_schema(description="특정 프로젝트의 상세 정보를 조회합니다.", tags=["프로젝트 관리"]),
+    retrieve=extend_schema(
+        description="특정 프로젝트의 상세 정보를 조회합니다. 자료/아이템/요약/추천은 최신순으로 "
+                    "PROJECT_DETAIL_NESTED_LIMIT개까지만 포함되며, 전체 개수(*_count)와 "
+                    "전체 목록 엔드포인트(*_url)를 함께 반환합니다.",
+        parameters=SPARSE_FIELDS_PARAMETERS,
+        tags=["프로젝트 관리"]
+    ),
     update=extend_schema(description="프로젝트 정보를 수정합니다.", tags=["프로젝트 관리"]),
     destroy=extend_schema(description="프로젝트를 삭제합니다.", tags=["프로젝트 관리"]),
 )
 @method_decorator(csrf_exempt, name='dispatch')
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(ResponseCacheMixin, ConditionalGetMixin, SparseFieldsViewMixin, viewsets.ModelViewSet):
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
     
+    def get_queryset(self):
+        queryset = Project.objects.all()
+        if self.action == 'retrieve':
+            queryset = project_detail_queryset(queryset, self.get_serializer().fields)
+        return queryset
+    
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return ProjectDetailSerializer
         return ProjectSerializer
     
+    def get_object_validator(self):
+        try:
+            return project_detail_validator(self.kwargs['pk'])
+        except (TypeError, ValueError):
+            return None
+    
+    def get_cache_project_id(self):
+        return self.kwargs.get('pk')
+    
+    def perform_update(self, serializer):
+        previous_keyword = serializer.instance.project_keyword
+        previous_code = serializer.instance.project_code
+        project = serializer.save()
+        
+        # 매칭 기준이 바뀌면 이전 워터마크는 의미가 없으므로 초기화
+        # (update()는 auto_now를 갱신하지 않으므로 조건부 GET 검증 값을 위해 updated_at도 바꿉니다.)
+        if project.project_keyword != previous_keyword:
+            project.materials.update(keyword_watermark=None, updated_at=timezone.now())
+        if project.project_code != previous_code:
+            project.materials.update(code_watermark=None, updated_at=timezone.now())
+        bump_project_version(project.id)
+    
     @extend_schema(
         description="프로젝트의 모든 자료를 반환합니다.",
+        parameters=SPARSE_FIELDS_PARAMETERS,
         responses={200: ProjectMaterialSerializer(many=True)},
         tags=["프로젝트 관리"]
     )
     @action(detail=True, methods=['get'])
+    @cached_action
     def materials(self, request, pk=None):
         """프로젝트의 모든 자료를 반환"""
         project = self.get_object()
-        materials = project.materials.all()
-        serializer = ProjectMaterialSerializer(materials, many=True)
-        return Response(serializer.data)
+        return Response(self.sparse_list_data(ProjectMaterialSerializer, project.materials.all()))
     
     @extend_schema(
         description="프로젝트의 모든 아이템을 반환합니다.",
+        parameters=SPARSE_FIELDS_PARAMETERS,
         responses={200: ItemSerializer(many=True)},
         tags=["프로젝트 관리"]
     )
     @action(detail=True, methods=['get'])
+    @cached_action
     def items(self, request, pk=None):
         """프로젝트의 모든 아이템을 반환"""
         project = self.get_object()
-        items = project.items.all()
-        serializer = ItemSerializer(items, many=True)
-        return Response(serializer.data)
+        return Response(self.sparse_list_data(ItemSerializer, project.items.all()))
     
     @extend_schema(
         description="프로젝트의 모든 요약을 반환합니다.",
+        parameters=[RENDERED_HTML_PARAMETER, *SPARSE_FIELDS_PARAMETERS],
         responses={200: SummarySerializer(many=True)},
         tags=["프로젝트 관리"]
     )
     @action(detail=True, methods=['get'])
+    @cached_action
     def summaries(self, request, pk=None):
         """프로젝트의 모든 요약을 반환"""
         project = self.get_object()
-        summaries = project.summaries.all()
-        serializer = SummarySerializer(summaries, many=True)
-        return Response(serializer.data)
+        return Response(self.sparse_list_data(SummarySerializer, project.summaries.all()))
 
     @extend_schema(
         description="프로젝트의 최신 요약을 반환합니다.",
+        parameters=[RENDERED_HTML_PARAMETER, *SPARSE_FIELDS_PARAMETERS],
         responses={200: SummarySerializer(many=True)},
         tags=["프로젝트 관리"]
     )
     @action(detail=True, methods=['get'], url_path='latest-summary')
+    @cached_action
     def latest_summary(self, request, pk=None):
         """프로젝트의 최신 요약을 반환"""
         project = self.get_object()
-        latest_summary = project.summaries.order_by('-created_at').first()
+        context = self.get_serializer_context()
+        summaries = self.sparse_queryset(project.summaries.order_by('-created_at'), SummarySerializer(context=context))
+        latest_summary = summaries.first()
         
         if latest_summary:
-            serializer = SummarySerializer([latest_summary], many=True)
+            serializer = SummarySerializer([latest_summary], many=True, context=context)
             return Response(serializer.data)
         else:
             return Response([], status=status.HTTP_200_OK)
     
     @extend_schema(
         description="프로젝트 키워드와 매칭되는 외부 데이터를 찾습니다.",
+        parameters=[
+            OpenApiParameter(name='incremental', type=bool, description='마지막 아이템 생성 이후 갱신된 외부 데이터만 확인'),
+            OpenApiParameter(name='full', type=bool, description='워터마크를 무시하고 전체를 다시 확인'),
+        ],
         responses={200: None},  # 동적 응답 스키마
         tags=["외부 데이터 매칭"]
     )
@@ -197,18 +555,27 @@ class ProjectViewSet(viewsets.ModelViewSet):
     def external_matches_by_keyword(self, request, pk=None):
         """프로젝트와 매칭되는 외부 데이터를 찾습니다."""
         project = self.get_object()
-        matching_data = find_matching_external_data(project)
+        incremental = query_flag(request, 'incremental') and not query_flag(request, 'full')
+        try:
+            matching_data = find_matching_external_data(project, incremental=incremental)
+        except ExternalDataError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
         
         return Response({
             'project_id': project.id,
             'project_name': project.project_name,
             'project_keyword': project.project_keyword,
+            'incremental': incremental,
             'matches_count': len(matching_data),
             'matches': matching_data
         })
     
     @extend_schema(
-        description="키워드 기반 외부 데이터 매칭 결과를 기반으로 items와 recommendations 테이블에 새로운 행들을 생성합니다.",
+        description="키워드 기반 외부 데이터 매칭 결과를 기반으로 items와 recommendations 테이블에 새로운 행들을 생성합니다. "
+                    "기본적으로 마지막 실행 이후 갱신된 외부 데이터만 확인합니다.",
+        parameters=[
+            OpenApiParameter(name='full', type=bool, description='워터마크를 무시하고 전체를 다시 확인'),
+        ],
         responses={200: None},  # 동적 응답 스키마
         tags=["외부 데이터 매칭"]
     )
@@ -216,76 +583,25 @@ class ProjectViewSet(viewsets.ModelViewSet):
     def create_items_from_external_matches_by_keyword(self, request, pk=None):
         """키워드 기반 외부 데이터 매칭 결과를 기반으로 items와 recommendations 테이블에 새로운 행들을 생성합니다."""
         project = self.get_object()
-        matching_data = find_matching_external_data(project)
-        
-        created_items = []
-        created_recommendations = []
-        errors = []
+        incremental = not query_flag(request, 'full')
+        seen = {}
+        try:
+            matching_data = find_matching_external_data(project, incremental=incremental, seen=seen)
+        except ExternalDataError as e:
+            # 일부만 읽은 결과로 아이템을 만들거나 워터마크를 옮기지 않습니다.
+            return Response({"detail": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
         
-        for match in matching_data:
-            try:
-                external_data = match['external_data']
-                
-                # 기존에 동일한 링크를 가진 아이템이 있는지 확인
-                existing_item = Item.objects.filter(
-                    project=project,
-                    project_material_id=match['project_material_id'],
-                    link=external_data['link']
-                ).first()
-                
-                if existing_item:
-                    errors.append({
-                        'error': 'Item already exists',
-                        'link': external_data['link'],
-                        'item_id': existing_item.id
-                    })
-                    continue
-                
-                # 새로운 아이템 생성
-                item = Item.objects.create(
-                    project=project,
-                    project_material_id=match['project_material_id'],
-                    title=external_data['title'],
-                    body=external_data['body'],
-                    link=external_data['link'],
-                    is_fixed=False,  # 키워드 기반은 항상 False
-                    origin_data_created_at=external_data['created_at'],
-                    origin_data_updated_at=external_data['updated_at']
-                )
-                
-                # 새로운 추천 생성
-                recommendation = Recommendation.objects.create(
-                    project=project,
-                    item=item,
-                    project_material_id=match['project_material_id'],
-                    is_active=True
-                )
-                
-                created_items.append({
-                    'item_id': item.id,
-                    'title': item.title,
-                    'link': item.link,
-                    'is_fixed': item.is_fixed,
-                    'origin_data_created_at': item.origin_data_created_at,
-                    'origin_data_updated_at': item.origin_data_updated_at
-                })
-                
-                created_recommendations.append({
-                    'recommendation_id': recommendation.id,
-                    'item_id': item.id,
-                    'is_active': recommendation.is_active
-                })
-                
-            except Exception as e:
-                errors.append({
-                    'error': str(e),
-                    'external_data': external_data
-                })
+        # 키워드 기반은 항상 is_fixed=False, 추천도 함께 생성
+        created_items, created_recommendations, errors = create_items_from_matches(
+            project, matching_data, is_fixed=False, create_recommendations=True
+        )
+        advance_watermarks(seen, 'keyword_watermark', errors)
         
         return Response({
             'project_id': project.id,
             'project_name': project.project_name,
             'project_keyword': project.project_keyword,
+            'incremental': incremental,
             'total_matches': len(matching_data),
             'created_items_count': len(created_items),
             'created_items': created_items,
@@ -297,6 +613,10 @@ class ProjectViewSet(viewsets.ModelViewSet):
     
     @extend_schema(
         description="프로젝트 코드와 매칭되는 외부 데이터를 찾습니다.",
+        parameters=[
+            OpenApiParameter(name='incremental', type=bool, description='마지막 아이템 생성 이후 갱신된 외부 데이터만 확인'),
+            OpenApiParameter(name='full', type=bool, description='워터마크를 무시하고 전체를 다시 확인'),
+        ],
         responses={200: None},  # 동적 응답 스키마
         tags=["외부 데이터 매칭"]
     )
@@ -304,18 +624,27 @@ class ProjectViewSet(viewsets.ModelViewSet):
     def external_matches_by_code(self, request, pk=None):
         """프로젝트 코드와 매칭되는 외부 데이터를 찾습니다."""
         project = self.get_object()
-        matching_data = find_matching_external_data_by_code(project)
+        incremental = query_flag(request, 'incremental') and not query_flag(request, 'full')
+        try:
+            matching_data = find_matching_external_data_by_code(project, incremental=incremental)
+        except ExternalDataError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
         
         return Response({
             'project_id': project.id,
             'project_name': project.project_name,
             'project_code': project.project_code,
+            'incremental': incremental,
             'matches_count': len(matching_data),
             'matches': matching_data
         })
     
     @extend_schema(
-        description="외부 데이터 매칭 결과를 기반으로 items 테이블에 새로운 행들을 생성합니다.",
+        description="외부 데이터 매칭 결과를 기반으로 items 테이블에 새로운 행들을 생성합니다. "
+                    "기본적으로 마지막 실행 이후 갱신된 외부 데이터만 확인합니다.",
+        parameters=[
+            OpenApiParameter(name='full', type=bool, description='워터마크를 무시하고 전체를 다시 확인'),
+        ],
         responses={200: None},  # 동적 응답 스키마
         tags=["외부 데이터 매칭"]
     )
@@ -323,61 +652,25 @@ class ProjectViewSet(viewsets.ModelViewSet):
     def create_items_from_external_matches_by_code(self, request, pk=None):
         """외부 데이터 매칭 결과를 기반으로 items 테이블에 새로운 행들을 생성합니다."""
         project = self.get_object()
-        matching_data = find_matching_external_data_by_code(project)
-        
-        created_items = []
-        errors = []
+        incremental = not query_flag(request, 'full')
+        seen = {}
+        try:
+            matching_data = find_matching_external_data_by_code(project, incremental=incremental, seen=seen)
+        except ExternalDataError as e:
+            # 일부만 읽은 결과로 아이템을 만들거나 워터마크를 옮기지 않습니다.
+            return Response({"detail": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
         
-        for match in matching_data:
-            try:
-                external_data = match['external_data']
-                
-                # 기존에 동일한 링크를 가진 아이템이 있는지 확인
-                existing_item = Item.objects.filter(
-                    project=project,
-                    project_material_id=match['project_material_id'],
-                    link=external_data['link']
-                ).first()
-                
-                if existing_item:
-                    errors.append({
-                        'error': 'Item already exists',
-                        'link': external_data['link'],
-                        'item_id': existing_item.id
-                    })
-                    continue
-                
-                # 새로운 아이템 생성
-                item = Item.objects.create(
-                    project=project,
-                    project_material_id=match['project_material_id'],
-                    title=external_data['title'],
-                    body=external_data['body'],
-                    link=external_data['link'],
-                    is_fixed=True,  # 항상 True로 설정
-                    origin_data_created_at=external_data['created_at'],
-                    origin_data_updated_at=external_data['updated_at']
-                )
-                
-                created_items.append({
-                    'item_id': item.id,
-                    'title': item.title,
-                    'link': item.link,
-                    'is_fixed': item.is_fixed,
-                    'origin_data_created_at': item.origin_data_created_at,
-                    'origin_data_updated_at': item.origin_data_updated_at
-                })
-                
-            except Exception as e:
-                errors.append({
-                    'error': str(e),
-                    'external_data': external_data
-                })
+        # 코드 기반은 항상 is_fixed=True
+        created_items, _, errors = create_items_from_matches(
+            project, matching_data, is_fixed=True
+        )
+        advance_watermarks(seen, 'code_watermark', errors)
         
         return Response({
             'project_id': project.id,
             'project_name': project.project_name,
             'project_code': project.project_code,
+            'incremental': incremental,
             'total_matches': len(matching_data),
             'created_items_count': len(created_items),
             'created_items': created_items,
@@ -386,8 +679,19 @@ class ProjectViewSet(viewsets.ModelViewSet):
         })
     
     @extend_schema(
-        description="프로젝트 아이템들의 본문을 종합하여 AIRequest를 생성하고 요약본을 Summary 테이블에 저장합니다.",
-        responses={201: SummarySerializer},
+        description="프로젝트 아이템들의 본문을 종합하여 AIRequest를 생성하고 요약본을 Summary 테이블에 저장합니다. "
+                    "async=true이면 요약 작업을 큐에 넣고 바로 202와 작업 ID를 반환합니다. "
+                    "아이템이 많으면 청크별 부분 요약을 합치는 맵리듀스로 요약하며, 바뀐 청크만 다시 요약합니다. "
+                    "같은 프로젝트/입력으로 동시에 들어온 요청은 하나의 LLM 호출을 공유하고(coalesced=true), "
+                    "LLM 호출 한도를 넘으면 429(빈도) 또는 503(동시 호출/대기열)을 반환합니다.",
+        parameters=[
+            OpenApiParameter(name='async', type=bool, description='요약 작업을 비동기로 처리 (상태는 /api/summary-jobs/{id}/에서 확인)'),
+            OpenApiParameter(
+                name='mode', type=str, enum=list(SUMMARY_MODES),
+                description='요약 방식 (auto: 입력 크기에 따라 선택, single: 한 번에 요약, map_reduce: 청크 단위 요약 후 통합)'
+            ),
+        ],
+        responses={201: SummarySerializer, 202: SummaryJobSerializer},
         tags=["AI 관리"]
     )
     @action(detail=True, methods=['post'], url_path='summarize-items')
@@ -397,102 +701,106 @@ class ProjectViewSet(viewsets.ModelViewSet):
         결과를 Summary 테이블에도 저장합니다.
         """
         project = self.get_object()
-        
-        # is_active=True, is_fixed=True인 아이템만 필터링합니다.
-        items = project.items.filter(is_active=True, is_fixed=True)
-        
-        if not items:
+        mode = request.query_params.get('mode', 'auto')
+        if mode not in SUMMARY_MODES:
             return Response(
-                {"detail": "활성화되고 고정된 아이템이 없습니다."},
-                status=status.HTTP_404_NOT_FOUND
+                {"detail": f"mode는 {', '.join(SUMMARY_MODES)} 중 하나여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
             )
-
-        # title(없는 경우도 있음)과 body를 합쳐서 사용합니다.
-        input_texts = []
-        for item in items:
-            text_to_combine = item.body
-            if item.title:
-                text_to_combine = f"제목: {item.title}\n내용: {text_to_combine}"
-            input_texts.append(text_to_combine)
         
-        input_text = "\n\n".join(input_texts)
+        if query_flag(request, 'async'):
+            # 요청 스레드에서 LLM을 호출하지 않고 작업만 등록합니다. (process_summary_jobs 명령이 처리)
+            job = SummaryJob.objects.create(project=project, mode=mode)
+            response_data = SummaryJobSerializer(job).data
+            response_data['status_url'] = request.build_absolute_uri(
+                reverse('summaryjob-detail', args=[job.id])
+            )
+            return Response(response_data, status=status.HTTP_202_ACCEPTED)
         
-        # 1. 제미나이 API 모델 설정
-        model = genai.GenerativeModel('gemini-1.5-flash')
-
         try:
-            # 2. 제미나이 API 호출 및 결과 생성
-            response = model.generate_content(
-                f"하나의 프로젝트에 대한 다음의 자료를 보기 좋게 요약해줘\n\n자료: {input_text}"
-            )
-            output_text = response.text
-
-        except Exception as e:
-            return Response(
-                {"detail": f"Gemini API 호출 실패: {str(e)}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-
-        # 3. AIRequest 객체를 생성하고 저장합니다.
-        ai_request = AIRequest.objects.create(
-            input=input_text,
-            output=output_text,
-            description=f"'{project.project_name}' 프로젝트 아이템 요약 요청"
-        )
-
-        # 4. AIRequest의 output을 정제하여 Summary 테이블에 저장합니다.
-        # 이 예제에서는 AIRequest의 output을 그대로 Summary의 content로 사용합니다.
-        summary = Summary.objects.create(
-            project=project,
-            ai_request=ai_request,
-            content=output_text
-        )
+            summary, info = summarize_project_items(project, mode)
+        except SummarizationError as e:
+            return Response({"detail": e.detail}, status=e.status_code)
 
         # 5. 생성된 summary 객체를 직렬화하여 응답으로 반환합니다.
-        serializer = SummarySerializer(summary)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        # (cache_hit: LLM 응답 캐시 사용 여부, mode/chunks_count/reused_chunks_count/reduce_levels: 맵리듀스 실행 정보)
+        serializer = SummarySerializer(summary, context=self.get_serializer_context())
+        response_data = serializer.data
+        response_data.update(info)
+        return Response(response_data, status=status.HTTP_201_CREATED)
 
 
 @extend_schema_view(
-    list=extend_schema(description="프로젝트 자료 목록을 조회합니다.", tags=["자료 관리"]),
+    list=extend_schema(
+        description="프로젝트 자료 목록을 조회합니다.",
+        parameters=[
+            OpenApiParameter(name='project_id', type=int, description='프로젝트 ID로 필터링'),
+            *SPARSE_FIELDS_PARAMETERS,
+        ],
+        tags=["자료 관리"]
+    ),
     create=extend_schema(description="새로운 프로젝트 자료를 생성합니다.", tags=["자료 관리"]),
-    retrieve=extend_schema(description="특정 프로젝트 자료의 상세 정보를 조회합니다.", tags=["자료 관리"]),
+    retrieve=extend_schema(description="특정 프로젝트 자료의 상세 정보를 조회합니다.", parameters=SPARSE_FIELDS_PARAMETERS, tags=["자료 관리"]),
     update=extend_schema(description="프로젝트 자료 정보를 수정합니다.", tags=["자료 관리"]),
     destroy=extend_schema(description="프로젝트 자료를 삭제합니다.", tags=["자료 관리"]),
 )
 @method_decorator(csrf_exempt, name='dispatch')
-class ProjectMaterialViewSet(viewsets.ModelViewSet):
+class ProjectMaterialViewSet(ResponseCacheMixin, SparseFieldsViewMixin, viewsets.ModelViewSet):
     queryset = ProjectMaterial.objects.all()
     serializer_class = ProjectMaterialSerializer
     
+    def get_queryset(self):
+        queryset = ProjectMaterial.objects.all()
+        project_id = self.request.query_params.get('project_id', None)
+        if project_id is not None:
+            queryset = queryset.filter(project_id=project_id)
+        if self.action == 'retrieve':
+            # 상세 응답에 포함되는 프로젝트, 아이템/추천과 그 관계를 함께 가져옵니다.
+            queryset = queryset.select_related('project').prefetch_related(
+                Prefetch('items', queryset=Item.objects.select_related(*ITEM_RELATIONS)),
+                Prefetch('recommendations', queryset=Recommendation.objects.select_related(*RECOMMENDATION_RELATIONS)),
+            )
+        return queryset
+    
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return ProjectMaterialDetailSerializer
         return ProjectMaterialSerializer
     
+    def perform_update(self, serializer):
+        previous = (serializer.instance.material_type, serializer.instance.material_link)
+        material = serializer.save()
+        
+        # 자료가 가리키는 대상이 바뀌면 워터마크 초기화
+        if (material.material_type, material.material_link) != previous:
+            ProjectMaterial.objects.filter(id=material.id).update(
+                keyword_watermark=None, code_watermark=None, updated_at=timezone.now()
+            )
+            bump_project_version(material.project_id)
+    
     @extend_schema(
         description="자료의 모든 아이템을 반환합니다.",
+        parameters=SPARSE_FIELDS_PARAMETERS,
         responses={200: ItemSerializer(many=True)},
         tags=["자료 관리"]
     )
     @action(detail=True, methods=['get'])
+    @cached_action
     def items(self, request, pk=None):
         """자료의 모든 아이템을 반환"""
         material = self.get_object()
-        items = material.items.all()
-        serializer = ItemSerializer(items, many=True)
-        return Response(serializer.data)
+        return Response(self.sparse_list_data(ItemSerializer, material.items.all()))
 
 
 @extend_schema_view(
-    list=extend_schema(description="AI 요청 목록을 조회합니다.", tags=["AI 관리"]),
+    list=extend_schema(description="AI 요청 목록을 조회합니다.", parameters=SPARSE_FIELDS_PARAMETERS, tags=["AI 관리"]),
     create=extend_schema(description="새로운 AI 요청을 생성합니다.", tags=["AI 관리"]),
-    retrieve=extend_schema(description="특정 AI 요청의 상세 정보를 조회합니다.", tags=["AI 관리"]),
+    retrieve=extend_schema(description="특정 AI 요청의 상세 정보를 조회합니다.", parameters=SPARSE_FIELDS_PARAMETERS, tags=["AI 관리"]),
     update=extend_schema(description="AI 요청 정보를 수정합니다.", tags=["AI 관리"]),
     destroy=extend_schema(description="AI 요청을 삭제합니다.", tags=["AI 관리"]),
 )
 @method_decorator(csrf_exempt, name='dispatch')
-class AIRequestViewSet(viewsets.ModelViewSet):
+class AIRequestViewSet(SparseFieldsViewMixin, viewsets.ModelViewSet):
     queryset = AIRequest.objects.all()
     serializer_class = AIRequestSerializer
 
@@ -501,19 +809,26 @@ class AIRequestViewSet(viewsets.ModelViewSet):
     list=extend_schema(
         description="요약 목록을 조회합니다.",
         parameters=[
-            OpenApiParameter(name='project_id', type=int, description='프로젝트 ID로 필터링')
+            OpenApiParameter(name='project_id', type=int, description='프로젝트 ID로 필터링'),
+            RENDERED_HTML_PARAMETER,
+            *SPARSE_FIELDS_PARAMETERS,
         ],
         tags=["콘텐츠 관리"]
     ),
     create=extend_schema(description="새로운 요약을 생성합니다.", tags=["콘텐츠 관리"]),
-    retrieve=extend_schema(description="특정 요약의 상세 정보를 조회합니다.", tags=["콘텐츠 관리"]),
+    retrieve=extend_schema(
+        description="특정 요약의 상세 정보를 조회합니다.",
+        parameters=[RENDERED_HTML_PARAMETER, *SPARSE_FIELDS_PARAMETERS],
+        tags=["콘텐츠 관리"]
+    ),
     update=extend_schema(description="요약 정보를 수정합니다.", tags=["콘텐츠 관리"]),
     destroy=extend_schema(description="요약을 삭제합니다.", tags=["콘텐츠 관리"]),
 )
 @method_decorator(csrf_exempt, name='dispatch')
-class SummaryViewSet(viewsets.ModelViewSet):
+class SummaryViewSet(ResponseCacheMixin, SparseFieldsViewMixin, viewsets.ModelViewSet):
     queryset = Summary.objects.all()
     serializer_class = SummarySerializer
+    pagination_class = PageOrCursorPagination
     
     def get_queryset(self):
         queryset = Summary.objects.all()
@@ -523,25 +838,59 @@ class SummaryViewSet(viewsets.ModelViewSet):
         return queryset
 
 
+@extend_schema_view(
+    list=extend_schema(
+        description="요약 작업 목록을 조회합니다.",
+        parameters=[
+            OpenApiParameter(name='project_id', type=int, description='프로젝트 ID로 필터링'),
+            OpenApiParameter(name='status', type=str, description='작업 상태로 필터링 (pending, running, succeeded, failed)'),
+            *SPARSE_FIELDS_PARAMETERS,
+        ],
+        tags=["AI 관리"]
+    ),
+    retrieve=extend_schema(description="요약 작업의 상태와 완료된 요약을 조회합니다.", parameters=SPARSE_FIELDS_PARAMETERS, tags=["AI 관리"]),
+)
+class SummaryJobViewSet(SparseFieldsViewMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = SummaryJob.objects.all()
+    serializer_class = SummaryJobSerializer
+    
+    def get_queryset(self):
+        # 요약 내용(블롭)까지 한 번에 가져오도록 summary는 Prefetch로 불러옵니다.
+        queryset = SummaryJob.objects.prefetch_related(
+            Prefetch('summary', queryset=Summary.objects.with_blobs().select_related('project'))
+        )
+        project_id = self.request.query_params.get('project_id', None)
+        job_status = self.request.query_params.get('status', None)
+        
+        if project_id is not None:
+            queryset = queryset.filter(project_id=project_id)
+        if job_status is not None:
+            queryset = queryset.filter(status=job_status)
+        
+        return queryset
+
+
 @extend_schema_view(
     list=extend_schema(
         description="아이템 목록을 조회합니다.",
         parameters=[
             OpenApiParameter(name='project_id', type=int, description='프로젝트 ID로 필터링'),
             OpenApiParameter(name='material_id', type=int, description='자료 ID로 필터링'),
-            OpenApiParameter(name='is_fixed', type=bool, description='고정 상태로 필터링')
+            OpenApiParameter(name='is_fixed', type=bool, description='고정 상태로 필터링'),
+            *SPARSE_FIELDS_PARAMETERS,
         ],
         tags=["콘텐츠 관리"]
     ),
     create=extend_schema(description="새로운 아이템을 생성합니다.", tags=["콘텐츠 관리"]),
-    retrieve=extend_schema(description="특정 아이템의 상세 정보를 조회합니다.", tags=["콘텐츠 관리"]),
+    retrieve=extend_schema(description="특정 아이템의 상세 정보를 조회합니다.", parameters=SPARSE_FIELDS_PARAMETERS, tags=["콘텐츠 관리"]),
     update=extend_schema(description="아이템 정보를 수정합니다.", tags=["콘텐츠 관리"]),
     destroy=extend_schema(description="아이템을 삭제합니다.", tags=["콘텐츠 관리"]),
 )
 @method_decorator(csrf_exempt, name='dispatch')
-class ItemViewSet(viewsets.ModelViewSet):
+class ItemViewSet(ResponseCacheMixin, ConditionalGetMixin, SparseFieldsViewMixin, viewsets.ModelViewSet):
     queryset = Item.objects.all()
     serializer_class = ItemSerializer
+    pagination_class = PageOrCursorPagination
     
     def get_queryset(self):
         queryset = Item.objects.all()
@@ -644,19 +993,21 @@ class ItemViewSet(viewsets.ModelViewSet):
         description="추천 목록을 조회합니다.",
         parameters=[
             OpenApiParameter(name='project_id', type=int, description='프로젝트 ID로 필터링'),
-            OpenApiParameter(name='is_active', type=bool, description='활성 상태로 필터링')
+            OpenApiParameter(name='is_active', type=bool, description='활성 상태로 필터링'),
+            *SPARSE_FIELDS_PARAMETERS,
         ],
         tags=["추천 관리"]
     ),
     create=extend_schema(description="새로운 추천을 생성합니다.", tags=["추천 관리"]),
-    retrieve=extend_schema(description="특정 추천의 상세 정보를 조회합니다.", tags=["추천 관리"]),
+    retrieve=extend_schema(description="특정 추천의 상세 정보를 조회합니다.", parameters=SPARSE_FIELDS_PARAMETERS, tags=["추천 관리"]),
     update=extend_schema(description="추천 정보를 수정합니다.", tags=["추천 관리"]),
     destroy=extend_schema(description="추천을 삭제합니다.", tags=["추천 관리"]),
 )
 @method_decorator(csrf_exempt, name='dispatch')
-class RecommendationViewSet(viewsets.ModelViewSet):
+class RecommendationViewSet(ResponseCacheMixin, ConditionalGetMixin, SparseFieldsViewMixin, viewsets.ModelViewSet):
     queryset = Recommendation.objects.all()
     serializer_class = RecommendationSerializer
+    pagination_class = PageOrCursorPagination
     
     def get_queryset(self):
         queryset = Recommendation.objects.all()
@@ -707,7 +1058,8 @@ class RecommendationViewSet(viewsets.ModelViewSet):
     @extend_schema(
         description="특정 아이템에 대한 추천을 찾습니다.",
         parameters=[
-            OpenApiParameter(name='item_id', type=int, description='아이템 ID', required=True)
+            OpenApiParameter(name='item_id', type=int, description='아이템 ID', required=True),
+            *SPARSE_FIELDS_PARAMETERS,
         ],
         responses={200: RecommendationSerializer(many=True)},
         tags=["추천 관리"]
@@ -730,15 +1082,17 @@ class RecommendationViewSet(viewsets.ModelViewSet):
             }, status=400)
         
         # 해당 아이템에 대한 모든 추천 찾기 (활성/비활성 모두)
-        recommendations = Recommendation.objects.filter(item_id=item_id)
+        recommendations = list(self.sparse_queryset(
+            Recommendation.objects.filter(item_id=item_id), self.get_serializer()
+        ))
         
-        if recommendations.exists():
+        if recommendations:
             serializer = self.get_serializer(recommendations, many=True)
             return Response({
                 'item_id': item_id,
-                'recommendations_count': recommendations.count(),
+                'recommendations_count': len(recommendations),
                 'recommendations': serializer.data,
-                'message': f"아이템 ID {item_id}에 대한 추천 {recommendations.count()}개를 찾았습니다."
+                'message': f"아이템 ID {item_id}에 대한 추천 {len(recommendations)}개를 찾았습니다."
             })
         else:
             return Response({
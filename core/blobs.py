@@ -0,0 +1,266 @@
+"""
+큰 텍스트 필드용 압축/중복 제거 저장소.
+
+BlobTextField 값은 text_blobs 테이블(TextBlob)에 내용 해시(sha256) 단위로 한 번만 압축 저장되고,
+모델 테이블의 열에는 해시만 남습니다. 같은 텍스트(예: AIRequest.output과 Summary.content)는 블롭 하나를 공유합니다.
+
+모델 속성으로 접근하면 자동으로 압축을 풀어 문자열을 돌려주므로 기존 코드는 그대로 동작합니다.
+목록을 읽을 때는 BlobQuerySet.with_blobs()로 압축 데이터를 같은 쿼리에서 함께 가져와 행마다 추가 쿼리가 나가지 않게 합니다.
+BlobTextField를 가진 모델은 BlobModel을 상속해 블롭과 행을 한 트랜잭션에서 저장합니다. (행 저장이 실패하면 블롭도 남지 않음)
+
+저장 형식: 첫 바이트가 코덱 (b'r' 원문, b'z' zlib, b's' zstd), 나머지가 UTF-8 텍스트를 압축한 데이터.
+"""
+import hashlib
+import zlib
+
+from django.apps import apps
+from django.conf import settings
+from django.db import models, router, transaction
+from django.db.models import OuterRef, Subquery
+from django.db.models.query_utils import DeferredAttribute
+
+RAW_CODEC = b'r'
+ZLIB_CODEC = b'z'
+ZSTD_CODEC = b's'
+# 이보다 짧은 텍스트는 압축해도 이득이 없어 원문으로 저장합니다.
+MIN_COMPRESS_SIZE = 64
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def compress_text(text, codec=None):
+    """텍스트를 저장 형식(코덱 바이트 + 데이터)으로 압축합니다. codec 기본값은 settings.BLOB_STORAGE_CODEC."""
+    raw = text.encode('utf-8')
+    codec = codec or settings.BLOB_STORAGE_CODEC
+    if len(raw) < MIN_COMPRESS_SIZE:
+        return RAW_CODEC + raw
+    if codec == 'zstd':
+        zstandard = _zstd()
+        if zstandard is not None:
+            return ZSTD_CODEC + zstandard.ZstdCompressor(level=10).compress(raw)
+    data = zlib.compress(raw, 9)
+    # 압축이 오히려 커지는 경우(이미 압축된 데이터 등)는 원문으로 저장합니다.
+    if len(data) >= len(raw):
+        return RAW_CODEC + raw
+    return ZLIB_CODEC + data
+
+
+def decompress_text(data):
+    data = bytes(data)
+    codec, payload = data[:1], data[1:]
+    if codec == RAW_CODEC:
+        raw = payload
+    elif codec == ZLIB_CODEC:
+        raw = zlib.decompress(payload)
+    elif codec == ZSTD_CODEC:
+        zstandard = _zstd()
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축된 텍스트를 읽으려면 zstandard 패키지가 필요합니다.")
+        raw = zstandard.ZstdDecompressor().decompress(payload)
+    else:
+        raise ValueError(f"알 수 없는 블롭 코덱: {codec!r}")
+    return raw.decode('utf-8')
+
+
+class BlobRef:
+    """DB에서 읽었지만 아직 압축을 풀지 않은 블롭 참조"""
+    __slots__ = ('sha256',)
+
+    def __init__(self, sha256):
+        self.sha256 = sha256
+
+    def load(self):
+        from .models import TextBlob
+        return decompress_text(TextBlob.objects.values_list('data', flat=True).get(sha256=self.sha256))
+
+    def __str__(self):
+        return self.load()
+
+    def __eq__(self, other):
+        return isinstance(other, BlobRef) and other.sha256 == self.sha256
+
+    def __hash__(self):
+        return hash(self.sha256)
+
+    def __repr__(self):
+        return f"<BlobRef {self.sha256[:12]}>"
+
+
+def store_text(text):
+    """텍스트를 블롭으로 저장(이미 있으면 재사용)하고 BlobRef를 반환합니다."""
+    from .models import TextBlob
+    sha256 = text_hash(text)
+    TextBlob.objects.get_or_create(
+        sha256=sha256,
+        defaults={
+            'data': lambda: compress_text(text),
+            'size': lambda: len(text.encode('utf-8')),
+        }
+    )
+    return BlobRef(sha256)
+
+
+def _data_attname(attname):
+    return f"_{attname}_blob_data"
+
+
+def _cache_attname(attname):
+    return f"_{attname}_blob_cache"
+
+
+class BlobTextDescriptor(DeferredAttribute):
+    """필드 값을 읽을 때 블롭의 압축을 풀어 문자열로 돌려줍니다. (인스턴스마다 한 번)"""
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if not isinstance(value, BlobRef):
+            return value
+        attname = self.field.attname
+        data = instance.__dict__.pop(_data_attname(attname), None)
+        text = decompress_text(data) if data is not None else value.load()
+        instance.__dict__[attname] = text
+        # 읽기만 하고 저장하는 경우 다시 해시/저장하지 않도록 원래 참조를 기억해 둡니다.
+        instance.__dict__[_cache_attname(attname)] = (value, text)
+        return text
+
+    def __set__(self, instance, value):
+        # __dict__ 값보다 먼저 __get__이 호출되도록 데이터 디스크립터로 둡니다.
+        instance.__dict__[self.field.attname] = value
+
+
+class BlobTextField(models.TextField):
+    """
+    TextBlob에 압축/중복 제거 저장되는 텍스트 필드. 열에는 내용 해시(sha256)를 저장합니다.
+
+    조회는 해시로 비교할 수 있는 exact, in, isnull만 지원하며,
+    부분 문자열 조회(icontains 등)나 변환은 FieldError를 냅니다.
+    values()/values_list()는 BlobRef를 돌려주며, str()로 압축을 풀 수 있습니다.
+    """
+    descriptor_class = BlobTextDescriptor
+    description = "압축/중복 제거 저장 텍스트"
+    supported_lookups = ('exact', 'in', 'isnull')
+
+    def get_lookup(self, lookup_name):
+        if lookup_name not in self.supported_lookups:
+            return None
+        return super().get_lookup(lookup_name)
+
+    def get_transform(self, lookup_name):
+        return None
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return BlobRef(value)
+
+    def to_python(self, value):
+        if isinstance(value, BlobRef):
+            return value.load()
+        return super().to_python(value)
+
+    def pre_save(self, model_instance, add):
+        value = model_instance.__dict__.get(self.attname)
+        if value is None or isinstance(value, BlobRef):
+            return value
+        cached = model_instance.__dict__.get(_cache_attname(self.attname))
+        if cached is not None and cached[1] is value:
+            return cached[0]
+        ref = store_text(value)
+        model_instance.__dict__[_cache_attname(self.attname)] = (ref, value)
+        return ref
+
+    def get_prep_value(self, value):
+        if value is None:
+            return None
+        if isinstance(value, BlobRef):
+            return value.sha256
+        # 조회 값(텍스트)은 해시로 바꿔 비교합니다.
+        return text_hash(str(value))
+
+    def get_db_prep_save(self, value, connection):
+        # QuerySet.update(field=text)처럼 pre_save를 거치지 않는 저장도 블롭을 만듭니다.
+        if value is not None and not isinstance(value, BlobRef) and isinstance(value, str):
+            value = store_text(value)
+        return super().get_db_prep_save(value, connection)
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
+
+
+def blob_hash(instance, field_name):
+    """필드 값의 내용 해시를 반환합니다. DB에서 읽은 값이면 압축을 풀지 않습니다."""
+    attname = instance._meta.get_field(field_name).attname
+    value = instance.__dict__.get(attname)
+    if value is None:
+        return None
+    if isinstance(value, BlobRef):
+        return value.sha256
+    cached = instance.__dict__.get(_cache_attname(attname))
+    if cached is not None and cached[1] is value:
+        return cached[0].sha256
+    return text_hash(value)
+
+
+def blob_fields(model):
+    return [field for field in model._meta.concrete_fields if isinstance(field, BlobTextField)]
+
+
+class BlobModel(models.Model):
+    """BlobTextField를 가진 모델의 기본 클래스. 블롭 저장(pre_save)과 행 저장을 한 트랜잭션으로 묶습니다."""
+
+    def save_base(self, *args, using=None, **kwargs):
+        using = using or router.db_for_write(self.__class__, instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            super().save_base(*args, using=using, **kwargs)
+
+    class Meta:
+        abstract = True
+
+
+class BlobQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        # QuerySet.update(field=text)도 블롭과 행을 한 트랜잭션에서 저장합니다.
+        with transaction.atomic(using=self.db, savepoint=False):
+            return super().update(**kwargs)
+
+    def with_blobs(self, *field_names):
+        """
+        BlobTextField의 압축 데이터를 서브쿼리로 함께 가져옵니다. (목록 조회 시 행마다 나가는 쿼리 방지)
+        field_names가 없으면 모든 BlobTextField를 가져옵니다.
+        """
+        from .models import TextBlob
+        fields = blob_fields(self.model)
+        if field_names:
+            fields = [field for field in fields if field.name in field_names]
+        return self.annotate(**{
+            _data_attname(field.attname): Subquery(
+                TextBlob.objects.filter(sha256=OuterRef(field.attname)).values('data')[:1]
+            )
+            for field in fields
+        })
+
+
+def iter_blob_columns():
+    """BlobTextField를 가진 (모델, 필드) 목록"""
+    for model in apps.get_models():
+        for field in blob_fields(model):
+            yield model, field
+
+
+def referenced_blob_hashes():
+    hashes = set()
+    for model, field in iter_blob_columns():
+        hashes.update(model._base_manager.values_list(field.attname, flat=True).iterator())
+    return {ref.sha256 if isinstance(ref, BlobRef) else ref for ref in hashes if ref}
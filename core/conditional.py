@@ -0,0 +1,83 @@
+"""
+조회 엔드포인트의 조건부 GET (ETag / Last-Modified).
+
+응답 본문을 직렬화하지 않고 쿼리 한 번으로 검증 값(행 수와 최근 updated_at 등)을 계산해
+ETag/Last-Modified를 만들고, If-None-Match/If-Modified-Since가 일치하면 직렬화 전에 304를 반환합니다.
+
+검증 값은 행의 updated_at(auto_now)과 행 수로 계산하므로 save()/생성/삭제는 반영되지만,
+QuerySet.update()는 auto_now를 갱신하지 않으므로 update()하는 곳에서 updated_at도 함께 바꿔야 합니다.
+?expand=로 관계 필드를 출력하면 그 관계 행의 최근 updated_at도 검증 값에 넣습니다.
+"""
+import hashlib
+import json
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+from .sparse_fields import expanded_relations
+
+
+def queryset_validator(queryset, relations=()):
+    """쿼리셋의 행 수와 최근 updated_at (relations의 관계 행의 최근 updated_at 포함)"""
+    aggregates = {f'{relation}_modified': Max(f'{relation}__updated_at') for relation in relations}
+    return queryset.order_by().aggregate(count=Count('pk'), last_modified=Max('updated_at'), **aggregates)
+
+
+class ConditionalGetMixin:
+    """
+    list/retrieve에 ETag/Last-Modified를 붙이고, 바뀌지 않았으면 직렬화 전에 304를 반환하는 뷰셋 믹스인.
+    검증 값은 get_list_validator/get_object_validator로 바꿀 수 있습니다. (None이면 조건부 처리 안 함)
+    """
+
+    def get_list_validator(self, queryset):
+        paginator = self.paginator
+        if paginator is not None and getattr(paginator, 'use_cursor', None) and paginator.use_cursor(self.request):
+            # 커서 페이지네이션은 전체 행을 세지 않는 것이 목적이므로 조건부 처리하지 않습니다.
+            return None
+        return queryset_validator(queryset, self.get_validator_relations())
+
+    def get_validator_relations(self):
+        """응답에 출력하는 확장 관계 (관계 행이 바뀌어도 응답이 바뀜)"""
+        return sorted(expanded_relations(self.get_serializer()))
+
+    def get_object_validator(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            validator = queryset_validator(self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            ), self.get_validator_relations())
+        except (TypeError, ValueError, ValidationError):
+            # 잘못된 ID는 retrieve가 404로 처리합니다.
+            return None
+        return validator if validator['count'] else None
+
+    def list(self, request, *args, **kwargs):
+        validator = self.get_list_validator(self.filter_queryset(self.get_queryset()))
+        return self.conditional_response(validator, super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        validator = self.get_object_validator()
+        return self.conditional_response(validator, super().retrieve, request, *args, **kwargs)
+
+    def conditional_response(self, validator, view, request, *args, **kwargs):
+        if validator is None:
+            return view(request, *args, **kwargs)
+
+        # 같은 데이터라도 표현 형식(JSON/브라우저블 API 등)이 다르면 다른 ETag를 사용합니다.
+        payload = json.dumps([validator, request.accepted_renderer.format], default=str, sort_keys=True)
+        etag = quote_etag(hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32])
+        timestamps = [value for value in validator.values() if isinstance(value, datetime)]
+        last_modified = int(max(timestamps).timestamp()) if timestamps else None
+
+        response = get_conditional_response(request._request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = view(request, *args, **kwargs)
+            if not 200 <= response.status_code < 300:
+                return response
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
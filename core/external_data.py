@@ -0,0 +1,375 @@
+"""
+외부 API 데이터(dummy_data.json) 로더.
+
+워커 프로세스마다 한 번만 파싱하고, 파일의 mtime/size가 바뀐 경우에만 다시 읽습니다.
+새 스냅샷은 완전히 로드된 뒤 참조 하나를 교체하는 방식으로 반영되므로,
+동시에 읽는 요청이 절반만 로드된 목록을 보는 일은 없습니다.
+
+아주 큰 덤프는 iter_external_records()(요청 처리용: stream_external_records())로
+전체를 메모리에 올리지 않고 스트리밍할 수 있습니다.
+JSON 배열과 NDJSON을 지원하며, gzip/zstd 압축 파일은 내용(매직 바이트)으로 판별합니다.
+"""
+import contextlib
+import gzip
+import io
+import json
+import logging
+import os
+import threading
+import time
+from datetime import UTC
+from urllib.parse import urlsplit, urlunsplit
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .keyword_matcher import normalize_text
+
+logger = logging.getLogger(__name__)
+
+
+class ExternalRecord(dict):
+    """
+    외부 레코드 (원본 dict 그대로 직렬화됨).
+
+    매칭에 쓰는 정규화된 제목/본문과 updated_at은 로드할 때 한 번만 계산해 속성으로 보관합니다.
+    """
+    __slots__ = ('body_norm', 'title_norm', 'updated_at_dt')
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.title_norm = normalize_text(self.get('title'))
+        self.body_norm = normalize_text(self.get('body'))
+        self.updated_at_dt = _parse_updated_at(self.get('updated_at'))
+
+
+def _parse_updated_at(value):
+    if not value:
+        return None
+    try:
+        updated_at = parse_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if updated_at is not None and timezone.is_naive(updated_at):
+        updated_at = timezone.make_aware(updated_at, UTC)
+    return updated_at
+
+
+def record_updated_at(record):
+    """외부 레코드의 updated_at을 aware datetime으로 반환합니다. 없거나 잘못된 값이면 None."""
+    if isinstance(record, ExternalRecord):
+        return record.updated_at_dt
+    return _parse_updated_at(record.get('updated_at'))
+
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def open_external_data(path):
+    """압축 여부를 판별해 외부 데이터 파일을 텍스트 스트림으로 엽니다."""
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    if magic.startswith(ZSTD_MAGIC):
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("zstd 압축 파일을 읽으려면 zstandard 패키지가 필요합니다.")
+        with contextlib.ExitStack() as stack:
+            # 압축 해제 스트림을 만들지 못하면 파일을 닫고, 만들었으면 파일은 스트림이 닫습니다.
+            raw = stack.enter_context(open(path, 'rb'))
+            reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+            stack.pop_all()
+        return io.TextIOWrapper(reader, encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def _read_until_content(f, chunk_size):
+    """앞쪽 공백을 건너뛰고 내용이 시작되는 청크를 반환합니다."""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return ''
+        chunk = chunk.lstrip()
+        if chunk:
+            return chunk
+
+
+def _iter_json_array(f, buffer, chunk_size):
+    decoder = json.JSONDecoder()
+    buffer = buffer[1:]  # '[' 제거
+    pos = 0
+    eof = False
+
+    while True:
+        # 요소 사이의 공백과 ',' 건너뛰기
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos < len(buffer) or eof:
+                break
+            chunk = f.read(chunk_size)
+            if chunk:
+                buffer, pos = buffer[pos:] + chunk, 0
+            else:
+                eof = True
+
+        if pos >= len(buffer):
+            raise ValueError("JSON 배열이 ']'로 끝나지 않았습니다.")
+        if buffer[pos] == ']':
+            return
+
+        try:
+            record, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            end = None
+        # 버퍼 끝에서 끝난 값은 다음 청크에 이어질 수 있으므로 더 읽어 봅니다. (예: 숫자)
+        if end is None or (end == len(buffer) and not eof):
+            # 여러 청크에 걸친 레코드는 남은 버퍼가 두 배 이상 커진 뒤에만 다시 해석하므로
+            # 레코드 크기에 대해 선형 시간이 걸립니다.
+            parts = [buffer[pos:]]
+            size = len(parts[0])
+            target = max(2 * size, chunk_size)
+            while size < target:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    eof = True
+                    break
+                parts.append(chunk)
+                size += len(chunk)
+            buffer, pos = ''.join(parts), 0
+            continue
+
+        yield record
+        pos = end
+        if pos > chunk_size:
+            buffer, pos = buffer[pos:], 0
+
+
+def _iter_ndjson(f, buffer, chunk_size):
+    parts = []  # 아직 끝나지 않은 줄의 조각 (새 청크에서만 줄바꿈을 찾습니다)
+    chunk = buffer
+    while chunk:
+        if '\n' not in chunk:
+            parts.append(chunk)
+        else:
+            lines = chunk.split('\n')
+            parts.append(lines[0])
+            lines[0] = ''.join(parts)
+            parts = [lines.pop()]  # 마지막 줄은 아직 끝나지 않았을 수 있습니다.
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+        chunk = f.read(chunk_size)
+    pending = ''.join(parts)
+    if pending.strip():
+        yield json.loads(pending)
+
+
+def iter_external_records(path=None, chunk_size=None):
+    """
+    외부 데이터 레코드를 하나씩 생성합니다.
+
+    메모리 사용량은 파일 크기가 아니라 chunk_size(와 가장 큰 레코드)에 비례합니다.
+    """
+    path = os.fspath(path or settings.EXTERNAL_DATA_PATH)
+    chunk_size = chunk_size or settings.EXTERNAL_DATA_CHUNK_SIZE
+    with open_external_data(path) as f:
+        buffer = _read_until_content(f, chunk_size)
+        if not buffer:
+            return
+        if buffer[0] == '[':
+            records = _iter_json_array(f, buffer, chunk_size)
+        else:
+            records = _iter_ndjson(f, buffer, chunk_size)
+        for record in records:
+            yield ExternalRecord(record)
+
+
+class ExternalDataError(Exception):
+    """외부 데이터를 끝까지 읽지 못함 (파일 없음, 잘린 파일, 형식 오류 등)"""
+
+
+def stream_external_records(path=None, chunk_size=None):
+    """
+    iter_external_records()와 같지만, 파일이 없거나 형식이 잘못된 경우 오류를 기록하고
+    ExternalDataError를 냅니다. 일부만 읽은 결과를 전체로 오인해 워터마크를 옮기지 않도록
+    호출하는 쪽은 이 예외를 받으면 결과를 버려야 합니다.
+    """
+    try:
+        yield from iter_external_records(path, chunk_size)
+    except Exception as e:
+        logger.exception("외부 데이터 스트리밍 실패: %s", path or settings.EXTERNAL_DATA_PATH)
+        raise ExternalDataError(f"외부 데이터 로드 실패: {e}") from e
+
+
+def read_external_records(path):
+    """외부 데이터 전체를 ExternalRecord 리스트로 읽습니다. (프로세스 캐시용)"""
+    with open_external_data(path) as f:
+        text = f.read()
+    if text.lstrip().startswith('['):
+        records = json.loads(text)
+    else:
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    return [ExternalRecord(record) for record in records]
+
+
+def canonicalize_link(link):
+    """
+    자료 링크를 비교용 키로 정규화합니다.
+
+    scheme/host 대소문자, 끝의 '/', 빈 fragment 차이는 무시합니다.
+    Gmail처럼 fragment가 개별 자료를 가리키는 경우가 있으므로 비어 있지 않은 fragment는 유지합니다.
+    """
+    if not link:
+        return ''
+    parts = urlsplit(link.strip())
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip('/'),
+        parts.query,
+        parts.fragment.rstrip('/'),
+    ))
+
+
+class ExternalDataset:
+    """한 시점의 외부 데이터 스냅샷 (읽기 전용)"""
+
+    def __init__(self, records, version, path=None, load_seconds=0.0):
+        self.records = tuple(records)
+        self.version = version
+        self.path = path
+        self.load_seconds = load_seconds
+        self.loaded_at = time.time()
+        self._index = None
+        self._index_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    @property
+    def index(self):
+        """(material_type, 정규화된 material_link) -> 레코드 튜플. 처음 접근할 때 build_index()로 만듭니다."""
+        return self.build_index()
+
+    def build_index(self):
+        """자료별 인덱스를 만들어 반환합니다. 스냅샷마다 한 번만 만들고, 이후 호출은 만든 인덱스를 돌려줍니다."""
+        if self._index is None:
+            with self._index_lock:
+                if self._index is None:
+                    index = {}
+                    for record in self.records:
+                        key = (record.get('material_type'), canonicalize_link(record.get('material_link')))
+                        index.setdefault(key, []).append(record)
+                    self._index = {key: tuple(records) for key, records in index.items()}
+        return self._index
+
+    def find(self, material_type, material_link):
+        """자료 하나에 해당하는 외부 레코드들을 반환합니다."""
+        return self.index.get((material_type, canonicalize_link(material_link)), ())
+
+    def subset(self, positions):
+        """주어진 위치의 레코드만 담은 스냅샷을 만듭니다. (순서 유지)"""
+        records = self.records
+        return ExternalDataset(
+            [records[position] for position in positions], version=self.version, path=self.path
+        )
+
+    def stats(self):
+        return {
+            'version': self.version,
+            'path': str(self.path) if self.path else None,
+            'records_count': len(self.records),
+            'loaded_at': self.loaded_at,
+            'load_seconds': self.load_seconds,
+        }
+
+
+EMPTY_DATASET = ExternalDataset((), version=None)
+
+
+def _file_version(stat_result):
+    return f"{stat_result.st_mtime_ns}-{stat_result.st_size}"
+
+
+class ExternalDataStore:
+    """파일 하나에 대한 프로세스 단위 캐시"""
+
+    def __init__(self, path):
+        self.path = path
+        self._dataset = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        """현재 파일 버전의 스냅샷을 반환합니다. 필요할 때만 다시 로드합니다."""
+        try:
+            version = _file_version(os.stat(self.path))
+        except OSError as e:
+            logger.warning("외부 데이터 로드 실패: %s", e)
+            return self._dataset or EMPTY_DATASET
+
+        dataset = self._dataset
+        if dataset is not None and dataset.version == version:
+            return dataset
+
+        with self._lock:
+            # 다른 스레드가 먼저 다시 로드했을 수 있습니다.
+            dataset = self._dataset
+            if dataset is not None and dataset.version == version:
+                return dataset
+            try:
+                dataset = self._load(version)
+            except Exception:
+                # 읽지 못한 파일은 마지막으로 성공한 스냅샷(없으면 빈 데이터)으로 대신합니다.
+                logger.exception("외부 데이터 로드 실패: %s", self.path)
+                return self._dataset or EMPTY_DATASET
+            self._dataset = dataset
+            return dataset
+
+    def _load(self, version):
+        started = time.perf_counter()
+        records = read_external_records(self.path)
+        dataset = ExternalDataset(
+            records,
+            version=version,
+            path=self.path,
+            load_seconds=time.perf_counter() - started,
+        )
+        logger.info(
+            "외부 데이터 로드 완료: %s건, %.3f초 (version=%s)",
+            len(dataset), dataset.load_seconds, dataset.version,
+        )
+        return dataset
+
+    def clear(self):
+        with self._lock:
+            self._dataset = None
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(path=None):
+    """경로별 ExternalDataStore를 반환합니다. 기본값은 settings.EXTERNAL_DATA_PATH 입니다."""
+    path = os.fspath(path or settings.EXTERNAL_DATA_PATH)
+    store = _stores.get(path)
+    if store is None:
+        with _stores_lock:
+            store = _stores.setdefault(path, ExternalDataStore(path))
+    return store
+
+
+def get_external_dataset(path=None):
+    """외부 데이터 스냅샷을 반환합니다."""
+    return get_store(path).get()
@@ -0,0 +1,204 @@
+"""
+외부 데이터 전문 검색 인덱스 (SQLite FTS5, trigram 토크나이저).
+
+외부 데이터 스냅샷을 별도 SQLite 파일에 미러링하고 데이터셋 버전으로 관리합니다.
+레코드의 정규화된 제목/본문(ExternalRecord.title_norm/body_norm)을 색인합니다.
+trigram 토크나이저는 공백 단위가 아닌 부분 문자열로 색인하므로 한국어/영어가 섞인 텍스트에서도
+기존의 `keyword in text` 검사와 같은 결과를 냅니다. 검색 비용은 전체 레코드 수가 아니라 매칭 수에 비례합니다.
+
+단, 3글자 미만 키워드는 trigram으로 찾을 수 없어 색인된 텍스트를 순차 검사합니다.
+
+인덱스는 match_all_projects가 매칭 전에 다시 만듭니다. 요청 중에 데이터셋이 바뀐 것을 알게 되면
+그 요청은 순차 검사로 처리하고 인덱스는 백그라운드 스레드에서 다시 만듭니다. (요청이 재생성을 기다리지 않음)
+"""
+import logging
+import sqlite3
+import threading
+
+from django.conf import settings
+
+from .keyword_matcher import normalize_text
+
+logger = logging.getLogger(__name__)
+
+MIN_TRIGRAM_LENGTH = 3
+# 색인하는 텍스트의 형식이 바뀌면 올려서 기존 인덱스를 다시 만들게 합니다.
+INDEX_FORMAT = 2
+
+
+def _fts_phrase(keyword):
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+def _index_version(dataset):
+    return f"{INDEX_FORMAT}:{dataset.version}"
+
+
+class ExternalTextIndex:
+    """외부 레코드의 제목/본문을 담는 FTS5 인덱스. rowid는 스냅샷 안에서의 레코드 위치입니다."""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._rebuild_lock = threading.Lock()
+        self._rebuild_thread = None
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS external_records "
+                "USING fts5(title, body, tokenize='trigram case_sensitive 1')"
+            )
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """현재 스레드의 연결을 닫습니다. (fork 전이나 스레드 종료 시)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @staticmethod
+    def _version(conn):
+        row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return row[0] if row else None
+
+    def rebuild(self, dataset):
+        """스냅샷 버전이 인덱스 버전과 다르면 인덱스를 다시 만듭니다."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 다른 프로세스가 먼저 다시 만들었을 수 있습니다.
+            if self._version(conn) != _index_version(dataset):
+                conn.execute("DELETE FROM external_records")
+                conn.executemany(
+                    "INSERT INTO external_records (rowid, title, body) VALUES (?, ?, ?)",
+                    (
+                        (position, record.title_norm, record.body_norm)
+                        for position, record in enumerate(dataset.records)
+                    )
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (_index_version(dataset),)
+                )
+                logger.info("외부 데이터 검색 인덱스 재생성: %s건 (version=%s)", len(dataset), dataset.version)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def rebuild_in_background(self, dataset):
+        """백그라운드 스레드에서 인덱스를 다시 만듭니다. 이미 다시 만드는 중이면 그 스레드를 반환합니다."""
+        with self._rebuild_lock:
+            if self._rebuild_thread is None or not self._rebuild_thread.is_alive():
+                self._rebuild_thread = threading.Thread(
+                    target=self._rebuild_and_close, args=(dataset,), name='external-text-index', daemon=True
+                )
+                self._rebuild_thread.start()
+            return self._rebuild_thread
+
+    def _rebuild_and_close(self, dataset):
+        try:
+            self.rebuild(dataset)
+        except sqlite3.Error as e:
+            logger.warning("외부 데이터 검색 인덱스 재생성 실패: %s", e)
+        finally:
+            self.close()
+
+    def search(self, dataset, keywords):
+        """
+        키워드 중 하나라도 제목 또는 본문에 포함된 레코드 위치를 오름차순으로 반환합니다.
+        인덱스 버전이 스냅샷과 다르면 (아직 다시 만들지 않았으면) None을 반환합니다.
+        """
+        keywords = [normalize_text(kw) for kw in keywords if kw]
+        if not keywords:
+            return []
+
+        conn = self._connect()
+        # 버전 확인과 검색을 한 읽기 트랜잭션 안에서 수행해, 도중에 재생성된 인덱스를 섞어 읽지 않습니다.
+        conn.execute("BEGIN")
+        try:
+            if self._version(conn) != _index_version(dataset):
+                return None
+            return sorted(self._query(conn, keywords))
+        finally:
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _query(conn, keywords):
+        positions = set()
+        long_keywords = [kw for kw in keywords if len(kw) >= MIN_TRIGRAM_LENGTH]
+        short_keywords = [kw for kw in keywords if len(kw) < MIN_TRIGRAM_LENGTH]
+
+        if long_keywords:
+            expression = ' OR '.join(_fts_phrase(kw) for kw in long_keywords)
+            positions.update(
+                row[0] for row in conn.execute(
+                    "SELECT rowid FROM external_records WHERE external_records MATCH ?", (expression,)
+                )
+            )
+        for keyword in short_keywords:
+            positions.update(
+                row[0] for row in conn.execute(
+                    "SELECT rowid FROM external_records WHERE instr(title, ?) > 0 OR instr(body, ?) > 0",
+                    (keyword, keyword)
+                )
+            )
+        return positions
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_text_index():
+    """설정된 경로의 ExternalTextIndex를 반환합니다. EXTERNAL_DATA_FTS_PATH가 비어 있으면 None."""
+    global _index
+    path = settings.EXTERNAL_DATA_FTS_PATH
+    if not path:
+        return None
+    if _index is None or _index.path != str(path):
+        with _index_lock:
+            if _index is None or _index.path != str(path):
+                _index = ExternalTextIndex(str(path))
+    return _index
+
+
+def build_text_index(dataset):
+    """
+    인덱스가 스냅샷과 다르면 지금 다시 만듭니다. (match_all_projects 등 배치 작업용)
+    인덱스를 사용할 수 있으면 True를 반환합니다. 현재 스레드의 연결은 닫으므로 이후 fork해도 안전합니다.
+    """
+    index = get_text_index()
+    if index is None or dataset.version is None:
+        return False
+    try:
+        index.rebuild(dataset)
+    except sqlite3.Error as e:
+        logger.warning("외부 데이터 검색 인덱스 재생성 실패: %s", e)
+        return False
+    finally:
+        index.close()
+    return True
+
+
+def search_external_records(dataset, keywords):
+    """
+    키워드가 포함된 레코드 위치 목록을 반환합니다.
+    인덱스를 쓸 수 없으면 (비활성화, 재생성 전, FTS5/trigram 미지원 등) None을 반환하고 호출 측이 순차 검사합니다.
+    """
+    index = get_text_index()
+    if index is None or dataset.version is None:
+        return None
+    try:
+        positions = index.search(dataset, keywords)
+    except sqlite3.Error as e:
+        logger.warning("외부 데이터 검색 인덱스 사용 실패: %s", e)
+        return None
+    if positions is None:
+        index.rebuild_in_background(dataset)
+    return positions
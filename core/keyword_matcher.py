@@ -0,0 +1,99 @@
+"""
+프로젝트 키워드 매칭용 Aho-Corasick 오토마톤.
+
+키워드 수와 상관없이 텍스트를 한 번만 훑어서 포함된 키워드를 모두 찾습니다.
+키워드와 검색 대상 텍스트는 모두 normalize_text()로 정규화된 것으로 가정합니다.
+"""
+import unicodedata
+from functools import lru_cache
+
+
+def normalize_text(text):
+    """매칭용 텍스트 정규화: NFC 조합 후 casefold. (분해형 한글도 같은 문자열이 됨)"""
+    if not text:
+        return ''
+    return unicodedata.normalize('NFC', unicodedata.normalize('NFC', text).casefold())
+
+
+def parse_keywords(project_keyword):
+    """쉼표로 구분된 project_keyword를 키워드 목록으로 분리합니다."""
+    return [kw.strip() for kw in (project_keyword or '').split(',') if kw.strip()]
+
+
+class KeywordMatcher:
+    """키워드 목록으로 만든 오토마톤. 키워드 순서가 우선순위가 됩니다."""
+
+    def __init__(self, keywords):
+        self.keywords = tuple(keywords)
+        # 상태별 전이(goto), 실패 링크(fail), 출력(키워드 인덱스)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in normalize_text(keyword):
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+            self._out[state] = self._out[state] + (index,)
+
+        # BFS로 실패 링크를 채우고, 실패 링크의 출력을 합칩니다.
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+                self._fail[next_state] = fail
+                self._out[next_state] = self._out[next_state] + self._out[fail]
+                queue.append(next_state)
+
+    def search(self, *texts):
+        """텍스트들에 포함된 키워드 인덱스 집합을 반환합니다. 텍스트 경계를 넘는 매칭은 없습니다."""
+        goto, fail, out = self._goto, self._fail, self._out
+        root = goto[0]
+        found = set()
+        for text in texts:
+            state = 0
+            for ch in text:
+                if state == 0:
+                    state = root.get(ch, 0)
+                else:
+                    while state and ch not in goto[state]:
+                        state = fail[state]
+                    state = goto[state].get(ch, 0)
+                if out[state]:
+                    found.update(out[state])
+            if len(found) == len(self.keywords):
+                break
+        return found
+
+    def match(self, *texts):
+        """
+        (처음 매칭된 키워드, 매칭된 키워드 목록)을 반환합니다.
+
+        '처음 매칭된 키워드'는 키워드 목록 순서상 가장 앞선 키워드로,
+        키워드를 차례로 검사하다 첫 매칭에서 멈추던 기존 동작과 같습니다.
+        매칭이 없으면 (None, [])를 반환합니다.
+        """
+        found = self.search(*texts)
+        if not found:
+            return None, []
+        hits = []
+        for index in sorted(found):
+            if self.keywords[index] not in hits:
+                hits.append(self.keywords[index])
+        return hits[0], hits
+
+
+@lru_cache(maxsize=256)
+def get_keyword_matcher(project_keyword):
+    """project_keyword 문자열별로 컴파일된 KeywordMatcher를 캐시합니다."""
+    return KeywordMatcher(parse_keywords(project_keyword))
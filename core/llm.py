@@ -0,0 +1,479 @@
+"""
+LLM 클라이언트 계층.
+
+settings.LLM_BACKEND로 백엔드를 고릅니다.
+- 'gemini': google.generativeai (실제 API 호출)
+- 'fake': 네트워크 없이 프롬프트로부터 결정적인 응답을 만드는 로컬 백엔드 (지연 시간 설정 가능)
+- 그 밖의 값은 LLMClient 하위 클래스의 dotted path로 취급합니다.
+
+클라이언트(와 내부 연결)는 프로세스당 하나만 만들어 재사용합니다.
+모든 호출에 타임아웃(LLM_TIMEOUT)을 걸고, 일시적인 오류는 지수 백오프로 재시도(LLM_MAX_RETRIES)합니다.
+
+프로세스 전체의 LLM 호출은 LLMLimiter로 제한합니다. 토큰 버킷(LLM_RATE_LIMIT/LLM_RATE_BURST)이 비어 있으면
+바로 LLMRateLimited(429)를, 동시 호출 한도(LLM_MAX_CONCURRENCY)가 찼을 때 대기열(LLM_MAX_QUEUE)도 가득 찼거나
+LLM_QUEUE_TIMEOUT 안에 자리가 나지 않으면 LLMOverloaded(503)를 냅니다. 스레드가 끝없이 쌓이지 않습니다.
+"""
+import asyncio
+import concurrent.futures
+import hashlib
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class LLMError(Exception):
+    """LLM 호출 실패 (재시도 후에도 실패한 경우 포함)"""
+
+
+class LLMTimeout(LLMError):
+    """LLM 호출이 타임아웃을 넘긴 경우"""
+
+
+class LLMRateLimited(LLMError):
+    """호출 빈도 한도(토큰 버킷)를 넘어 거절한 경우"""
+
+
+class LLMOverloaded(LLMError):
+    """동시 호출 한도와 대기열이 가득 차 거절한 경우"""
+
+
+class LLMClient:
+    """
+    LLM 클라이언트 기본 클래스.
+
+    하위 클래스는 _generate()와 _stream()을 구현합니다.
+    generate()/stream()이 재시도와 오류 변환을 담당합니다.
+    """
+
+    def __init__(self, model_name, timeout=60.0, max_retries=2, retry_backoff=0.5, **options):
+        self.model_name = model_name
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.options = options
+
+    def is_retryable(self, error):
+        """재시도할 오류인지 판단합니다."""
+        return isinstance(error, (LLMTimeout, TimeoutError, ConnectionError))
+
+    def backoff_delay(self, attempt):
+        """attempt번째 재시도 전 대기 시간 (지수 백오프 + 지터)"""
+        return self.retry_backoff * (2 ** attempt) * random.uniform(0.5, 1.0)
+
+    def generate(self, prompt):
+        """프롬프트에 대한 응답 전체를 반환합니다."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._generate(prompt)
+            except Exception as e:
+                if attempt >= self.max_retries or not self.is_retryable(e):
+                    raise self._wrap(e) from e
+                delay = self.backoff_delay(attempt)
+                logger.warning("LLM 호출 실패, %.2f초 후 재시도 (%s/%s): %s", delay, attempt + 1, self.max_retries, e)
+                time.sleep(delay)
+
+    async def stream(self, prompt):
+        """응답을 조각 단위로 생성합니다. 첫 조각을 받기 전에 실패한 경우에만 재시도합니다."""
+        for attempt in range(self.max_retries + 1):
+            started = False
+            try:
+                async for text in self._stream(prompt):
+                    started = True
+                    yield text
+                return
+            except Exception as e:
+                if started or attempt >= self.max_retries or not self.is_retryable(e):
+                    raise self._wrap(e) from e
+                delay = self.backoff_delay(attempt)
+                logger.warning("LLM 스트리밍 실패, %.2f초 후 재시도 (%s/%s): %s", delay, attempt + 1, self.max_retries, e)
+                await asyncio.sleep(delay)
+
+    def _wrap(self, error):
+        if isinstance(error, LLMError):
+            return error
+        if isinstance(error, (TimeoutError, asyncio.TimeoutError)):
+            return LLMTimeout(f"{self.timeout}초 안에 응답이 없습니다.")
+        return LLMError(str(error))
+
+    def _generate(self, prompt):
+        raise NotImplementedError
+
+    async def _stream(self, prompt):
+        raise NotImplementedError
+        yield
+
+
+class GeminiClient(LLMClient):
+    """google.generativeai 백엔드. GenerativeModel 하나를 프로세스 안에서 재사용합니다."""
+
+    def __init__(self, model_name, api_key='', **kwargs):
+        super().__init__(model_name, **kwargs)
+        try:
+            import google.generativeai as genai
+        except ImportError:
+            raise LLMError("Gemini 백엔드를 사용하려면 google-generativeai 패키지가 필요합니다.")
+        genai.configure(api_key=api_key)
+        self._model = genai.GenerativeModel(model_name)
+        self._retryable_errors = self._load_retryable_errors()
+
+    @staticmethod
+    def _load_retryable_errors():
+        try:
+            from google.api_core import exceptions
+        except ImportError:
+            return ()
+        return (
+            exceptions.DeadlineExceeded,
+            exceptions.ServiceUnavailable,
+            exceptions.TooManyRequests,
+            exceptions.InternalServerError,
+        )
+
+    def is_retryable(self, error):
+        return super().is_retryable(error) or isinstance(error, self._retryable_errors)
+
+    def _generate(self, prompt):
+        response = self._model.generate_content(prompt, request_options={'timeout': self.timeout})
+        return response.text
+
+    async def _stream(self, prompt):
+        response = await asyncio.wait_for(
+            self._model.generate_content_async(
+                prompt, stream=True, request_options={'timeout': self.timeout}
+            ),
+            self.timeout
+        )
+        async for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
+
+class FakeLLMClient(LLMClient):
+    """
+    네트워크 없이 동작하는 결정적인 로컬 백엔드 (테스트/벤치마크용).
+
+    같은 프롬프트에는 항상 같은 응답을 돌려주며, 응답마다 latency초가 걸립니다.
+    latency가 timeout보다 길면 timeout초 뒤 LLMTimeout을 냅니다.
+    """
+
+    def __init__(self, model_name='fake', latency=0.0, response=None, **kwargs):
+        super().__init__(model_name, **kwargs)
+        self.latency = latency
+        self.response = response
+
+    def render(self, prompt):
+        if self.response is not None:
+            return self.response
+        digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:12]
+        return f"요약 ({self.model_name}, {digest}): 입력 {len(prompt)}자"
+
+    def _generate(self, prompt):
+        if self.timeout and self.latency > self.timeout:
+            time.sleep(self.timeout)
+            raise LLMTimeout(f"{self.timeout}초 안에 응답이 없습니다.")
+        time.sleep(self.latency)
+        return self.render(prompt)
+
+    async def _stream(self, prompt):
+        parts = self.render(prompt).split(' ')
+        parts = [part + ' ' for part in parts[:-1]] + parts[-1:]
+        delay = self.latency / len(parts)
+        elapsed = 0.0
+        for part in parts:
+            if self.timeout and elapsed + delay > self.timeout:
+                await asyncio.sleep(self.timeout - elapsed)
+                raise LLMTimeout(f"{self.timeout}초 안에 응답이 없습니다.")
+            await asyncio.sleep(delay)
+            elapsed += delay
+            yield part
+
+
+LLM_BACKENDS = {
+    'gemini': GeminiClient,
+    'fake': FakeLLMClient,
+}
+
+
+def _client_config():
+    return (
+        settings.LLM_BACKEND,
+        settings.LLM_MODEL_NAME,
+        settings.LLM_API_KEY,
+        settings.LLM_TIMEOUT,
+        settings.LLM_MAX_RETRIES,
+        settings.LLM_RETRY_BACKOFF,
+        settings.LLM_FAKE_LATENCY,
+    )
+
+
+def create_llm_client():
+    """설정으로 새 LLM 클라이언트를 만듭니다."""
+    backend = settings.LLM_BACKEND
+    client_class = LLM_BACKENDS.get(backend) or import_string(backend)
+    options = {
+        'timeout': settings.LLM_TIMEOUT,
+        'max_retries': settings.LLM_MAX_RETRIES,
+        'retry_backoff': settings.LLM_RETRY_BACKOFF,
+    }
+    model_name = settings.LLM_MODEL_NAME
+    if client_class is FakeLLMClient:
+        # 실제 모델 응답과 캐시(AIRequest.content_hash)가 섞이지 않도록 모델명을 구분합니다.
+        model_name = f"fake:{model_name}"
+        options['latency'] = settings.LLM_FAKE_LATENCY
+    elif client_class is GeminiClient:
+        options['api_key'] = settings.LLM_API_KEY
+    return client_class(model_name, **options)
+
+
+_client = None
+_client_key = None
+_client_lock = threading.Lock()
+
+
+def get_llm_client():
+    """프로세스 단위로 공유하는 LLM 클라이언트를 반환합니다. 설정이 바뀌면 새로 만듭니다."""
+    global _client, _client_key
+    key = _client_config()
+    if _client is None or _client_key != key:
+        with _client_lock:
+            if _client is None or _client_key != key:
+                _client = create_llm_client()
+                _client_key = key
+    return _client
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        """토큰이 있으면 하나를 쓰고 True, 없으면 기다리지 않고 False를 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class LLMLimiter:
+    """
+    프로세스 전체 LLM 호출 제한 (토큰 버킷 + 동시 호출 세마포어 + 크기 제한 대기열).
+
+    rate나 max_concurrency가 0이면 해당 제한을 사용하지 않습니다.
+    """
+
+    def __init__(self, max_concurrency=0, max_queue=0, queue_timeout=10.0, rate=0.0, burst=1):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._bucket = TokenBucket(rate, burst) if rate else None
+        self._condition = threading.Condition()
+        self._active = 0
+        self._waiting = 0
+
+    def _take_token(self):
+        if self._bucket is not None and not self._bucket.try_acquire():
+            raise LLMRateLimited("LLM 호출 빈도 한도를 넘었습니다. 잠시 후 다시 시도해주세요.")
+
+    def _try_take_slot(self):
+        with self._condition:
+            if self._active < self.max_concurrency:
+                self._active += 1
+                return True
+            if self._waiting >= self.max_queue:
+                raise LLMOverloaded("LLM 호출 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.")
+            return False
+
+    def _wait_for_slot(self):
+        deadline = time.monotonic() + self.queue_timeout
+        with self._condition:
+            if self._active >= self.max_concurrency and self._waiting >= self.max_queue:
+                raise LLMOverloaded("LLM 호출 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.")
+            self._waiting += 1
+            try:
+                while self._active >= self.max_concurrency:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise LLMOverloaded(f"{self.queue_timeout}초 안에 LLM 호출 자리가 나지 않았습니다.")
+                    self._condition.wait(remaining)
+                self._active += 1
+            finally:
+                self._waiting -= 1
+
+    def acquire(self):
+        """호출 자리를 얻습니다. 자리가 없으면 대기열에서 queue_timeout초까지 기다립니다."""
+        self._take_token()
+        if self.max_concurrency and not self._try_take_slot():
+            self._wait_for_slot()
+
+    async def aacquire(self):
+        """acquire()의 비동기 버전. 기다려야 할 때만 스레드를 사용합니다. (대기열 크기로 제한됨)"""
+        self._take_token()
+        if self.max_concurrency and not self._try_take_slot():
+            await sync_to_async(self._wait_for_slot, thread_sensitive=False)()
+
+    def release(self):
+        if not self.max_concurrency:
+            return
+        with self._condition:
+            self._active -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def slot(self):
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @contextmanager
+    def queued(self):
+        """
+        호출 자리 없이 다른 호출을 기다리는 동안 대기열 자리 하나를 차지합니다. (SingleFlight의 follower)
+        대기열이 가득 차 있으면 LLMOverloaded를 냅니다.
+        """
+        if not self.max_concurrency:
+            yield
+            return
+        with self._condition:
+            if self._waiting >= self.max_queue:
+                raise LLMOverloaded("LLM 호출 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.")
+            self._waiting += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._waiting -= 1
+
+    def stats(self):
+        return {'active': self._active, 'waiting': self._waiting}
+
+
+def _limiter_config():
+    return (
+        settings.LLM_MAX_CONCURRENCY,
+        settings.LLM_MAX_QUEUE,
+        settings.LLM_QUEUE_TIMEOUT,
+        settings.LLM_RATE_LIMIT,
+        settings.LLM_RATE_BURST,
+    )
+
+
+_limiter = None
+_limiter_key = None
+_limiter_lock = threading.Lock()
+
+
+def get_llm_limiter():
+    """프로세스 단위로 공유하는 LLMLimiter를 반환합니다. 설정이 바뀌면 새로 만듭니다."""
+    global _limiter, _limiter_key
+    key = _limiter_config()
+    if _limiter is None or _limiter_key != key:
+        with _limiter_lock:
+            if _limiter is None or _limiter_key != key:
+                _limiter = LLMLimiter(*key)
+                _limiter_key = key
+    return _limiter
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 호출을 하나로 합칩니다.
+
+    먼저 들어온 호출(leader)만 함수를 실행하고, 실행 중에 들어온 같은 키의 호출은 그 결과(또는 예외)를 공유합니다.
+    프로세스 안에서만 동작합니다.
+
+    limiter를 넘기면 기다리는 호출(follower)도 LLMLimiter의 대기열 자리를 차지하고,
+    timeout초 안에 결과가 나오지 않으면 limiter와 같은 LLMOverloaded를 냅니다.
+    """
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, limiter=None, timeout=None):
+        """(결과, 다른 호출의 결과를 공유했는지 여부)를 반환합니다."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+
+        if not leader:
+            with limiter.queued() if limiter is not None else nullcontext():
+                if not call.done.wait(timeout):
+                    raise LLMOverloaded(f"{timeout}초 안에 같은 요청의 결과를 받지 못했습니다.")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+class StreamFlight:
+    """
+    스트리밍 응답용 single-flight.
+
+    SingleFlight와 달리 leader가 함수 호출 하나로 끝나지 않으므로 (응답을 보내면서 완료됨),
+    join()으로 받은 Future를 leader가 finish()로 직접 완료합니다. 다른 호출은 그 Future를 기다립니다.
+    Future는 concurrent.futures.Future이므로 어느 스레드/이벤트 루프에서든 완료하고 기다릴 수 있습니다.
+    (비동기 코드에서는 asyncio.wrap_future()로 기다림)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def join(self, key):
+        """(Future, leader 여부)를 반환합니다."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = self._calls[key] = concurrent.futures.Future()
+            return future, True
+
+    def finish(self, key, future, result=None, error=None):
+        """leader의 결과(또는 예외)로 Future를 완료합니다. 이미 완료됐으면 아무것도 하지 않습니다."""
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
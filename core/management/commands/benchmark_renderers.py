@@ -0,0 +1,112 @@
+import gzip
+import json
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from core.api_views import ITEM_RELATIONS
+from core.models import Item, Project, ProjectMaterial
+from core.renderers import FastJSONRenderer, MessagePackRenderer, _msgpack, _orjson
+from core.serializers import ItemSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "아이템 목록 페이지를 렌더러별(DRF JSON, FastJSON, MessagePack)로 렌더링해 "
+        "렌더링 시간(중앙값/p95)과 응답 크기(gzip 포함)를 비교합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page-size', type=int, default=100, help="페이지당 아이템 수")
+        parser.add_argument('--repeat', type=int, default=200, help="렌더러별 반복 횟수")
+        parser.add_argument('--body-size', type=int, default=2000, help="벤치마크 아이템 본문 길이(문자)")
+        parser.add_argument(
+            '--project', type=int,
+            help="기존 프로젝트의 아이템으로 측정 (없으면 임시 프로젝트를 만들고 끝나면 삭제)"
+        )
+
+    def handle(self, *args, **options):
+        page_size = max(1, options['page_size'])
+        repeat = max(1, options['repeat'])
+
+        if options['project']:
+            project = Project.objects.filter(id=options['project']).first()
+            if project is None:
+                raise CommandError(f"프로젝트 {options['project']}이(가) 없습니다.")
+            self._report(self._page(project, page_size), repeat)
+            return
+
+        project = self._create_project(page_size, options['body_size'])
+        try:
+            self._report(self._page(project, page_size), repeat)
+        finally:
+            project.delete()
+
+    @transaction.atomic
+    def _create_project(self, items_count, body_size):
+        project = Project.objects.create(
+            author_email='benchmark@example.com',
+            project_name='renderer benchmark',
+            project_code=f"BENCH-{time.time_ns()}",
+        )
+        material = ProjectMaterial.objects.create(
+            project=project, material_type='github', material_link='https://github.com/benchmark/repo'
+        )
+        body = ("서버 배포와 API 변경 사항 - deploy & API changes. " * (body_size // 40 + 1))[:body_size]
+        Item.objects.bulk_create([
+            Item(
+                project=project, project_material=material, channel_name='github',
+                title=f"벤치마크 아이템 {index}", body=body,
+                link=f"https://github.com/benchmark/repo/pull/{index}",
+            )
+            for index in range(items_count)
+        ])
+        return project
+
+    def _page(self, project, page_size):
+        """GET /api/items/?project_id=... 한 페이지와 같은 모양의 데이터 (?expand 필드 포함)"""
+        items = Item.objects.filter(project=project).select_related(*ITEM_RELATIONS).order_by('-created_at', '-id')
+        results = ItemSerializer(items[:page_size], many=True).data
+        return {
+            'count': len(results),
+            'next': None,
+            'previous': None,
+            'results': results,
+        }
+
+    def _renderers(self):
+        renderers = [('drf-json', JSONRenderer())]
+        if _orjson() is not None:
+            renderers.append(('fast-json (orjson)', FastJSONRenderer()))
+        else:
+            self.stderr.write("orjson이 설치되어 있지 않아 fast-json을 건너뜁니다. (pip install orjson)")
+        if _msgpack() is not None:
+            renderers.append(('msgpack', MessagePackRenderer()))
+        else:
+            self.stderr.write("msgpack이 설치되어 있지 않아 msgpack을 건너뜁니다. (pip install msgpack)")
+        return renderers
+
+    def _report(self, data, repeat):
+        report = {'items': len(data['results']), 'repeat': repeat, 'renderers': {}}
+        baseline = None
+        for name, renderer in self._renderers():
+            content = renderer.render(data, renderer.media_type)
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                renderer.render(data, renderer.media_type)
+                timings.append(time.perf_counter() - started)
+            timings.sort()
+            median = statistics.median(timings)
+            baseline = baseline or median
+            report['renderers'][name] = {
+                'median_ms': round(median * 1000, 3),
+                'p95_ms': round(timings[max(0, int(len(timings) * 0.95) - 1)] * 1000, 3),
+                'speedup': round(baseline / median, 2) if median else 0.0,
+                'bytes': len(content),
+                'gzip_bytes': len(gzip.compress(content)),
+            }
+        self.stdout.write(json.dumps(report, ensure_ascii=False, indent=2))
@@ -0,0 +1,144 @@
+import json
+import math
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+
+from core.models import AIRequest, Item, Project, ProjectMaterial
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(p / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    help = (
+        "summarize-items 엔드포인트의 처리량과 지연 시간(p50/p95/p99)을 동시 요청으로 측정합니다. "
+        "기본값은 fake LLM 백엔드로 프로세스 안에서 실행하므로 네트워크가 필요 없습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help="전체 요청 수")
+        parser.add_argument('--concurrency', type=int, default=16, help="동시 요청 수")
+        parser.add_argument('--latency', type=float, default=0.05, help="fake LLM 응답 지연(초)")
+        parser.add_argument('--items', type=int, default=20, help="벤치마크 프로젝트의 아이템 수")
+        parser.add_argument('--cache', action='store_true', help="LLM 응답 캐시 사용 (기본: 끔)")
+        parser.add_argument(
+            '--url',
+            help="실행 중인 서버 주소 (예: http://localhost:8000). 서버는 LLM_BACKEND=fake로 실행해야 합니다. "
+                 "--project와 함께 사용합니다."
+        )
+        parser.add_argument('--project', type=int, help="--url 사용 시 요약할 프로젝트 ID")
+
+    def handle(self, *args, **options):
+        total = max(1, options['requests'])
+        concurrency = max(1, options['concurrency'])
+
+        if options['url']:
+            if not options['project']:
+                raise CommandError("--url을 사용할 때는 --project가 필요합니다.")
+            base_url = options['url'].rstrip('/')
+            path = f"/api/projects/{options['project']}/summarize-items/"
+            self._report(self._run(lambda: self._post_http(base_url + path), total, concurrency))
+            return
+
+        with override_settings(
+            LLM_BACKEND='fake',
+            LLM_FAKE_LATENCY=options['latency'],
+            SUMMARY_CACHE_TTL=24 * 60 * 60 if options['cache'] else 0,
+        ):
+            project = self._create_project(options['items'])
+            try:
+                path = f"/api/projects/{project.id}/summarize-items/"
+                self.stdout.write(
+                    f"프로세스 내 벤치마크: requests={total}, concurrency={concurrency}, "
+                    f"fake latency={options['latency']}s, items={options['items']}"
+                )
+                self._report(self._run(lambda: self._post_in_process(path), total, concurrency))
+            finally:
+                self._cleanup(project)
+
+    @transaction.atomic
+    def _create_project(self, items_count):
+        project = Project.objects.create(
+            author_email='benchmark@example.com',
+            project_name='summarize benchmark',
+            project_code=f"BENCH-{time.time_ns()}",
+        )
+        material = ProjectMaterial.objects.create(
+            project=project, material_type='github', material_link='https://github.com/benchmark/repo'
+        )
+        Item.objects.bulk_create([
+            Item(
+                project=project, project_material=material, channel_name='github',
+                title=f"벤치마크 아이템 {index}", body="서버 배포와 API 변경 사항 " * 20,
+                link=f"https://github.com/benchmark/repo/pull/{index}",
+                is_fixed=True, is_active=True,
+            )
+            for index in range(items_count)
+        ])
+        return project
+
+    def _cleanup(self, project):
+        ai_request_ids = list(
+            AIRequest.objects.filter(summary__project=project).values_list('id', flat=True)
+        )
+        ai_request_ids += project.summary_chunks.exclude(ai_request=None).values_list('ai_request_id', flat=True)
+        project.delete()
+        AIRequest.objects.filter(id__in=ai_request_ids).delete()
+
+    def _post_in_process(self, path):
+        response = Client().post(path)
+        return response.status_code
+
+    def _post_http(self, url):
+        request = urllib.request.Request(url, data=b'', method='POST')
+        try:
+            with urllib.request.urlopen(request) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    def _run(self, send, total, concurrency):
+        def timed():
+            started = time.perf_counter()
+            try:
+                status_code = send()
+            finally:
+                connection.close()
+            return status_code, time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(lambda _: timed(), range(total)))
+        return results, time.perf_counter() - started
+
+    def _report(self, run):
+        results, elapsed = run
+        latencies = sorted(latency for _, latency in results)
+        statuses = {}
+        for status_code, _ in results:
+            statuses[status_code] = statuses.get(status_code, 0) + 1
+        errors = sum(count for status_code, count in statuses.items() if status_code >= 400)
+
+        report = {
+            'requests': len(results),
+            'errors': errors,
+            'status_codes': statuses,
+            'elapsed_seconds': round(elapsed, 3),
+            'throughput_rps': round(len(results) / elapsed, 2) if elapsed else 0.0,
+            'latency_ms': {
+                name: round(percentile(latencies, p) * 1000, 1)
+                for name, p in (('p50', 50), ('p95', 95), ('p99', 99), ('max', 100))
+            },
+        }
+        self.stdout.write(json.dumps(report, ensure_ascii=False, indent=2))
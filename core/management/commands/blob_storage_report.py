@@ -0,0 +1,60 @@
+import os
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Sum
+from django.db.models.functions import Length
+
+from core.blobs import BlobRef, iter_blob_columns, referenced_blob_hashes
+from core.models import TextBlob
+
+
+class Command(BaseCommand):
+    help = "압축/중복 제거 텍스트 저장소(text_blobs)의 사용량과 절약된 용량을 보고합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prune', action='store_true', help="어떤 행에서도 참조하지 않는 블롭 삭제")
+        parser.add_argument('--vacuum', action='store_true', help="SQLite VACUUM으로 빈 페이지를 파일에서 반환")
+
+    def handle(self, *args, **options):
+        if options['prune']:
+            referenced = referenced_blob_hashes()
+            orphans = TextBlob.objects.exclude(sha256__in=referenced)
+            deleted, _ = orphans.delete()
+            self.stdout.write(f"참조되지 않는 블롭 {deleted}개 삭제")
+
+        references = Counter()
+        for model, field in iter_blob_columns():
+            column_refs = Counter(
+                ref.sha256 if isinstance(ref, BlobRef) else ref
+                for ref in model._base_manager.values_list(field.attname, flat=True).iterator()
+                if ref
+            )
+            references.update(column_refs)
+            self.stdout.write(
+                f"{model._meta.db_table}.{field.column}: 값 {sum(column_refs.values())}개, "
+                f"고유 텍스트 {len(column_refs)}개"
+            )
+
+        sizes = dict(TextBlob.objects.values_list('sha256', 'size'))
+        logical_bytes = sum(sizes.get(sha256, 0) * count for sha256, count in references.items())
+        stored_bytes = TextBlob.objects.aggregate(total=Sum(Length('data')))['total'] or 0
+        hash_bytes = sum(references.values()) * 64
+        reclaimed = logical_bytes - stored_bytes - hash_bytes
+
+        self.stdout.write(f"블롭 {len(sizes)}개")
+        self.stdout.write(f"원문 기준 크기: {logical_bytes:,} bytes")
+        self.stdout.write(f"저장 크기: {stored_bytes:,} bytes (블롭) + {hash_bytes:,} bytes (해시 참조)")
+        ratio = (reclaimed / logical_bytes * 100) if logical_bytes else 0.0
+        self.stdout.write(self.style.SUCCESS(f"절약된 용량: {reclaimed:,} bytes ({ratio:.1f}%)"))
+
+        if connection.vendor == 'sqlite':
+            if options['vacuum']:
+                with connection.cursor() as cursor:
+                    cursor.execute("VACUUM")
+                self.stdout.write("VACUUM 완료")
+            db_path = settings.DATABASES['default']['NAME']
+            if os.path.exists(db_path):
+                self.stdout.write(f"DB 파일 크기: {os.path.getsize(db_path):,} bytes")
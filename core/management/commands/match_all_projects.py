@@ -0,0 +1,129 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from core.api_views import (
+    advance_watermarks,
+    create_items_from_matches,
+    find_matching_external_data,
+    find_matching_external_data_by_code,
+)
+from core.external_data import get_external_dataset
+from core.external_search import build_text_index
+from core.models import Project
+
+
+def _match_project(args):
+    """워커 프로세스에서 프로젝트 하나의 키워드/코드 매칭을 수행합니다. (DB 접근 없음)"""
+    project, modes, incremental = args
+    # fork로 물려받은 프로세스 캐시를 그대로 사용하므로 다시 파싱하지 않습니다.
+    dataset = get_external_dataset()
+    keyword_seen = {}
+    code_seen = {}
+    keyword_matches = []
+    code_matches = []
+    if 'keyword' in modes:
+        keyword_matches = find_matching_external_data(project, dataset, incremental, keyword_seen)
+    if 'code' in modes:
+        code_matches = find_matching_external_data_by_code(project, dataset, incremental, code_seen)
+    return project, keyword_matches, code_matches, keyword_seen, code_seen
+
+
+class Command(BaseCommand):
+    help = "모든 프로젝트에 대해 외부 데이터 키워드/코드 매칭을 병렬로 실행하고 아이템을 일괄 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help="매칭에 사용할 프로세스 수 (1이면 현재 프로세스에서 실행)"
+        )
+        parser.add_argument(
+            '--mode', choices=['keyword', 'code', 'both'], default='both',
+            help="실행할 매칭 종류"
+        )
+        parser.add_argument('--batch-size', type=int, default=None, help="bulk_create 배치 크기")
+        parser.add_argument('--dry-run', action='store_true', help="매칭만 하고 아이템은 생성하지 않음")
+        parser.add_argument('--full', action='store_true', help="워터마크를 무시하고 전체 외부 데이터를 다시 확인")
+
+    def handle(self, *args, **options):
+        modes = ('keyword', 'code') if options['mode'] == 'both' else (options['mode'],)
+        workers = max(1, options['workers'])
+        timings = {}
+
+        # 워커는 fork로 부모의 외부 데이터 캐시를 물려받습니다.
+        # fork가 없는 플랫폼(spawn)에서는 워커마다 다시 로드하게 되므로 현재 프로세스에서 실행합니다.
+        if workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            self.stderr.write("이 플랫폼은 fork를 지원하지 않아 workers=1로 실행합니다.")
+            workers = 1
+
+        # 1. 외부 데이터는 부모 프로세스에서 한 번만 로드 (인덱스와 전문 검색 인덱스 포함)
+        started = time.perf_counter()
+        dataset = get_external_dataset()
+        dataset.build_index()
+        build_text_index(dataset)
+        timings['load'] = time.perf_counter() - started
+        self.stdout.write(f"외부 데이터 {len(dataset)}건 로드 (version={dataset.version})")
+
+        # 2. 프로젝트와 자료를 미리 가져와 워커에 넘김
+        started = time.perf_counter()
+        projects = list(Project.objects.prefetch_related('materials'))
+        timings['query'] = time.perf_counter() - started
+
+        # 3. 매칭 (프로세스 풀)
+        started = time.perf_counter()
+        incremental = not options['full']
+        tasks = [(project, modes, incremental) for project in projects]
+        if workers == 1 or len(projects) <= 1:
+            results = [_match_project(task) for task in tasks]
+        else:
+            # 자식 프로세스가 부모의 DB 연결을 공유하지 않도록 닫아 둡니다.
+            connections.close_all()
+            context = multiprocessing.get_context('fork')
+            chunksize = max(1, len(tasks) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                results = list(executor.map(_match_project, tasks, chunksize=chunksize))
+        timings['match'] = time.perf_counter() - started
+
+        # 4. 결과 저장 (일괄 생성)
+        started = time.perf_counter()
+        totals = {'keyword_matches': 0, 'code_matches': 0, 'created_items': 0,
+                  'created_recommendations': 0, 'errors': 0}
+        for project, keyword_matches, code_matches, keyword_seen, code_seen in results:
+            totals['keyword_matches'] += len(keyword_matches)
+            totals['code_matches'] += len(code_matches)
+            if options['dry_run']:
+                continue
+
+            created_items, created_recommendations, errors = create_items_from_matches(
+                project, keyword_matches, is_fixed=False, create_recommendations=True,
+                batch_size=options['batch_size']
+            )
+            code_items, _, code_errors = create_items_from_matches(
+                project, code_matches, is_fixed=True, batch_size=options['batch_size']
+            )
+            advance_watermarks(keyword_seen, 'keyword_watermark', errors)
+            advance_watermarks(code_seen, 'code_watermark', code_errors)
+            totals['created_items'] += len(created_items) + len(code_items)
+            totals['created_recommendations'] += len(created_recommendations)
+            totals['errors'] += len(errors) + len(code_errors)
+            self.stdout.write(
+                f"- {project.project_name} (ID: {project.id}): "
+                f"키워드 {len(keyword_matches)}건, 코드 {len(code_matches)}건 매칭, "
+                f"아이템 {len(created_items) + len(code_items)}개 생성"
+            )
+        timings['write'] = time.perf_counter() - started
+
+        self.stdout.write(
+            f"프로젝트 {len(projects)}개, 키워드 매칭 {totals['keyword_matches']}건, "
+            f"코드 매칭 {totals['code_matches']}건, 아이템 {totals['created_items']}개, "
+            f"추천 {totals['created_recommendations']}개 생성, 오류 {totals['errors']}건"
+        )
+        self.stdout.write(
+            "단계별 소요 시간: " + ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in timings.items())
+            + f" (workers={workers}, {'증분' if incremental else '전체'})"
+        )
+        self.stdout.write(self.style.SUCCESS("매칭 완료"))
@@ -0,0 +1,70 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.core.management.base import BaseCommand
+
+from core.models import SummaryJob
+from core.summarization import (
+    claim_next_job,
+    renew_job_leases,
+    run_summary_job_in_thread,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "대기 중인 요약 작업(summary_jobs)을 여러 스레드로 동시에 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help="동시에 처리할 작업 수")
+        parser.add_argument('--interval', type=float, default=2.0, help="대기 작업이 없을 때 다시 확인하는 간격(초)")
+        parser.add_argument('--once', action='store_true', help="대기 중인 작업을 모두 처리하면 종료")
+
+    def handle(self, *args, **options):
+        workers = max(1, options['workers'])
+        self.stdout.write(f"요약 작업 워커 시작 (workers={workers})")
+
+        in_flight = {}  # future -> 작업
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                # 빈 슬롯만큼 작업을 가져와 실행
+                while len(in_flight) < workers:
+                    job = claim_next_job()
+                    if job is None:
+                        break
+                    in_flight[executor.submit(run_summary_job_in_thread, job)] = job
+
+                if not in_flight:
+                    if options['once']:
+                        break
+                    time.sleep(options['interval'])
+                    continue
+
+                done, _ = wait(in_flight, timeout=options['interval'], return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = in_flight.pop(future)
+                    try:
+                        job = future.result()
+                    except Exception as e:
+                        # 결과를 기록하지 못한 작업은 running으로 남고, 임대가 만료되면 다시 대기열에 들어갑니다.
+                        logger.exception("요약 작업 %s 처리 중 오류", job.id)
+                        self.stdout.write(self.style.ERROR(f"작업 {job.id} 처리 중 오류: {e}"))
+                        continue
+                    if job.status == SummaryJob.STATUS_SUCCEEDED:
+                        self.stdout.write(self.style.SUCCESS(
+                            f"작업 {job.id} 완료: '{job.project.project_name}' 요약 {job.summary_id}"
+                        ))
+                    elif job.status == SummaryJob.STATUS_PENDING:
+                        self.stdout.write(self.style.WARNING(f"작업 {job.id} 재시도 예정 ({job.run_after}): {job.error}"))
+                    elif job.status == SummaryJob.STATUS_FAILED:
+                        self.stdout.write(self.style.ERROR(f"작업 {job.id} 실패: {job.error}"))
+                    else:
+                        self.stdout.write(f"작업 {job.id}은(는) 다른 워커가 다시 가져갔습니다.")
+
+                # 아직 실행 중인 작업의 임대 연장
+                if in_flight:
+                    renew_job_leases([job.id for job in in_flight.values()])
+
+        self.stdout.write("대기 중인 요약 작업이 없습니다.")
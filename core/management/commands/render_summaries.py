@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from core.blobs import BlobRef
+from core.markdown_render import clear_render_cache, render_all, renderer_key
+from core.models import RenderedMarkdown, Summary
+
+
+class Command(BaseCommand):
+    help = "요약 Markdown을 현재 렌더러 설정(MARKDOWN_EXTENSIONS 등)으로 미리 렌더링해 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="저장된 결과가 있어도 다시 렌더링")
+        parser.add_argument('--batch-size', type=int, default=200, help="한 번에 읽는 요약 수")
+        parser.add_argument(
+            '--keep-stale', action='store_true',
+            help="다른 렌더러 설정의 결과와 더 이상 쓰이지 않는 결과를 삭제하지 않음"
+        )
+
+    def handle(self, *args, **options):
+        renderer = renderer_key()
+        self.stdout.write(f"렌더러 설정 키: {renderer[:12]}")
+
+        summaries = Summary.objects.with_blobs().order_by('id').iterator(chunk_size=options['batch_size'])
+        rendered = render_all(summaries, force=options['force'])
+        self.stdout.write(self.style.SUCCESS(f"새로 렌더링한 요약: {rendered}개"))
+
+        if not options['keep_stale']:
+            referenced = {
+                ref.sha256 if isinstance(ref, BlobRef) else ref
+                for ref in Summary.objects.values_list('content', flat=True).iterator()
+            }
+            stale = RenderedMarkdown.objects.exclude(renderer=renderer)
+            unused = RenderedMarkdown.objects.filter(renderer=renderer).exclude(content_hash__in=referenced)
+            deleted = stale.delete()[0] + unused.delete()[0]
+            self.stdout.write(f"삭제한 이전 렌더링 결과: {deleted}개")
+        clear_render_cache()
@@ -0,0 +1,155 @@
+"""
+요약 Markdown의 HTML 렌더링 캐시.
+
+codehilite(Pygments) 렌더링은 긴 요약에서 느리므로, 원문 내용 해시와 렌더러 설정(MARKDOWN_EXTENSIONS,
+markdown/Pygments 버전)별로 한 번만 렌더링해 RenderedMarkdown에 저장합니다.
+자주 쓰는 결과는 프로세스 안의 LRU 캐시(MARKDOWN_RENDER_CACHE_SIZE개)에도 둡니다.
+
+저장은 요약을 저장할 때(signals.py, 커밋 후)와 render_summaries 명령에서만 합니다.
+조회(GET)에서 저장된 결과가 없으면 메모리에서만 렌더링하고 DB에는 쓰지 않습니다.
+
+렌더러 설정이 바뀌면 키가 달라지므로 자동으로 다시 렌더링되며,
+render_summaries 명령으로 미리 다시 렌더링하고 예전 결과를 정리할 수 있습니다.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import markdown
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from .blobs import blob_hash
+from .models import RenderedMarkdown
+
+
+def renderer_key():
+    """렌더러 설정 키 (확장 목록과 markdown/Pygments 버전의 해시)"""
+    try:
+        import pygments
+        pygments_version = pygments.__version__
+    except ImportError:
+        pygments_version = ''
+    config = {
+        'extensions': list(settings.MARKDOWN_EXTENSIONS),
+        'markdown': markdown.__version__,
+        'pygments': pygments_version,
+    }
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def render_markdown(text):
+    return markdown.markdown(text, extensions=settings.MARKDOWN_EXTENSIONS)
+
+
+class _LRUCache:
+    def __init__(self):
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            html = self._items.get(key)
+            if html is not None:
+                self._items.move_to_end(key)
+            return html
+
+    def set(self, key, html):
+        with self._lock:
+            self._items[key] = html
+            self._items.move_to_end(key)
+            while len(self._items) > settings.MARKDOWN_RENDER_CACHE_SIZE:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_cache = _LRUCache()
+
+
+def _store(content_hash, renderer, html):
+    try:
+        # 세이브포인트 안에서 저장해, 충돌해도 바깥 트랜잭션(ATOMIC_REQUESTS 등)은 계속 사용할 수 있게 합니다.
+        with transaction.atomic():
+            RenderedMarkdown.objects.create(content_hash=content_hash, renderer=renderer, html=html)
+    except IntegrityError:
+        # 다른 요청이 먼저 저장한 경우
+        pass
+
+
+def rendered_html(instance, field_name='content'):
+    """
+    모델 인스턴스의 Markdown 필드를 렌더링한 HTML. 저장된 결과가 없을 때만 렌더링합니다.
+    읽기 전용: 새로 렌더링한 결과는 프로세스 캐시에만 두고 DB에 저장하지 않습니다.
+    """
+    content_hash = blob_hash(instance, field_name)
+    if content_hash is None:
+        return ''
+    renderer = renderer_key()
+    html = _cache.get((content_hash, renderer))
+    if html is None:
+        rendered = (
+            RenderedMarkdown.objects.with_blobs()
+            .filter(content_hash=content_hash, renderer=renderer)
+            .first()
+        )
+        html = rendered.html if rendered else render_markdown(getattr(instance, field_name))
+        _cache.set((content_hash, renderer), html)
+    return html
+
+
+def store_rendered_html(instance, field_name='content'):
+    """인스턴스의 렌더링 결과를 저장합니다. (저장 경로용) 이미 저장돼 있으면 아무것도 하지 않습니다."""
+    content_hash = blob_hash(instance, field_name)
+    if content_hash is None:
+        return
+    renderer = renderer_key()
+    if RenderedMarkdown.objects.filter(content_hash=content_hash, renderer=renderer).exists():
+        return
+    # 조회에서 이미 렌더링한 결과가 있으면 다시 렌더링하지 않습니다.
+    html = _cache.get((content_hash, renderer)) or render_markdown(getattr(instance, field_name))
+    _store(content_hash, renderer, html)
+    _cache.set((content_hash, renderer), html)
+
+
+def prefetch_rendered_html(instances, field_name='content'):
+    """여러 인스턴스의 렌더링 결과를 한 번의 쿼리로 프로세스 캐시에 올립니다. (목록 직렬화용)"""
+    renderer = renderer_key()
+    hashes = {blob_hash(instance, field_name) for instance in instances} - {None}
+    missing = [content_hash for content_hash in hashes if _cache.get((content_hash, renderer)) is None]
+    if not missing:
+        return
+    for rendered in RenderedMarkdown.objects.with_blobs().filter(content_hash__in=missing, renderer=renderer):
+        _cache.set((rendered.content_hash, renderer), rendered.html)
+
+
+def render_all(instances, field_name='content', force=False):
+    """
+    인스턴스들의 렌더링 결과를 현재 렌더러 설정으로 미리 만듭니다.
+    force이면 저장된 결과가 있어도 다시 렌더링합니다. 새로 렌더링한 개수를 반환합니다.
+    """
+    renderer = renderer_key()
+    rendered_count = 0
+    seen = set()
+    for instance in instances:
+        content_hash = blob_hash(instance, field_name)
+        if content_hash is None or content_hash in seen:
+            continue
+        seen.add(content_hash)
+        existing = RenderedMarkdown.objects.filter(content_hash=content_hash, renderer=renderer)
+        if existing.exists():
+            if not force:
+                continue
+            existing.delete()
+        html = render_markdown(getattr(instance, field_name))
+        _store(content_hash, renderer, html)
+        _cache.set((content_hash, renderer), html)
+        rendered_count += 1
+    return rendered_count
+
+
+def clear_render_cache():
+    _cache.clear()
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_item_is_active'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectmaterial',
+            name='code_watermark',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='projectmaterial',
+            name='keyword_watermark',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_summary_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='airequest',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='airequest',
+            name='model_name',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+    ]
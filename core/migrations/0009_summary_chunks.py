@@ -0,0 +1,35 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_airequest_cache_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='summaryjob',
+            name='mode',
+            field=models.CharField(choices=[('auto', 'Auto'), ('single', 'Single'), ('map_reduce', 'Map-Reduce')], default='auto', max_length=20),
+        ),
+        migrations.CreateModel(
+            name='SummaryChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('chunk_hash', models.CharField(max_length=64)),
+                ('item_ids', models.JSONField(default=list)),
+                ('content', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('ai_request', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.airequest')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='summary_chunks', to='core.project')),
+            ],
+            options={
+                'db_table': 'summary_chunks',
+                'constraints': [models.UniqueConstraint(fields=('project', 'chunk_hash'), name='unique_summary_chunk')],
+            },
+        ),
+    ]
@@ -0,0 +1,156 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:40
+
+import hashlib
+import logging
+import zlib
+
+from django.db import migrations, models
+
+import core.blobs
+
+logger = logging.getLogger(__name__)
+
+# 블롭 저장소로 옮기는 (모델, 텍스트 필드) 목록
+BLOB_COLUMNS = [
+    ('AIRequest', ('input', 'output')),
+    ('Summary', ('content',)),
+    ('SummaryChunk', ('content',)),
+]
+
+
+# 이 마이그레이션이 쓰는 저장 형식 (core.blobs와 같음). 현재 설정이나 코드가 바뀌어도 결과가 달라지지 않도록
+# 코덱을 zlib으로 고정해 여기에 둡니다.
+RAW_CODEC = b'r'
+ZLIB_CODEC = b'z'
+ZSTD_CODEC = b's'
+MIN_COMPRESS_SIZE = 64
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def compress_text(text):
+    raw = text.encode('utf-8')
+    if len(raw) < MIN_COMPRESS_SIZE:
+        return RAW_CODEC + raw
+    data = zlib.compress(raw, 9)
+    if len(data) >= len(raw):
+        return RAW_CODEC + raw
+    return ZLIB_CODEC + data
+
+
+def decompress_text(data):
+    data = bytes(data)
+    codec, payload = data[:1], data[1:]
+    if codec == RAW_CODEC:
+        raw = payload
+    elif codec == ZLIB_CODEC:
+        raw = zlib.decompress(payload)
+    elif codec == ZSTD_CODEC:
+        # 마이그레이션 이후 zstd로 저장된 블롭을 되돌리는 경우
+        import zstandard
+        raw = zstandard.ZstdDecompressor().decompress(payload)
+    else:
+        raise ValueError(f"알 수 없는 블롭 코덱: {codec!r}")
+    return raw.decode('utf-8')
+
+
+def pack_texts(apps, schema_editor):
+    """기존 텍스트를 압축 블롭으로 옮기고 열에는 내용 해시를 남깁니다. 절약된 용량을 로그로 남깁니다."""
+    TextBlob = apps.get_model('core', 'TextBlob')
+    known = set(TextBlob.objects.values_list('sha256', flat=True))
+    text_bytes = 0
+    blob_bytes = 0
+    values_count = 0
+
+    for model_name, field_names in BLOB_COLUMNS:
+        model = apps.get_model('core', model_name)
+        rows = []
+        blobs = []
+        for row in model.objects.values('id', *field_names).iterator():
+            obj = model(id=row['id'])
+            for name in field_names:
+                text = row[name] or ''
+                sha256 = text_hash(text)
+                text_bytes += len(text.encode('utf-8'))
+                values_count += 1
+                if sha256 not in known:
+                    data = compress_text(text)
+                    blobs.append(TextBlob(sha256=sha256, data=data, size=len(text.encode('utf-8'))))
+                    blob_bytes += len(data)
+                    known.add(sha256)
+                setattr(obj, name, sha256)
+            rows.append(obj)
+        TextBlob.objects.bulk_create(blobs, batch_size=500)
+        model.objects.bulk_update(rows, field_names, batch_size=500)
+
+    if values_count:
+        hash_bytes = values_count * 64
+        reclaimed = text_bytes - blob_bytes - hash_bytes
+        logger.info(
+            "텍스트 %s개 %s bytes -> 블롭 %s개 %s bytes + 해시 %s bytes (절약 %s bytes). "
+            "SQLite 파일 크기를 줄이려면 VACUUM을 실행하세요.",
+            values_count, f"{text_bytes:,}", len(known), f"{blob_bytes:,}", f"{hash_bytes:,}", f"{reclaimed:,}",
+        )
+
+
+def unpack_texts(apps, schema_editor):
+    TextBlob = apps.get_model('core', 'TextBlob')
+    texts = {
+        sha256: decompress_text(data)
+        for sha256, data in TextBlob.objects.values_list('sha256', 'data').iterator()
+    }
+    for model_name, field_names in BLOB_COLUMNS:
+        model = apps.get_model('core', model_name)
+        rows = []
+        for row in model.objects.values('id', *field_names).iterator():
+            obj = model(id=row['id'])
+            for name in field_names:
+                setattr(obj, name, texts.get(row[name], ''))
+            rows.append(obj)
+        model.objects.bulk_update(rows, field_names, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_summary_chunks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TextBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('data', models.BinaryField()),
+                ('size', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'text_blobs',
+            },
+        ),
+        migrations.RunPython(pack_texts, unpack_texts),
+        migrations.AlterField(
+            model_name='airequest',
+            name='input',
+            field=core.blobs.BlobTextField(),
+        ),
+        migrations.AlterField(
+            model_name='airequest',
+            name='output',
+            field=core.blobs.BlobTextField(),
+        ),
+        migrations.AlterField(
+            model_name='summary',
+            name='content',
+            field=core.blobs.BlobTextField(),
+        ),
+        migrations.AlterField(
+            model_name='summarychunk',
+            name='content',
+            field=core.blobs.BlobTextField(),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:43
+
+from django.db import migrations, models
+
+import core.blobs
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_text_blobs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RenderedMarkdown',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64)),
+                ('renderer', models.CharField(max_length=64)),
+                ('html', core.blobs.BlobTextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'rendered_markdown',
+                'constraints': [models.UniqueConstraint(fields=('content_hash', 'renderer'), name='unique_rendered_markdown')],
+            },
+        ),
+    ]
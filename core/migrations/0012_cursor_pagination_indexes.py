@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_rendered_markdown'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['created_at', 'id'], name='item_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['project', 'created_at', 'id'], name='item_project_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recommendation',
+            index=models.Index(fields=['created_at', 'id'], name='rec_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recommendation',
+            index=models.Index(fields=['project', 'created_at', 'id'], name='rec_project_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='summary',
+            index=models.Index(fields=['created_at', 'id'], name='summary_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='summary',
+            index=models.Index(fields=['project', 'created_at', 'id'], name='summary_project_created_idx'),
+        ),
+    ]
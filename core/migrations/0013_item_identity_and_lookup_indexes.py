@@ -0,0 +1,97 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:48
+
+import logging
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def merge_duplicate_items(apps, schema_editor):
+    """
+    같은 (project, link, project_material) 아이템을 가장 먼저 만든 것 하나로 합칩니다.
+
+    - is_fixed/is_active: 중복 중 하나라도 켜져 있으면 유지
+    - title/body 등 원본 데이터: 가장 최근에 갱신된 아이템의 값
+    - 추천: 남는 아이템으로 옮긴 뒤 같은 (item, project_material) 추천은 하나만 남김 (is_active는 하나라도 켜져 있으면 유지)
+
+    삭제한 행은 되돌릴 수 없으므로 병합 내역(남긴 id, 지운 id와 원래 값)을 로그로 남깁니다.
+    """
+    Item = apps.get_model('core', 'Item')
+    Recommendation = apps.get_model('core', 'Recommendation')
+    duplicates = (
+        Item.objects.values('project_id', 'link', 'project_material_id')
+        .annotate(keep_id=Min('id'), rows=Count('id'))
+        .filter(rows__gt=1)
+    )
+    merged = 0
+    for group in duplicates:
+        items = list(
+            Item.objects.filter(
+                project_id=group['project_id'], link=group['link'],
+                project_material_id=group['project_material_id'],
+            ).order_by('id')
+        )
+        keep, extras = items[0], items[1:]
+        latest = max(items, key=lambda item: (item.updated_at, item.id))
+        extra_ids = [item.id for item in extras]
+        for item in extras:
+            logger.warning(
+                "중복 아이템 병합: %s -> %s (title=%r, is_fixed=%s, is_active=%s)",
+                item.id, keep.id, item.title, item.is_fixed, item.is_active,
+            )
+
+        Item.objects.filter(id=keep.id).update(
+            is_fixed=any(item.is_fixed for item in items),
+            is_active=any(item.is_active for item in items),
+            channel_name=latest.channel_name,
+            title=latest.title,
+            body=latest.body,
+            origin_data_created_at=latest.origin_data_created_at,
+            origin_data_updated_at=latest.origin_data_updated_at,
+            updated_at=timezone.now(),
+        )
+
+        Recommendation.objects.filter(item_id__in=extra_ids).update(item_id=keep.id)
+        recommendations = {}
+        for rec in Recommendation.objects.filter(item_id=keep.id).order_by('id'):
+            recommendations.setdefault(rec.project_material_id, []).append(rec)
+        for recs in recommendations.values():
+            if len(recs) < 2:
+                continue
+            Recommendation.objects.filter(id=recs[0].id).update(is_active=any(rec.is_active for rec in recs))
+            Recommendation.objects.filter(id__in=[rec.id for rec in recs[1:]]).delete()
+
+        Item.objects.filter(id__in=extra_ids).delete()
+        merged += len(extra_ids)
+    if merged:
+        logger.warning("중복 아이템 %s개 병합", merged)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_items, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['project', 'is_fixed'], name='item_project_fixed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['is_fixed'], name='item_fixed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recommendation',
+            index=models.Index(fields=['item', 'is_active'], name='rec_item_active_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='item',
+            constraint=models.UniqueConstraint(fields=('project', 'link', 'project_material'), name='unique_item_link'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_item_identity_and_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['project', 'updated_at'], name='item_project_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recommendation',
+            index=models.Index(fields=['project', 'updated_at'], name='rec_project_updated_idx'),
+        ),
+    ]
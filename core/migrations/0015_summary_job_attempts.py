@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-18 03:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_conditional_get_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='summaryjob',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='summaryjob',
+            name='run_after',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
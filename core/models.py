@@ -1,5 +1,7 @@
 from django.db import models
 
+from .blobs import BlobModel, BlobQuerySet, BlobTextField
+
 
 class Project(models.Model):
     author_email = models.EmailField()
@@ -27,6 +29,9 @@ class ProjectMaterial(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='materials')
     material_type = models.CharField(max_length=20, choices=MATERIAL_TYPE_CHOICES)
     material_link = models.URLField()
+    # 증분 매칭 워터마크: 매칭에서 확인한 외부 데이터의 최대 updated_at
+    keyword_watermark = models.DateTimeField(null=True, blank=True)
+    code_watermark = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -37,12 +42,32 @@ class ProjectMaterial(models.Model):
         db_table = 'project_materials'
 
 
-class AIRequest(models.Model):
-    input = models.TextField()
-    output = models.TextField()
+class TextBlob(models.Model):
+    """BlobTextField 값의 압축 저장소 (내용 해시 단위로 중복 제거)"""
+    sha256 = models.CharField(max_length=64, unique=True)
+    data = models.BinaryField()
+    # 압축 전 UTF-8 바이트 수
+    size = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Text Blob {self.sha256[:12]} ({self.size} bytes)"
+
+    class Meta:
+        db_table = 'text_blobs'
+
+
+class AIRequest(BlobModel):
+    input = BlobTextField()
+    output = BlobTextField()
     description = models.TextField()
+    # LLM 응답 캐시 키: sha256(모델명, 프롬프트 템플릿, 입력). 비어 있으면 캐시로 사용하지 않음
+    model_name = models.CharField(max_length=100, blank=True, default='')
+    content_hash = models.CharField(max_length=64, blank=True, default='', db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = BlobQuerySet.as_manager()
+
     def __str__(self):
         return f"AI Request {self.id} - {self.created_at}"
 
@@ -50,18 +75,44 @@ class AIRequest(models.Model):
         db_table = 'ai_requests'
 
 
-class Summary(models.Model):
+class Summary(BlobModel):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='summaries')
     ai_request = models.ForeignKey(AIRequest, on_delete=models.SET_NULL, null=True, blank=True)
-    content = models.TextField()
+    content = BlobTextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BlobQuerySet.as_manager()
+
     def __str__(self):
         return f"Summary for {self.project.project_name}"
 
     class Meta:
         db_table = 'summaries'
+        indexes = [
+            # 커서 페이지네이션 정렬 키 (created_at, id)
+            models.Index(fields=['created_at', 'id'], name='summary_created_id_idx'),
+            models.Index(fields=['project', 'created_at', 'id'], name='summary_project_created_idx'),
+        ]
+
+
+class RenderedMarkdown(BlobModel):
+    """Markdown 렌더링 결과 (원문 내용 해시와 렌더러 설정별로 한 번만 렌더링)"""
+    content_hash = models.CharField(max_length=64)
+    renderer = models.CharField(max_length=64)
+    html = BlobTextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = BlobQuerySet.as_manager()
+
+    def __str__(self):
+        return f"Rendered Markdown {self.content_hash[:12]} ({self.renderer[:8]})"
+
+    class Meta:
+        db_table = 'rendered_markdown'
+        constraints = [
+            models.UniqueConstraint(fields=['content_hash', 'renderer'], name='unique_rendered_markdown'),
+        ]
 
 
 class Item(models.Model):
@@ -83,6 +134,21 @@ class Item(models.Model):
 
     class Meta:
         db_table = 'items'
+        indexes = [
+            # 커서 페이지네이션 정렬 키 (created_at, id)
+            models.Index(fields=['created_at', 'id'], name='item_created_id_idx'),
+            models.Index(fields=['project', 'created_at', 'id'], name='item_project_created_idx'),
+            # 아이템 목록의 is_fixed 필터 (프로젝트 안/전체)
+            models.Index(fields=['project', 'is_fixed'], name='item_project_fixed_idx'),
+            models.Index(fields=['is_fixed'], name='item_fixed_idx'),
+            # 조건부 GET 검증 값 (프로젝트별 행 수와 최근 updated_at)
+            models.Index(fields=['project', 'updated_at'], name='item_project_updated_idx'),
+        ]
+        constraints = [
+            # 아이템 식별자: 같은 프로젝트 자료에서 같은 링크는 한 번만 저장 (upsert 기준)
+            # 외부 데이터 매칭이 project와 link로 기존 아이템을 찾으므로 link를 앞에 둡니다.
+            models.UniqueConstraint(fields=['project', 'link', 'project_material'], name='unique_item_link'),
+        ]
 
 
 class Recommendation(models.Model):
@@ -98,3 +164,73 @@ class Recommendation(models.Model):
 
     class Meta:
         db_table = 'recommendations'
+        indexes = [
+            # 커서 페이지네이션 정렬 키 (created_at, id)
+            models.Index(fields=['created_at', 'id'], name='rec_created_id_idx'),
+            models.Index(fields=['project', 'created_at', 'id'], name='rec_project_created_idx'),
+            # 아이템별 (활성) 추천 조회 (matching_recommendation, by_item)
+            models.Index(fields=['item', 'is_active'], name='rec_item_active_idx'),
+            # 조건부 GET 검증 값 (프로젝트별 행 수와 최근 updated_at)
+            models.Index(fields=['project', 'updated_at'], name='rec_project_updated_idx'),
+        ]
+
+
+class SummaryChunk(BlobModel):
+    """맵리듀스 요약의 부분 요약. 포함된 아이템 내용의 해시(chunk_hash)로 재사용 여부를 판단합니다."""
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='summary_chunks')
+    chunk_hash = models.CharField(max_length=64)
+    item_ids = models.JSONField(default=list)
+    ai_request = models.ForeignKey(AIRequest, on_delete=models.SET_NULL, null=True, blank=True)
+    content = BlobTextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = BlobQuerySet.as_manager()
+
+    def __str__(self):
+        return f"Summary Chunk {self.chunk_hash[:12]} - {self.project.project_name}"
+
+    class Meta:
+        db_table = 'summary_chunks'
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'chunk_hash'], name='unique_summary_chunk'),
+        ]
+
+
+class SummaryJob(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_SUCCEEDED, 'Succeeded'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    MODE_CHOICES = [
+        ('auto', 'Auto'),
+        ('single', 'Single'),
+        ('map_reduce', 'Map-Reduce'),
+    ]
+
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='summary_jobs')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True)
+    mode = models.CharField(max_length=20, choices=MODE_CHOICES, default='auto')
+    summary = models.ForeignKey(Summary, on_delete=models.SET_NULL, null=True, blank=True, related_name='jobs')
+    error = models.TextField(blank=True, default='')
+    # 실행 시도 횟수 (가져갈 때마다 1 증가, 429/503으로 미룬 시도는 세지 않음)
+    attempts = models.PositiveIntegerField(default=0)
+    # 이 시각 이후에 다시 가져감 (429/503으로 미룬 작업)
+    run_after = models.DateTimeField(null=True, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # running 작업은 워커가 주기적으로 갱신합니다. (임대 만료 판단 기준)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Summary Job {self.id} ({self.status}) - {self.project.project_name}"
+
+    class Meta:
+        db_table = 'summary_jobs'
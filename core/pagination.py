@@ -0,0 +1,163 @@
+"""
+목록 페이지네이션.
+
+기본은 기존과 같은 페이지 번호 방식(PageNumberPagination)이고,
+?pagination=cursor 또는 ?cursor=...로 요청하면 (created_at, id) 키셋 커서 방식으로 동작합니다.
+
+커서 방식은 COUNT(*)와 OFFSET 없이 마지막으로 본 행의 (created_at, id) 다음부터 읽으므로
+몇 번째 페이지든 같은 인덱스 범위 조회 한 번으로 끝납니다. 전체 개수는 ?count=true일 때만 셉니다.
+"""
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    remove_query_param,
+    replace_query_param,
+)
+from rest_framework.response import Response
+
+NEXT = 'n'
+PREVIOUS = 'p'
+
+
+def encode_cursor(direction, created_at, pk):
+    payload = json.dumps([direction, created_at.isoformat(), pk], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """커서 문자열을 (방향, created_at, id)로 풀어냅니다. 잘못된 커서면 NotFound."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        direction, created_at, pk = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if direction not in (NEXT, PREVIOUS):
+            raise ValueError(direction)
+        return direction, datetime.fromisoformat(created_at), int(pk)
+    except (binascii.Error, UnicodeError, TypeError, ValueError):
+        raise NotFound("잘못된 커서입니다.")
+
+
+class KeysetPagination(BasePagination):
+    """
+    (created_at, id) 내림차순(최신순) 키셋 페이지네이션.
+    응답: {"next": 커서 URL, "previous": 커서 URL, "results": [...]} (+ ?count=true이면 "count")
+    """
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+
+    def __init__(self, page_size):
+        self.page_size = page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        cursor = request.query_params.get(self.cursor_query_param)
+        direction, created_at, pk = decode_cursor(cursor) if cursor else (NEXT, None, None)
+
+        include_count = request.query_params.get(self.count_query_param, '').lower() in ('1', 'true', 'yes')
+        self.count = queryset.count() if include_count else None
+
+        rows = queryset
+        if direction == NEXT:
+            if created_at is not None:
+                rows = rows.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+            rows = rows.order_by('-created_at', '-id')
+        else:
+            # 이전 페이지는 반대 방향으로 읽은 뒤 뒤집습니다.
+            rows = rows.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+            rows = rows.order_by('created_at', 'id')
+
+        # 한 행 더 읽어 다음(이전) 페이지가 있는지 확인합니다.
+        page = list(rows[:self.page_size + 1])
+        has_more = len(page) > self.page_size
+        page = page[:self.page_size]
+        if direction == NEXT:
+            self.has_next, self.has_previous = has_more, created_at is not None
+        else:
+            page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        self.page = page
+        return page
+
+    def _cursor_link(self, direction, row):
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.cursor_query_param, encode_cursor(direction, row.created_at, row.pk))
+        return remove_query_param(url, 'page')
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._cursor_link(NEXT, self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._cursor_link(PREVIOUS, self.page[0])
+
+    def get_paginated_response(self, data):
+        response_data = OrderedDict()
+        if self.count is not None:
+            response_data['count'] = self.count
+        response_data['next'] = self.get_next_link()
+        response_data['previous'] = self.get_previous_link()
+        response_data['results'] = data
+        return Response(response_data)
+
+
+class PageOrCursorPagination(PageNumberPagination):
+    """
+    기본은 페이지 번호 방식, ?pagination=cursor 또는 ?cursor=...이면 KeysetPagination으로 동작합니다.
+    (created_at, id 필드가 있는 모델에서 사용)
+    """
+    mode_query_param = 'pagination'
+
+    def use_cursor(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == 'cursor'
+            or KeysetPagination.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.use_cursor(request):
+            self.keyset = KeysetPagination(self.page_size)
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters += [
+            {
+                'name': self.mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': "'cursor'이면 (created_at, id) 최신순 커서 페이지네이션 사용 (COUNT/OFFSET 없음)",
+                'schema': {'type': 'string', 'enum': ['page', 'cursor']},
+            },
+            {
+                'name': KeysetPagination.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': "커서 페이지네이션의 next/previous 링크에 포함된 커서 값",
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': KeysetPagination.count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': "커서 페이지네이션에서 전체 개수(count)를 포함 (COUNT 쿼리 1회 추가)",
+                'schema': {'type': 'boolean'},
+            },
+        ]
+        return parameters
@@ -0,0 +1,77 @@
+"""
+API 응답 렌더러.
+
+- FastJSONRenderer (기본): orjson이 설치되어 있으면 orjson으로 직렬화합니다.
+  datetime/UUID 등은 orjson이 직접 처리하고, 출력은 DRF JSONRenderer와 같습니다. (UTF-8, 공백 없음, datetime의 UTC는 'Z')
+  orjson이 없거나 들여쓰기(; indent=4)를 요청하면 DRF JSONRenderer로 렌더링합니다.
+- MessagePackRenderer: Accept: application/msgpack (또는 ?format=msgpack)인 내부 클라이언트용.
+  msgpack 패키지가 필요하며, 없으면 협상 대상에서 빠집니다. (msgpack만 받는 요청은 406)
+
+렌더링 시간과 응답 크기 비교: python manage.py benchmark_renderers
+"""
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+
+def _orjson():
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+
+# orjson/msgpack이 직접 처리하지 못하는 값(Decimal, 지연 번역 문자열 등)은 DRF 인코더 규칙을 따릅니다.
+_encoder = encoders.JSONEncoder()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """orjson을 사용하는 JSONRenderer (orjson이 없으면 DRF JSONRenderer와 같음)"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        orjson = _orjson()
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_encoder.default, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+        # DRF JSONRenderer와 같이 U+2028/U+2029를 이스케이프합니다. (JavaScript에 그대로 넣을 수 있는 JSON)
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class MessagePackRenderer(BaseRenderer):
+    """MessagePack 렌더러 (datetime 등은 JSON 응답과 같은 문자열로 보냄)"""
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    @staticmethod
+    def is_available():
+        return _msgpack() is not None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return _msgpack().packb(data, default=_encoder.default, use_bin_type=True)
+
+
+class AvailableRendererNegotiation(DefaultContentNegotiation):
+    """필요한 패키지가 없는 렌더러(is_available()이 False)를 제외하고 협상합니다."""
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        renderers = [
+            renderer for renderer in renderers
+            if getattr(renderer, 'is_available', None) is None or renderer.is_available()
+        ]
+        return super().select_renderer(request, renderers, format_suffix)
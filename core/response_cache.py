@@ -0,0 +1,151 @@
+"""
+조회 API 응답 캐시.
+
+렌더링된 응답을 Django 캐시(CACHES['default'], locmem 또는 파일)에 저장합니다.
+캐시 키에는 버전 토큰이 들어갑니다.
+- 프로젝트 범위 요청(/api/projects/{id}/..., ?project_id=): 그 프로젝트의 버전
+- 그 밖의 요청(전체 목록, 개별 아이템 등): 전역 버전
+
+버전 토큰은 응답과 달리 CACHES['response-versions'](파일 캐시)에 두므로, locmem으로 응답을 캐시해도
+워커(관리 명령) 프로세스의 무효화가 웹 서버 프로세스에 전달됩니다.
+무효화는 카운터를 올리지 않고 새 토큰을 쓰므로 여러 프로세스가 동시에 무효화해도 갱신을 잃지 않습니다.
+
+Item/Recommendation/Summary/ProjectMaterial/Project가 저장·삭제되면(signals.py) 해당 프로젝트와 전역 버전이 바뀌므로,
+쓰기는 그 프로젝트의 항목과 전역 항목만 무효화합니다. 예전 버전의 항목은 쓰이지 않고 시간이 지나면 만료됩니다.
+bulk_create/update()처럼 시그널이 없는 쓰기 뒤에는 bump_project_version()을 직접 호출해야 합니다.
+
+적중/실패 횟수는 프로세스별로 세며 response_cache_stats()로 확인할 수 있습니다. (/api/cache-stats/)
+"""
+import functools
+import hashlib
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, parse_http_date_safe
+
+GLOBAL_SCOPE = 'all'
+VERSIONS_CACHE = 'response-versions'
+# 캐시 적중 응답에 그대로 돌려줄 헤더
+STORED_HEADERS = ('ETag', 'Last-Modified', 'Vary')
+
+_stats = {'hits': 0, 'misses': 0}
+_stats_lock = threading.Lock()
+
+
+def _version_key(scope):
+    return f"response-cache:version:{scope}"
+
+
+def get_version(scope):
+    versions = caches[VERSIONS_CACHE]
+    version = versions.get(_version_key(scope))
+    if version is None:
+        # 버전이 없거나 지워진 경우에도 예전 항목과 겹치지 않도록 새 토큰으로 시작합니다.
+        versions.add(_version_key(scope), uuid.uuid4().hex, timeout=None)
+        version = versions.get(_version_key(scope))
+    return version
+
+
+def bump_version(scope):
+    caches[VERSIONS_CACHE].set(_version_key(scope), uuid.uuid4().hex, timeout=None)
+
+
+def bump_project_version(project_id):
+    """프로젝트 범위 항목과 전역 항목을 무효화합니다."""
+    bump_version(f"project:{project_id}")
+    bump_version(GLOBAL_SCOPE)
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def response_cache_stats():
+    """이 프로세스의 적중/실패 횟수"""
+    with _stats_lock:
+        hits, misses = _stats['hits'], _stats['misses']
+    total = hits + misses
+    return {
+        'backend': settings.CACHES['default']['BACKEND'],
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else 0.0,
+    }
+
+
+def reset_response_cache_stats():
+    with _stats_lock:
+        _stats.update(hits=0, misses=0)
+
+
+class ResponseCacheMixin:
+    """
+    list/retrieve(와 cached_action을 붙인 액션)의 GET 응답을 캐시하는 뷰셋 믹스인.
+    브라우저블 API(HTML)는 요청마다 달라지므로 캐시하지 않습니다.
+    """
+
+    def get_cache_project_id(self):
+        """캐시 버전 범위가 되는 프로젝트 ID (없으면 전역 버전 사용)"""
+        return self.request.query_params.get('project_id')
+
+    def response_cache_key(self, request):
+        project_id = self.get_cache_project_id()
+        scope = f"project:{project_id}" if project_id else GLOBAL_SCOPE
+        path = f"{request.accepted_renderer.format}:{request.get_full_path()}"
+        digest = hashlib.sha256(path.encode('utf-8')).hexdigest()
+        return f"response-cache:{scope}:{get_version(scope)}:{digest}"
+
+    def cached_response(self, view, request, *args, **kwargs):
+        timeout = settings.RESPONSE_CACHE_TIMEOUT
+        if not timeout or request.method != 'GET' or request.accepted_renderer.format == 'api':
+            return view(request, *args, **kwargs)
+
+        key = self.response_cache_key(request)
+        entry = cache.get(key)
+        if entry is not None:
+            _count('hits')
+            return self.cached_entry_response(request, entry)
+        _count('misses')
+
+        response = self.finalize_response(request, view(request, *args, **kwargs), *args, **kwargs)
+        if response.status_code == 200:
+            response.render()
+            cache.set(key, {
+                'content': response.content,
+                'content_type': response['Content-Type'],
+                'headers': {name: response[name] for name in STORED_HEADERS if response.has_header(name)},
+            }, timeout)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def cached_entry_response(self, request, entry):
+        headers = entry['headers']
+        last_modified = parse_http_date_safe(headers['Last-Modified']) if 'Last-Modified' in headers else None
+        # 저장된 ETag/Last-Modified로 조건부 GET도 DB 조회 없이 처리합니다.
+        response = get_conditional_response(
+            request._request, etag=headers.get('ETag'), last_modified=last_modified
+        )
+        if response is None:
+            response = HttpResponse(entry['content'], content_type=entry['content_type'])
+        for name, value in headers.items():
+            response[name] = value
+        response['X-Cache'] = 'HIT'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+
+def cached_action(method):
+    """뷰셋 액션의 GET 응답을 ResponseCacheMixin으로 캐시합니다. (@action 아래에 붙입니다)"""
+    @functools.wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        return self.cached_response(functools.partial(method, self), request, *args, **kwargs)
+    return wrapper
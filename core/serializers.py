@@ -1,40 +1,89 @@
+from django.urls import reverse
 from rest_framework import serializers
-from .models import Project, ProjectMaterial, AIRequest, Summary, Item, Recommendation
+from .markdown_render import prefetch_rendered_html, rendered_html
+from .models import Project, ProjectMaterial, AIRequest, Summary, SummaryJob, Item, Recommendation
+from .sparse_fields import SparseFieldsMixin
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = '__all__'
         read_only_fields = ('created_at', 'updated_at')
 
 
-class ProjectMaterialSerializer(serializers.ModelSerializer):
+class ProjectMaterialSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     project_name = serializers.CharField(source='project.project_name', read_only=True)
     
     class Meta:
         model = ProjectMaterial
         fields = '__all__'
-        read_only_fields = ('created_at', 'updated_at')
+        read_only_fields = ('keyword_watermark', 'code_watermark', 'created_at', 'updated_at')
+        expandable_fields = {'project_name': ('project',)}
 
 
-class AIRequestSerializer(serializers.ModelSerializer):
+class AIRequestSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = AIRequest
         fields = '__all__'
-        read_only_fields = ('created_at',)
+        read_only_fields = ('model_name', 'content_hash', 'created_at')
+
+
+def include_rendered_html(context):
+    """rendered_html 필드를 포함할지 여부 (?rendered_html=true 또는 context['rendered_html'])"""
+    if context.get('rendered_html'):
+        return True
+    request = context.get('request')
+    if request is None:
+        return False
+    return request.query_params.get('rendered_html', '').lower() in ('1', 'true', 'yes')
 
 
-class SummarySerializer(serializers.ModelSerializer):
+class SummaryListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        summaries = list(data.all() if hasattr(data, 'all') else data)
+        if include_rendered_html(self.context):
+            # 목록의 렌더링 결과를 한 번에 가져옵니다.
+            prefetch_rendered_html(summaries)
+        return super().to_representation(summaries)
+
+
+class SummarySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     project_name = serializers.CharField(source='project.project_name', read_only=True)
+    rendered_html = serializers.SerializerMethodField()
     
     class Meta:
         model = Summary
         fields = '__all__'
         read_only_fields = ('created_at', 'updated_at')
+        list_serializer_class = SummaryListSerializer
+        expandable_fields = {'project_name': ('project',)}
+        # 렌더링 결과는 content의 내용 해시로 찾습니다.
+        field_dependencies = {'rendered_html': ('content',)}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # 렌더링 비용이 있으므로 요청한 경우에만 포함합니다.
+        if not include_rendered_html(self.context):
+            fields.pop('rendered_html', None)
+        return fields
 
+    def get_rendered_html(self, obj):
+        return rendered_html(obj)
 
-class ItemSerializer(serializers.ModelSerializer):
+
+class SummaryJobSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    project_name = serializers.CharField(source='project.project_name', read_only=True)
+    summary = SummarySerializer(read_only=True)
+    
+    class Meta:
+        model = SummaryJob
+        fields = '__all__'
+        read_only_fields = ('created_at', 'updated_at')
+        expandable_fields = {'project_name': ('project',)}
+
+
+class ItemSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     project_name = serializers.CharField(source='project.project_name', read_only=True)
     material_type = serializers.CharField(source='project_material.material_type', read_only=True)
     
@@ -42,9 +91,10 @@ class ItemSerializer(serializers.ModelSerializer):
         model = Item
         fields = '__all__'
         read_only_fields = ('created_at', 'updated_at')
+        expandable_fields = {'project_name': ('project',), 'material_type': ('project_material',)}
 
 
-class RecommendationSerializer(serializers.ModelSerializer):
+class RecommendationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     project_name = serializers.CharField(source='project.project_name', read_only=True)
     item_title = serializers.CharField(source='item.title', read_only=True)
     
@@ -52,22 +102,55 @@ class RecommendationSerializer(serializers.ModelSerializer):
         model = Recommendation
         fields = '__all__'
         read_only_fields = ('created_at', 'updated_at')
+        expandable_fields = {'project_name': ('project',), 'item_title': ('item',)}
+
+
+def project_list_url(context, url_name, project):
+    """프로젝트로 필터링한 페이지네이션 목록 엔드포인트 주소"""
+    url = f"{reverse(url_name)}?project_id={project.id}"
+    request = context.get('request')
+    return request.build_absolute_uri(url) if request is not None else url
 
 
 # Nested Serializers for detailed views
-class ProjectDetailSerializer(serializers.ModelSerializer):
-    materials = ProjectMaterialSerializer(many=True, read_only=True)
-    items = ItemSerializer(many=True, read_only=True)
-    summaries = SummarySerializer(many=True, read_only=True)
-    recommendations = RecommendationSerializer(many=True, read_only=True)
+class ProjectDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """
+    하위 목록은 최신순으로 PROJECT_DETAIL_NESTED_LIMIT개까지만 포함합니다.
+    *_count는 전체 개수, *_url은 전체 목록을 페이지 단위로 조회하는 엔드포인트입니다.
+    (project_detail_queryset으로 가져온 프로젝트의 recent_<목록>과 <목록>_count를 사용합니다.)
+    """
+    materials = ProjectMaterialSerializer(source='recent_materials', many=True, read_only=True)
+    materials_count = serializers.IntegerField(read_only=True)
+    materials_url = serializers.SerializerMethodField()
+    items = ItemSerializer(source='recent_items', many=True, read_only=True)
+    items_count = serializers.IntegerField(read_only=True)
+    items_url = serializers.SerializerMethodField()
+    summaries = SummarySerializer(source='recent_summaries', many=True, read_only=True)
+    summaries_count = serializers.IntegerField(read_only=True)
+    summaries_url = serializers.SerializerMethodField()
+    recommendations = RecommendationSerializer(source='recent_recommendations', many=True, read_only=True)
+    recommendations_count = serializers.IntegerField(read_only=True)
+    recommendations_url = serializers.SerializerMethodField()
     
     class Meta:
         model = Project
         fields = '__all__'
         read_only_fields = ('created_at', 'updated_at')
 
+    def get_materials_url(self, obj) -> str:
+        return project_list_url(self.context, 'projectmaterial-list', obj)
 
-class ProjectMaterialDetailSerializer(serializers.ModelSerializer):
+    def get_items_url(self, obj) -> str:
+        return project_list_url(self.context, 'item-list', obj)
+
+    def get_summaries_url(self, obj) -> str:
+        return project_list_url(self.context, 'summary-list', obj)
+
+    def get_recommendations_url(self, obj) -> str:
+        return project_list_url(self.context, 'recommendation-list', obj)
+
+
+class ProjectMaterialDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     project = ProjectSerializer(read_only=True)
     items = ItemSerializer(many=True, read_only=True)
     recommendations = RecommendationSerializer(many=True, read_only=True)
@@ -75,4 +158,4 @@ class ProjectMaterialDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = ProjectMaterial
         fields = '__all__'
-        read_only_fields = ('created_at', 'updated_at')
+        read_only_fields = ('keyword_watermark', 'code_watermark', 'created_at', 'updated_at')
@@ -0,0 +1,59 @@
+"""
+모델 변경 시그널.
+
+프로젝트에 속한 행이 저장·삭제되면 커밋 후 응답 캐시의 프로젝트 버전을 올립니다. (response_cache.py)
+행이 다른 프로젝트로 옮겨지면 이전 프로젝트와 새 프로젝트의 버전을 모두 올립니다.
+요약이 저장되면 커밋 후 Markdown 렌더링 결과를 저장합니다. (markdown_render.py, 조회에서는 저장하지 않음)
+"""
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .markdown_render import store_rendered_html
+from .models import Item, Project, ProjectMaterial, Recommendation, Summary
+from .response_cache import bump_project_version
+
+
+@receiver(pre_save, sender=Item)
+@receiver(pre_save, sender=Recommendation)
+@receiver(pre_save, sender=Summary)
+@receiver(pre_save, sender=ProjectMaterial)
+def remember_previous_project(sender, instance, update_fields=None, **kwargs):
+    """저장 전 DB의 project_id를 기억합니다. (프로젝트를 옮기면 이전 프로젝트의 캐시도 무효화)"""
+    instance._previous_project_id = None
+    if not settings.RESPONSE_CACHE_TIMEOUT or instance._state.adding or instance.pk is None:
+        # 응답 캐시를 쓰지 않으면 이전 프로젝트를 조회할 필요가 없습니다.
+        return
+    if update_fields is not None and 'project' not in update_fields and 'project_id' not in update_fields:
+        return
+    instance._previous_project_id = (
+        sender._default_manager.filter(pk=instance.pk).values_list('project_id', flat=True).first()
+    )
+
+
+@receiver([post_save, post_delete], sender=Item)
+@receiver([post_save, post_delete], sender=Recommendation)
+@receiver([post_save, post_delete], sender=Summary)
+@receiver([post_save, post_delete], sender=ProjectMaterial)
+def invalidate_project_responses(sender, instance, **kwargs):
+    project_ids = {instance.project_id, getattr(instance, '_previous_project_id', None)} - {None}
+
+    # 트랜잭션 안의 변경은 커밋된 뒤에 무효화해야 커밋 전 데이터가 새 버전으로 캐시되지 않습니다.
+    def bump():
+        for project_id in project_ids:
+            bump_project_version(project_id)
+
+    transaction.on_commit(bump)
+
+
+@receiver([post_save, post_delete], sender=Project)
+def invalidate_project(sender, instance, **kwargs):
+    project_id = instance.pk
+    transaction.on_commit(lambda: bump_project_version(project_id))
+
+
+@receiver(post_save, sender=Summary)
+def store_summary_html(sender, instance, **kwargs):
+    # 렌더링이 실패해도 이미 커밋된 요약 저장에는 영향을 주지 않습니다.
+    transaction.on_commit(lambda: store_rendered_html(instance), robust=True)
@@ -0,0 +1,169 @@
+"""
+?fields= / ?expand= 희소 필드셋.
+
+- ?fields=id,title: 응답에 포함할 필드를 고릅니다. (없으면 모든 기본 필드)
+- ?expand=project_name,material_type: 관련 모델을 읽어야 하는 필드(Meta.expandable_fields)는
+  요청한 경우에만 포함하고, 그때만 관련 모델을 JOIN합니다.
+
+sparse_queryset()은 직렬화기가 실제로 출력하는 필드만 .only()로 읽도록 쿼리셋을 줄이므로,
+요청하지 않은 열(Item.body, Summary.content 블롭 등)은 DB에서 읽지 않습니다.
+필드 선택은 요청 context가 있는 최상위 직렬화기에만 적용되고, 중첩된 직렬화기는 모든 필드를 출력합니다.
+?fields=는 응답만 줄입니다. 쓰기 요청(POST/PUT/PATCH)은 모든 필드로 검증/저장한 뒤 응답에서만 필드를 고릅니다.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+from .blobs import BlobTextField
+
+FIELDS_PARAM = 'fields'
+EXPAND_PARAM = 'expand'
+
+
+def query_names(request, param):
+    """쉼표로 구분된 쿼리 파라미터 값을 이름 집합으로 반환합니다. 파라미터가 없으면 None."""
+    if request is None or param not in request.query_params:
+        return None
+    return {name.strip() for name in request.query_params[param].split(',') if name.strip()}
+
+
+def output_names(request):
+    """응답에 남길 필드 이름: ?fields=로 고른 필드와 ?expand=로 확장한 필드. ?fields=가 없으면 None."""
+    requested = query_names(request, FIELDS_PARAM)
+    if requested is None:
+        return None
+    return requested | (query_names(request, EXPAND_PARAM) or set())
+
+
+class SparseFieldsMixin:
+    """
+    ?fields= / ?expand=를 지원하는 ModelSerializer 믹스인.
+
+    Meta.expandable_fields: {필드 이름: select_related 경로 목록} - ?expand=로 요청한 경우에만 포함
+    Meta.field_dependencies: {필드 이름: 읽는 모델 필드 목록} - 모델 필드가 아닌 계산 필드용
+    """
+
+    def is_sparse_root(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    def sparse_request(self):
+        """필드 선택을 적용할 요청. 요청 없이 직접 사용하는 경우(내부 호출)나 중첩된 직렬화기이면 None."""
+        request = self.context.get('request')
+        if request is None or not self.is_sparse_root():
+            return None
+        return request
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.sparse_request()
+        if request is None:
+            return fields
+        expand = query_names(request, EXPAND_PARAM) or set()
+        # 확장 필드는 읽기 전용이므로 쓰기 요청에서도 빼도 됩니다.
+        for name in getattr(self.Meta, 'expandable_fields', {}):
+            if name not in expand:
+                fields.pop(name, None)
+        # 쓰기 요청은 필드를 빼면 검증과 저장이 달라지므로 to_representation()에서 응답만 줄입니다.
+        keep = output_names(request)
+        if keep is not None and request.method in SAFE_METHODS:
+            for name in list(fields):
+                if name not in keep:
+                    fields.pop(name)
+        return fields
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        request = self.sparse_request()
+        if request is None or request.method in SAFE_METHODS:
+            return data
+        keep = output_names(request)
+        if keep is not None:
+            for name in list(data):
+                if name not in keep:
+                    del data[name]
+        return data
+
+
+def expanded_relations(serializer):
+    """직렬화기가 출력하는 확장 필드(expandable_fields)가 따라가는 관계"""
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    expandable = getattr(getattr(serializer, 'Meta', None), 'expandable_fields', {})
+    relations = set()
+    for name in serializer.fields:
+        relations.update(expandable.get(name, ()))
+    return relations
+
+
+def sparse_queryset(queryset, serializer, defer=True):
+    """
+    직렬화기가 출력하는 필드에 맞춰 쿼리셋을 줄입니다.
+    확장한 필드의 관계는 select_related하고, 출력하는 BlobTextField는 with_blobs로 함께 가져오며,
+    defer이면 나머지 열은 .only()로 읽지 않습니다.
+    """
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    model = queryset.model
+    meta = getattr(serializer, 'Meta', None)
+    expandable = getattr(meta, 'expandable_fields', {})
+    dependencies = getattr(meta, 'field_dependencies', {})
+
+    columns = {model._meta.pk.name}
+    relations = expanded_relations(serializer)
+    blobs = []
+    for name, field in serializer.fields.items():
+        if name in expandable:
+            columns.add(field.source.replace('.', '__'))
+            continue
+        for source in dependencies.get(name, (field.source,)):
+            try:
+                model_field = model._meta.get_field(source.split('.')[0])
+            except FieldDoesNotExist:
+                # 어노테이션이나 계산 필드
+                continue
+            if not model_field.concrete:
+                continue
+            columns.add(model_field.name)
+            if isinstance(model_field, BlobTextField) and name not in dependencies:
+                blobs.append(model_field.name)
+
+    # select_related/prefetch_related로 따라가는 관계의 외래 키는 항상 읽어야 합니다.
+    if isinstance(queryset.query.select_related, dict):
+        columns.update(queryset.query.select_related)
+    for lookup in queryset._prefetch_related_lookups:
+        path = getattr(lookup, 'prefetch_through', lookup)
+        try:
+            related = model._meta.get_field(path.split('__')[0])
+        except FieldDoesNotExist:
+            continue
+        if related.concrete:
+            columns.add(related.name)
+    columns.update(relation.split('__')[0] for relation in relations)
+
+    if relations:
+        queryset = queryset.select_related(*relations)
+    if blobs:
+        queryset = queryset.with_blobs(*blobs)
+    if defer:
+        queryset = queryset.only(*columns)
+    return queryset
+
+
+class SparseFieldsViewMixin:
+    """뷰셋의 쿼리셋을 직렬화기가 출력하는 필드에 맞춰 줄입니다. (조회 요청만 .only() 적용)"""
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        return self.sparse_queryset(queryset, self.get_serializer())
+
+    def sparse_queryset(self, queryset, serializer):
+        return sparse_queryset(queryset, serializer, defer=self.request.method in SAFE_METHODS)
+
+    def sparse_list_data(self, serializer_class, queryset):
+        """중첩 목록 액션용: 쿼리셋을 줄인 뒤 직렬화한 데이터를 반환합니다."""
+        context = self.get_serializer_context()
+        queryset = self.sparse_queryset(queryset, serializer_class(context=context))
+        return serializer_class(queryset, many=True, context=context).data
@@ -0,0 +1,602 @@
+"""
+프로젝트 아이템 요약 (Gemini 호출, AIRequest/Summary 저장, 비동기 요약 작업 처리).
+
+같은 모델, 프롬프트 템플릿, 입력으로 요청한 적이 있으면 저장된 AIRequest.output을 재사용합니다.
+(SUMMARY_CACHE_TTL 초 동안 유효, 최근 SUMMARY_CACHE_MAX_ENTRIES개까지 유지)
+
+아이템이 많은 프로젝트는 맵리듀스로 요약합니다. 아이템을 토큰 예산(SUMMARY_CHUNK_TOKEN_BUDGET) 단위
+청크로 나눠 청크별로 요약(map)하고, 부분 요약을 합쳐 최종 요약(reduce)을 만듭니다. 부분 요약은
+청크에 포함된 아이템 내용의 해시로 저장되고 청크 경계도 아이템 내용으로 정하므로, 내용이 바뀐 청크만
+다시 요약합니다. 부분 요약을 합쳐도 SUMMARY_MAX_INPUT_TOKENS를 넘으면 몇 개씩 묶어 중간 통합을 반복합니다.
+
+stream_summary_text()는 최종 요약 단계의 응답을 조각 단위로 생성하는 비동기 제너레이터입니다. (SSE 스트리밍용)
+aprepare_summary_request()는 SSE 요청용 비동기 버전으로, 부분 요약의 LLM 호출을 ORM을 실행하는 요청 스레드가
+아닌 별도 스레드에서 기다립니다.
+LLM 호출은 core.llm의 프로세스 공유 클라이언트(settings.LLM_BACKEND)를 사용하며, 프로세스 전체 호출 제한
+(LLMLimiter)을 거칩니다. 같은 프로젝트에 같은 입력으로 동시에 들어온 요약 요청은 하나의 LLM 호출과
+AIRequest/Summary를 공유합니다. (single-flight)
+"""
+import hashlib
+import logging
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, Q
+from django.utils import timezone
+from rest_framework import status
+
+from .llm import (
+    LLMError,
+    LLMOverloaded,
+    LLMRateLimited,
+    SingleFlight,
+    get_llm_client,
+    get_llm_limiter,
+)
+from .models import AIRequest, Summary, SummaryChunk, SummaryJob
+
+logger = logging.getLogger(__name__)
+
+
+SUMMARY_PROMPT_TEMPLATE = "하나의 프로젝트에 대한 다음의 자료를 보기 좋게 요약해줘\n\n자료: {input_text}"
+SUMMARY_CHUNK_PROMPT_TEMPLATE = "하나의 프로젝트에 대한 자료의 일부입니다. 중요한 내용을 빠뜨리지 말고 간결하게 요약해줘\n\n자료: {input_text}"
+SUMMARY_REDUCE_PROMPT_TEMPLATE = "하나의 프로젝트 자료를 나누어 요약한 부분 요약들입니다. 이를 하나로 합쳐 보기 좋게 요약해줘\n\n부분 요약: {input_text}"
+
+SUMMARY_MODES = ('auto', 'single', 'map_reduce')
+
+# 부분 요약 중간 통합의 최대 단계 수 (이후에는 예산을 넘더라도 최종 통합)
+MAX_REDUCE_LEVELS = 3
+
+# 요약 작업을 실패 대신 나중에 다시 실행하는 오류 (LLM 호출 빈도/대기열 한도)
+RETRYABLE_STATUS_CODES = (status.HTTP_429_TOO_MANY_REQUESTS, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+# 진행 중인 요약 요청 (프로젝트, 모드, 입력 해시) -> 공유할 결과
+_summary_flights = SingleFlight()
+
+
+class SummarizationError(Exception):
+    """요약 실패. status_code는 API 응답 상태 코드로 사용합니다."""
+
+    def __init__(self, detail, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+def llm_error_status(error):
+    """LLM 오류에 대응하는 API 응답 상태 코드"""
+    if isinstance(error, LLMRateLimited):
+        return status.HTTP_429_TOO_MANY_REQUESTS
+    if isinstance(error, LLMOverloaded):
+        return status.HTTP_503_SERVICE_UNAVAILABLE
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+def summary_item_texts(project):
+    """요약 대상 아이템(is_active=True, is_fixed=True)별 (아이템 ID, 입력 텍스트) 목록을 만듭니다."""
+    items = project.items.filter(is_active=True, is_fixed=True).order_by('id')
+
+    if not items:
+        raise SummarizationError("활성화되고 고정된 아이템이 없습니다.", status.HTTP_404_NOT_FOUND)
+
+    # title(없는 경우도 있음)과 body를 합쳐서 사용합니다.
+    item_texts = []
+    for item in items:
+        text_to_combine = item.body
+        if item.title:
+            text_to_combine = f"제목: {item.title}\n내용: {text_to_combine}"
+        item_texts.append((item.id, text_to_combine))
+
+    return item_texts
+
+
+def build_summary_input(project):
+    """요약 대상 아이템의 제목과 본문을 합친 입력 텍스트를 만듭니다."""
+    return "\n\n".join(text for _, text in summary_item_texts(project))
+
+
+def estimate_tokens(text):
+    """토큰 수 추정치 (UTF-8 바이트 수 / 4). 한국어는 글자당 약 0.75, 영어는 약 0.25 토큰."""
+    return len(text.encode('utf-8')) // 4 + 1
+
+
+def is_chunk_boundary(text, tokens, token_budget):
+    """아이템 뒤에서 청크를 자를지 아이템 내용의 해시로 정합니다. (토큰 수에 비례한 확률, 평균 청크는 예산의 절반)"""
+    digest = hashlib.sha256(text.encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'big') < min(1.0, 2 * tokens / token_budget) * 2 ** 32
+
+
+def split_into_chunks(item_texts, token_budget):
+    """
+    아이템을 순서대로 토큰 예산 안에 들어가도록 묶습니다. 예산보다 큰 아이템은 단독 청크가 됩니다.
+
+    청크 경계는 위치가 아니라 아이템 내용으로 정합니다. (is_chunk_boundary) 아이템 하나가 바뀌거나
+    추가/삭제돼도 그 주변 청크만 바뀌고, 이후 청크의 경계와 부분 요약은 그대로 재사용됩니다.
+    예산을 넘게 되면 해시와 상관없이 자릅니다.
+    """
+    chunks = []
+    current = []
+    current_tokens = 0
+    for item_id, text in item_texts:
+        tokens = estimate_tokens(text)
+        if current and current_tokens + tokens > token_budget:
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append((item_id, text))
+        current_tokens += tokens
+        if is_chunk_boundary(text, tokens, token_budget):
+            chunks.append(current)
+            current, current_tokens = [], 0
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def join_partial_summaries(partial_summaries):
+    return "\n\n".join(f"[{index}] {text}" for index, text in enumerate(partial_summaries, start=1))
+
+
+def generate_summary_text(input_text, prompt_template=SUMMARY_PROMPT_TEMPLATE):
+    """LLM으로 요약문을 생성합니다. 호출 자리가 없으면 429/503 SummarizationError를 냅니다."""
+    try:
+        with get_llm_limiter().slot():
+            return get_llm_client().generate(prompt_template.format(input_text=input_text))
+    except LLMError as e:
+        raise SummarizationError(f"LLM API 호출 실패: {e}", llm_error_status(e))
+
+
+async def stream_summary_text(input_text, prompt_template=SUMMARY_PROMPT_TEMPLATE):
+    """
+    LLM 스트리밍 생성으로 요약문을 조각 단위로 생성합니다. 이벤트 루프를 막지 않습니다.
+    호출 제한(get_llm_limiter)의 자리는 호출 측이 미리 얻어 둡니다.
+    """
+    try:
+        async for text in get_llm_client().stream(prompt_template.format(input_text=input_text)):
+            yield text
+    except LLMError as e:
+        raise SummarizationError(f"LLM API 호출 실패: {e}", llm_error_status(e))
+
+
+def prompt_hash(input_text, model_name=None, prompt_template=SUMMARY_PROMPT_TEMPLATE):
+    """LLM 응답 캐시 키 (모델명, 프롬프트 템플릿, 입력의 sha256). 모델명 기본값은 현재 클라이언트의 모델입니다."""
+    model_name = model_name or get_llm_client().model_name
+    digest = hashlib.sha256()
+    for part in (model_name, prompt_template, input_text):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def find_cached_ai_request(content_hash):
+    """TTL 안에 저장된 같은 키의 AIRequest를 반환합니다. 캐시가 꺼져 있거나 없으면 None."""
+    ttl = settings.SUMMARY_CACHE_TTL
+    if not ttl:
+        return None
+    return (
+        AIRequest.objects.with_blobs('output').filter(
+            content_hash=content_hash,
+            created_at__gte=timezone.now() - timedelta(seconds=ttl)
+        )
+        .order_by('-created_at')
+        .first()
+    )
+
+
+def evict_summary_cache():
+    """만료됐거나 최대 개수를 넘은 캐시 항목의 키를 지웁니다. (AIRequest 기록 자체는 남김)"""
+    ttl = settings.SUMMARY_CACHE_TTL
+    cached = AIRequest.objects.exclude(content_hash='')
+    evicted = 0
+    if ttl:
+        evicted += cached.filter(
+            created_at__lt=timezone.now() - timedelta(seconds=ttl)
+        ).update(content_hash='')
+    max_entries = settings.SUMMARY_CACHE_MAX_ENTRIES
+    if max_entries:
+        # 최신 max_entries개 다음 항목(경계)부터 그보다 오래된 항목을 지웁니다. (created_at이 같으면 id 순)
+        boundary = cached.order_by('-created_at', '-id').values_list('created_at', 'id')[max_entries:max_entries + 1]
+        boundary = list(boundary)
+        if boundary:
+            cutoff, boundary_id = boundary[0]
+            evicted += cached.filter(
+                Q(created_at__lt=cutoff) | Q(created_at=cutoff, id__lte=boundary_id)
+            ).update(content_hash='')
+    return evicted
+
+
+def save_ai_request(input_text, output_text, description, content_hash):
+    """LLM 응답을 AIRequest로 저장하고 캐시 항목 수를 정리합니다."""
+    # 3. AIRequest 객체를 생성하고 저장합니다.
+    ai_request = AIRequest.objects.create(
+        input=input_text,
+        output=output_text,
+        description=description,
+        model_name=get_llm_client().model_name,
+        content_hash=content_hash if settings.SUMMARY_CACHE_TTL else ''
+    )
+    evict_summary_cache()
+    return ai_request
+
+
+def request_llm(input_text, description, prompt_template=SUMMARY_PROMPT_TEMPLATE):
+    """
+    캐시를 확인한 뒤 필요할 때만 LLM을 호출하고 AIRequest를 저장합니다.
+    (AIRequest, 캐시 적중 여부)를 반환합니다.
+    """
+    content_hash = prompt_hash(input_text, prompt_template=prompt_template)
+
+    # 같은 입력으로 요청한 적이 있으면 LLM을 호출하지 않고 저장된 응답을 재사용합니다.
+    ai_request = find_cached_ai_request(content_hash)
+    if ai_request is not None:
+        return ai_request, True
+
+    output_text = generate_summary_text(input_text, prompt_template)
+    return save_ai_request(input_text, output_text, description, content_hash), False
+
+
+async def arequest_llm(input_text, description, prompt_template=SUMMARY_PROMPT_TEMPLATE):
+    """
+    request_llm의 비동기 버전.
+    DB 접근은 요청 스레드(thread_sensitive)에서, LLM 호출은 별도 스레드에서 실행해
+    LLM 응답을 기다리는 동안 다른 동기 코드(ORM 등)를 막지 않습니다.
+    """
+    content_hash = prompt_hash(input_text, prompt_template=prompt_template)
+
+    ai_request = await sync_to_async(find_cached_ai_request)(content_hash)
+    if ai_request is not None:
+        return ai_request, True
+
+    output_text = await sync_to_async(generate_summary_text, thread_sensitive=False)(input_text, prompt_template)
+    return await sync_to_async(save_ai_request)(input_text, output_text, description, content_hash), False
+
+
+def chunk_hash(chunk):
+    """청크 키: 청크에 포함된 아이템 입력 텍스트 해시들의 해시 (모델/프롬프트 포함)"""
+    digest = hashlib.sha256()
+    digest.update(prompt_hash('', prompt_template=SUMMARY_CHUNK_PROMPT_TEMPLATE).encode('ascii'))
+    for _, text in chunk:
+        digest.update(hashlib.sha256(text.encode('utf-8')).digest())
+    return digest.hexdigest()
+
+
+def load_summary_chunks(project, hashes):
+    """저장된 부분 요약 중 hashes에 해당하는 것을 {청크 키: SummaryChunk}로 반환합니다."""
+    return {
+        chunk.chunk_hash: chunk
+        for chunk in SummaryChunk.objects.filter(project=project, chunk_hash__in=hashes).with_blobs()
+    }
+
+
+def save_summary_chunk(project, key, chunk, ai_request):
+    summary_chunk, _ = SummaryChunk.objects.get_or_create(
+        project=project,
+        chunk_hash=key,
+        defaults={
+            'item_ids': [item_id for item_id, _ in chunk],
+            'ai_request': ai_request,
+            'content': ai_request.output,
+        }
+    )
+    return summary_chunk
+
+
+def prune_summary_chunks(project, hashes):
+    """이번 요약에 쓰이지 않은 이전 부분 요약을 삭제합니다."""
+    SummaryChunk.objects.filter(project=project).exclude(chunk_hash__in=hashes).delete()
+
+
+def chunk_description(project, index, count):
+    return f"'{project.project_name}' 프로젝트 아이템 부분 요약 요청 ({index}/{count})"
+
+
+def map_chunks(project, chunks):
+    """
+    청크별 부분 요약(map)을 만들거나 재사용합니다.
+    (부분 요약 목록, 재사용한 청크 수)를 반환합니다.
+    """
+    hashes = [chunk_hash(chunk) for chunk in chunks]
+    existing = load_summary_chunks(project, hashes)
+
+    partial_summaries = []
+    reused = 0
+    for index, (chunk, key) in enumerate(zip(chunks, hashes), start=1):
+        summary_chunk = existing.get(key)
+        if summary_chunk is not None:
+            reused += 1
+        else:
+            ai_request, _ = request_llm(
+                "\n\n".join(text for _, text in chunk),
+                chunk_description(project, index, len(chunks)),
+                SUMMARY_CHUNK_PROMPT_TEMPLATE
+            )
+            summary_chunk = existing[key] = save_summary_chunk(project, key, chunk, ai_request)
+        partial_summaries.append(summary_chunk.content)
+
+    prune_summary_chunks(project, hashes)
+    return partial_summaries, reused
+
+
+async def amap_chunks(project, chunks):
+    """map_chunks의 비동기 버전 (LLM 호출은 arequest_llm과 같이 별도 스레드에서 실행)"""
+    hashes = [chunk_hash(chunk) for chunk in chunks]
+    existing = await sync_to_async(load_summary_chunks)(project, hashes)
+
+    partial_summaries = []
+    reused = 0
+    for index, (chunk, key) in enumerate(zip(chunks, hashes), start=1):
+        summary_chunk = existing.get(key)
+        if summary_chunk is not None:
+            reused += 1
+        else:
+            ai_request, _ = await arequest_llm(
+                "\n\n".join(text for _, text in chunk),
+                chunk_description(project, index, len(chunks)),
+                SUMMARY_CHUNK_PROMPT_TEMPLATE
+            )
+            summary_chunk = existing[key] = await sync_to_async(save_summary_chunk)(project, key, chunk, ai_request)
+        partial_summaries.append(summary_chunk.content)
+
+    await sync_to_async(prune_summary_chunks)(project, hashes)
+    return partial_summaries, reused
+
+
+def plan_summary_request(project, mode='auto', item_texts=None):
+    """
+    요약 방식을 정하고 맵리듀스 청크를 나눕니다. (LLM 호출 없음)
+    (전체 입력 텍스트, 청크 목록, 실행 정보 dict)를 반환합니다. 청크가 하나 이하면 한 번에 요약합니다.
+    """
+    if mode not in SUMMARY_MODES:
+        raise SummarizationError(
+            f"mode는 {', '.join(SUMMARY_MODES)} 중 하나여야 합니다.", status.HTTP_400_BAD_REQUEST
+        )
+
+    if item_texts is None:
+        item_texts = summary_item_texts(project)
+    input_text = "\n\n".join(text for _, text in item_texts)
+    if mode == 'auto':
+        mode = 'map_reduce' if estimate_tokens(input_text) > settings.SUMMARY_MAX_INPUT_TOKENS else 'single'
+
+    chunks = split_into_chunks(item_texts, settings.SUMMARY_CHUNK_TOKEN_BUDGET) if mode == 'map_reduce' else []
+    info = {'mode': mode, 'chunks_count': len(chunks) or 1, 'reused_chunks_count': 0, 'reduce_levels': 0}
+    return input_text, chunks, info
+
+
+def single_request(project, input_text, info):
+    return input_text, SUMMARY_PROMPT_TEMPLATE, f"'{project.project_name}' 프로젝트 아이템 요약 요청", info
+
+
+def reduce_request(project, partial_summaries, info):
+    return (
+        join_partial_summaries(partial_summaries),
+        SUMMARY_REDUCE_PROMPT_TEMPLATE,
+        f"'{project.project_name}' 프로젝트 아이템 요약 요청 (부분 요약 {len(partial_summaries)}개 통합)",
+        info,
+    )
+
+
+def prepare_summary_request(project, mode='auto', item_texts=None):
+    """
+    최종 요약 요청을 준비합니다. 맵리듀스인 경우 부분 요약(map)까지 마칩니다.
+
+    mode: 'single'은 한 번에 요약, 'map_reduce'는 청크 단위 맵리듀스,
+    'auto'는 입력이 SUMMARY_MAX_INPUT_TOKENS를 넘을 때만 맵리듀스를 사용합니다.
+    (입력 텍스트, 프롬프트 템플릿, 요청 설명, 실행 정보 dict)를 반환합니다.
+    """
+    input_text, chunks, info = plan_summary_request(project, mode, item_texts)
+
+    # 청크가 하나뿐이면 한 번에 요약하는 것과 같습니다.
+    if len(chunks) <= 1:
+        return single_request(project, input_text, info)
+
+    partial_summaries, info['reused_chunks_count'] = map_chunks(project, chunks)
+    partial_summaries, info['reduce_levels'] = reduce_partial_summaries(project, partial_summaries)
+    return reduce_request(project, partial_summaries, info)
+
+
+async def aprepare_summary_request(project, mode='auto', item_texts=None):
+    """prepare_summary_request의 비동기 버전. 부분 요약의 LLM 호출이 요청 스레드를 점유하지 않습니다."""
+    input_text, chunks, info = await sync_to_async(plan_summary_request)(project, mode, item_texts)
+
+    if len(chunks) <= 1:
+        return single_request(project, input_text, info)
+
+    partial_summaries, info['reused_chunks_count'] = await amap_chunks(project, chunks)
+    partial_summaries, info['reduce_levels'] = await areduce_partial_summaries(project, partial_summaries)
+    return reduce_request(project, partial_summaries, info)
+
+
+def reduce_groups(partial_summaries, levels):
+    """
+    부분 요약을 합친 입력이 SUMMARY_MAX_INPUT_TOKENS를 넘으면 중간 통합할 묶음(청크 예산 단위) 목록을,
+    더 통합할 필요가 없거나 MAX_REDUCE_LEVELS 단계에 도달했으면 None을 반환합니다.
+    """
+    if (
+        levels >= MAX_REDUCE_LEVELS or len(partial_summaries) <= 1
+        or estimate_tokens(join_partial_summaries(partial_summaries)) <= settings.SUMMARY_MAX_INPUT_TOKENS
+    ):
+        return None
+    groups = split_into_chunks(list(enumerate(partial_summaries)), settings.SUMMARY_CHUNK_TOKEN_BUDGET)
+    # 한 묶음이면 최종 통합과 같습니다.
+    return groups if len(groups) > 1 else None
+
+
+def reduce_description(project, level, index, count):
+    return f"'{project.project_name}' 프로젝트 부분 요약 중간 통합 요청 ({level}단계, {index}/{count})"
+
+
+def reduce_partial_summaries(project, partial_summaries):
+    """
+    부분 요약을 합친 입력이 SUMMARY_MAX_INPUT_TOKENS를 넘으면, 청크 예산 단위로 묶어 중간 통합합니다.
+    입력이 예산 안에 들어오거나 MAX_REDUCE_LEVELS 단계까지 반복합니다. (부분 요약 목록, 중간 통합 단계 수)를 반환합니다.
+    """
+    levels = 0
+    while True:
+        groups = reduce_groups(partial_summaries, levels)
+        if groups is None:
+            return partial_summaries, levels
+        levels += 1
+        partial_summaries = [
+            request_llm(
+                join_partial_summaries(text for _, text in group),
+                reduce_description(project, levels, index, len(groups)),
+                SUMMARY_REDUCE_PROMPT_TEMPLATE
+            )[0].output
+            for index, group in enumerate(groups, start=1)
+        ]
+
+
+async def areduce_partial_summaries(project, partial_summaries):
+    """reduce_partial_summaries의 비동기 버전"""
+    levels = 0
+    while True:
+        groups = reduce_groups(partial_summaries, levels)
+        if groups is None:
+            return partial_summaries, levels
+        levels += 1
+        partial_summaries = [
+            (await arequest_llm(
+                join_partial_summaries(text for _, text in group),
+                reduce_description(project, levels, index, len(groups)),
+                SUMMARY_REDUCE_PROMPT_TEMPLATE
+            ))[0].output
+            for index, group in enumerate(groups, start=1)
+        ]
+
+
+def create_summary(project, ai_request):
+    # 4. AIRequest의 output을 정제하여 Summary 테이블에 저장합니다.
+    # 이 예제에서는 AIRequest의 output을 그대로 Summary의 content로 사용합니다.
+    return Summary.objects.create(
+        project=project,
+        ai_request=ai_request,
+        content=ai_request.output
+    )
+
+
+def summary_flight_key(project, mode, item_texts):
+    """동시에 들어온 같은 요약 요청을 합치는 키 (프로젝트, 모드, 아이템 입력 텍스트의 해시)"""
+    digest = hashlib.sha256()
+    for _, text in item_texts:
+        digest.update(hashlib.sha256(text.encode('utf-8')).digest())
+    return (project.id, mode, digest.hexdigest())
+
+
+def summarize_project_items(project, mode='auto'):
+    """
+    프로젝트의 모든 아이템 본문을 합쳐 AIRequest 테이블에 저장하고,
+    결과를 Summary 테이블에도 저장합니다.
+    (Summary, 실행 정보 dict)를 반환합니다. 동시에 들어온 같은 요청과 결과를 공유했으면 info['coalesced']가 True입니다.
+    """
+    item_texts = summary_item_texts(project)
+
+    def summarize():
+        input_text, prompt_template, description, info = prepare_summary_request(project, mode, item_texts)
+        ai_request, info['cache_hit'] = request_llm(input_text, description, prompt_template)
+        return create_summary(project, ai_request), info
+
+    try:
+        (summary, info), coalesced = _summary_flights.do(
+            summary_flight_key(project, mode, item_texts), summarize,
+            limiter=get_llm_limiter(), timeout=settings.LLM_FLIGHT_TIMEOUT or None,
+        )
+    except LLMError as e:
+        # 같은 요청을 기다리다 대기열이 가득 찼거나 시간을 넘긴 경우
+        raise SummarizationError(f"LLM API 호출 실패: {e}", llm_error_status(e)) from e
+    return summary, {**info, 'coalesced': coalesced}
+
+
+def reclaim_expired_jobs():
+    """
+    임대 시간(SUMMARY_JOB_LEASE_SECONDS) 동안 갱신되지 않은 running 작업을 다시 대기열에 넣습니다.
+    (워커가 작업 도중 종료된 경우) 최대 시도 횟수에 도달한 작업은 실패 처리합니다.
+    """
+    now = timezone.now()
+    expired = SummaryJob.objects.filter(
+        status=SummaryJob.STATUS_RUNNING,
+        updated_at__lt=now - timedelta(seconds=settings.SUMMARY_JOB_LEASE_SECONDS)
+    )
+    expired.filter(attempts__gte=settings.SUMMARY_JOB_MAX_ATTEMPTS).update(
+        status=SummaryJob.STATUS_FAILED, error="작업 임대 시간이 만료되었고 최대 시도 횟수에 도달했습니다.",
+        finished_at=now, updated_at=now
+    )
+    expired.update(status=SummaryJob.STATUS_PENDING, updated_at=now)
+
+
+def claim_next_job():
+    """대기 중인 요약 작업 하나를 running 상태로 가져옵니다. 없으면 None."""
+    reclaim_expired_jobs()
+    while True:
+        now = timezone.now()
+        job_id = (
+            SummaryJob.objects.filter(status=SummaryJob.STATUS_PENDING)
+            .filter(Q(run_after__isnull=True) | Q(run_after__lte=now))
+            .order_by('created_at', 'id')
+            .values_list('id', flat=True)
+            .first()
+        )
+        if job_id is None:
+            return None
+        # 다른 워커가 먼저 가져갔다면 update 결과가 0이므로 다음 작업을 찾습니다.
+        claimed = SummaryJob.objects.filter(id=job_id, status=SummaryJob.STATUS_PENDING).update(
+            status=SummaryJob.STATUS_RUNNING, attempts=F('attempts') + 1, run_after=None,
+            started_at=now, updated_at=now
+        )
+        if claimed:
+            return SummaryJob.objects.select_related('project').get(id=job_id)
+
+
+def renew_job_leases(job_ids):
+    """실행 중인 작업의 임대를 연장합니다. (워커가 주기적으로 호출)"""
+    SummaryJob.objects.filter(id__in=job_ids, status=SummaryJob.STATUS_RUNNING).update(updated_at=timezone.now())
+
+
+def run_summary_job(job):
+    """
+    요약 작업 하나를 실행하고 결과(성공/실패)를 기록합니다.
+
+    LLM 호출 한도(429/503)로 실패하면 SUMMARY_JOB_RETRY_DELAY 초 뒤에 다시 가져가도록 대기열에 되돌립니다.
+    결과는 이 워커가 가져간 시도(attempts)가 그대로일 때만 기록합니다. (임대가 만료돼 다른 워커가 가져간 경우 무시)
+    """
+    try:
+        summary, _ = summarize_project_items(job.project, job.mode)
+        error = None
+    except SummarizationError as e:
+        summary, error = None, e
+    except Exception as e:
+        # 예상하지 못한 오류(버그, DB 오류 등)는 재시도하지 않고 실패로 기록합니다.
+        logger.exception("요약 작업 %s 실행 중 예상하지 못한 오류", job.id)
+        summary, error = None, e
+
+    now = timezone.now()
+    if error is None:
+        changes = {'status': SummaryJob.STATUS_SUCCEEDED, 'summary': summary, 'error': '', 'finished_at': now}
+    elif isinstance(error, SummarizationError) and error.status_code in RETRYABLE_STATUS_CODES:
+        # 호출 한도 초과는 작업의 실패가 아니므로 시도 횟수에 넣지 않고 나중에 다시 실행합니다.
+        changes = {
+            'status': SummaryJob.STATUS_PENDING, 'error': error.detail, 'attempts': job.attempts - 1,
+            'run_after': now + timedelta(seconds=settings.SUMMARY_JOB_RETRY_DELAY),
+        }
+    else:
+        detail = error.detail if isinstance(error, SummarizationError) else str(error)
+        changes = {'status': SummaryJob.STATUS_FAILED, 'error': detail, 'finished_at': now}
+
+    recorded = SummaryJob.objects.filter(
+        id=job.id, status=SummaryJob.STATUS_RUNNING, attempts=job.attempts
+    ).update(updated_at=now, **changes)
+    if recorded:
+        for field, value in changes.items():
+            setattr(job, field, value)
+        job.updated_at = now
+    else:
+        job.refresh_from_db()
+    return job
+
+
+def run_summary_job_in_thread(job):
+    """워커 스레드용: 작업 실행 후 스레드의 DB 연결을 닫습니다."""
+    try:
+        return run_summary_job(job)
+    finally:
+        connection.close()
@@ -1,3 +1,1745 @@
-from django.test import TestCase
+import asyncio
+import gzip
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unicodedata
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+import markdown
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldError
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.test import (
+    AsyncClient,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone as dj_timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from . import summarization
+from .api_views import (
+    ITEM_EXISTS_ERROR,
+    advance_watermarks,
+    create_items_from_matches,
+    find_matching_external_data,
+)
+from .external_data import (
+    EMPTY_DATASET,
+    ExternalDataset,
+    ExternalDataStore,
+    ExternalRecord,
+    canonicalize_link,
+    iter_external_records,
+    read_external_records,
+    record_updated_at,
+)
+from .external_search import build_text_index, get_text_index, search_external_records
+from .keyword_matcher import KeywordMatcher, normalize_text, parse_keywords
+from .llm import (
+    FakeLLMClient,
+    LLMError,
+    LLMLimiter,
+    LLMOverloaded,
+    LLMRateLimited,
+    LLMTimeout,
+    SingleFlight,
+    get_llm_client,
+    get_llm_limiter,
+)
+from .markdown_render import clear_render_cache, rendered_html, store_rendered_html
+from .models import (
+    AIRequest,
+    Item,
+    Project,
+    ProjectMaterial,
+    Recommendation,
+    RenderedMarkdown,
+    Summary,
+    SummaryChunk,
+    SummaryJob,
+    TextBlob,
+)
+from .renderers import FastJSONRenderer, _msgpack
+from .response_cache import reset_response_cache_stats
+from .summarization import (
+    SummarizationError,
+    chunk_hash,
+    claim_next_job,
+    estimate_tokens,
+    evict_summary_cache,
+    prompt_hash,
+    renew_job_leases,
+    request_llm,
+    run_summary_job,
+    split_into_chunks,
+    summarize_project_items,
+)
 
 # Create your tests here.
+
+
+def external_record(index, material_link='https://github.com/example/repo', **fields):
+    """테스트용 외부 레코드"""
+    record = {
+        'material_type': 'github',
+        'material_link': material_link,
+        'title': f"외부 레코드 {index}",
+        'body': '서버 배포 완료',
+        'link': f"{material_link}/pull/{index}",
+        'created_at': '2025-01-01T00:00:00Z',
+        'updated_at': f"2025-01-{index % 28 + 1:02d}T00:00:00Z",
+    }
+    record.update(fields)
+    return record
+
+
+def write_external_data(path, records):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, ensure_ascii=False)
+    return path
+
+
+class ExternalDataStoreTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'data.json')
+
+    def test_reloads_only_when_file_changes(self):
+        write_external_data(self.path, [external_record(1)])
+        store = ExternalDataStore(self.path)
+        first = store.get()
+        self.assertEqual(len(first), 1)
+        with mock.patch('core.external_data.read_external_records') as read:
+            self.assertIs(store.get(), first)
+        read.assert_not_called()
+
+        write_external_data(self.path, [external_record(1), external_record(2)])
+        second = store.get()
+        self.assertEqual(len(second), 2)
+        self.assertNotEqual(second.version, first.version)
+
+        # 크기가 같아도 mtime이 바뀌면 다시 읽습니다.
+        write_external_data(self.path, [external_record(1), external_record(3)])
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        third = store.get()
+        self.assertIsNot(third, second)
+        self.assertEqual(third.records[1]['title'], '외부 레코드 3')
+
+    def test_keeps_last_snapshot_when_file_breaks(self):
+        self.assertIs(ExternalDataStore(self.path).get(), EMPTY_DATASET)
+
+        write_external_data(self.path, [external_record(1)])
+        store = ExternalDataStore(self.path)
+        snapshot = store.get()
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('[{"title": ')
+        with self.assertLogs('core.external_data', 'WARNING'):
+            self.assertIs(store.get(), snapshot)
+            os.remove(self.path)
+            self.assertIs(store.get(), snapshot)
+
+
+class ExternalDataIndexTests(SimpleTestCase):
+    def test_canonicalize_link(self):
+        self.assertEqual(
+            canonicalize_link(' HTTPS://GitHub.com/Example/Repo/ '), 'https://github.com/Example/Repo'
+        )
+        self.assertEqual(canonicalize_link('https://github.com/example/repo#'), 'https://github.com/example/repo')
+        self.assertEqual(canonicalize_link('https://github.com/example/repo?tab=1'), 'https://github.com/example/repo?tab=1')
+        # Gmail처럼 fragment가 개별 자료를 가리키면 유지합니다.
+        self.assertNotEqual(
+            canonicalize_link('https://mail.google.com/mail/u/0/#inbox/A'),
+            canonicalize_link('https://mail.google.com/mail/u/0/#inbox/B'),
+        )
+        self.assertEqual(canonicalize_link(None), '')
+
+    def test_find_uses_type_and_canonical_link(self):
+        records = [
+            external_record(1, material_link='https://github.com/example/repo/'),
+            external_record(2, material_link='https://GITHUB.com/example/repo'),
+            external_record(3, material_link='https://github.com/example/other'),
+            external_record(4, material_type='jira', material_link='https://github.com/example/repo'),
+        ]
+        dataset = ExternalDataset(records, version='v1')
+        found = dataset.find('github', 'https://github.com/example/repo')
+        self.assertEqual([record['title'] for record in found], ['외부 레코드 1', '외부 레코드 2'])
+        self.assertEqual(dataset.find('slack', 'https://github.com/example/repo'), ())
+        self.assertIs(dataset.build_index(), dataset.index)
+
+
+class KeywordMatcherTests(SimpleTestCase):
+    def naive_match(self, keywords, *texts):
+        hits = []
+        for keyword in keywords:
+            if any(normalize_text(keyword) in text for text in texts) and keyword not in hits:
+                hits.append(keyword)
+        return (hits[0] if hits else None), hits
+
+    def test_overlapping_keywords_in_priority_order(self):
+        matcher = KeywordMatcher(['hers', 'he', 'she', 'his'])
+        self.assertEqual(matcher.match('ushers'), ('hers', ['hers', 'he', 'she']))
+        self.assertEqual(matcher.match('ahishe'), ('he', ['he', 'she', 'his']))
+        self.assertEqual(matcher.match('nothing'), (None, []))
+        # 텍스트 경계를 넘는 매칭은 없습니다.
+        self.assertEqual(matcher.match('s', 'he'), ('he', ['he']))
+
+    def test_normalized_text(self):
+        matcher = KeywordMatcher(parse_keywords(' API , 배포,, '))
+        self.assertEqual(matcher.keywords, ('API', '배포'))
+        decomposed = unicodedata.normalize('NFD', '서버 배포')
+        self.assertEqual(matcher.match(normalize_text('New api'), normalize_text(decomposed)), ('API', ['API', '배포']))
+
+    def test_matches_naive_search(self):
+        rng = random.Random(3)
+        alphabet = 'ab가나'
+        for _ in range(300):
+            keywords = [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 6))]
+            texts = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 20))) for _ in range(2)]
+            self.assertEqual(KeywordMatcher(keywords).match(*texts), self.naive_match(keywords, *texts), (keywords, texts))
+
+
+class ExternalDataStreamingTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.records = [
+            external_record(index, body='서버 배포 ' * index, score=10 ** index) for index in range(1, 8)
+        ]
+
+    def write(self, name, text, opener=open):
+        path = os.path.join(self.directory, name)
+        with opener(path, 'wt', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def test_formats_match_full_read(self):
+        array = json.dumps(self.records, ensure_ascii=False, indent=1)
+        ndjson = '\n\n'.join(json.dumps(record, ensure_ascii=False) for record in self.records)
+        paths = [
+            self.write('data.json', array),
+            self.write('data.ndjson', ndjson),
+            self.write('data.json.gz', array, opener=gzip.open),
+        ]
+        try:
+            import zstandard
+        except ImportError:
+            zstandard = None
+        if zstandard is not None:
+            path = os.path.join(self.directory, 'data.ndjson.zst')
+            with open(path, 'wb') as f:
+                f.write(zstandard.ZstdCompressor().compress(ndjson.encode('utf-8')))
+            paths.append(path)
+
+        for path in paths:
+            expected = read_external_records(path)
+            self.assertEqual(expected, self.records, path)
+            # 청크 경계가 레코드와 숫자 중간에 걸리도록 작은 청크로 읽습니다.
+            for chunk_size in (1, 7, 64):
+                self.assertEqual(list(iter_external_records(path, chunk_size)), expected, (path, chunk_size))
+
+    def test_large_record_is_decoded_in_few_passes(self):
+        record = external_record(1, body='가' * 200_000)
+        path = self.write('big.json', json.dumps([record, record], ensure_ascii=False))
+        raw_decode = json.JSONDecoder.raw_decode
+        with mock.patch.object(json.JSONDecoder, 'raw_decode', autospec=True, side_effect=raw_decode) as decode:
+            records = list(iter_external_records(path, chunk_size=1024))
+        self.assertEqual(len(records), 2)
+        # 청크마다 다시 해석하면 수백 번, 버퍼가 두 배가 될 때만 해석하면 레코드당 십여 번입니다.
+        self.assertLess(decode.call_count, 30)
+
+    def test_streaming_mode_rejects_unreadable_files(self):
+        project = Project.objects.create(
+            project_name='스트리밍', author_email='a@example.com', project_code='STREAM', project_keyword='배포'
+        )
+        material = ProjectMaterial.objects.create(
+            project=project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        missing = os.path.join(self.directory, 'missing.json')
+        broken = self.write('broken.json', '[{"title": ')
+        # 앞쪽 레코드는 읽히지만 파일이 중간에 잘린 경우
+        truncated = self.write('truncated.json', json.dumps(self.records, ensure_ascii=False)[:-40])
+        for path in (missing, broken, truncated):
+            with override_settings(EXTERNAL_DATA_STREAMING=True, EXTERNAL_DATA_PATH=path):
+                with self.assertLogs('core.external_data', 'ERROR'):
+                    response = self.client.get(f"/api/projects/{project.id}/external_matches_by_keyword/")
+                self.assertEqual(response.status_code, 503, path)
+                with self.assertLogs('core.external_data', 'ERROR'):
+                    response = self.client.post(
+                        f"/api/projects/{project.id}/create_items_from_external_matches_by_keyword/"
+                    )
+                self.assertEqual(response.status_code, 503, path)
+                self.assertIn('외부 데이터 로드 실패', response.json()['detail'])
+
+        # 일부만 읽은 결과로 아이템을 만들거나 워터마크를 옮기지 않습니다.
+        material.refresh_from_db()
+        self.assertIsNone(material.keyword_watermark)
+        self.assertFalse(Item.objects.filter(project=project).exists())
+
+
+class CreateItemsFromMatchesTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(project_name='일괄', author_email='a@example.com', project_code='BULK')
+        self.material = ProjectMaterial.objects.create(
+            project=self.project, material_type='github', material_link='https://github.com/example/repo'
+        )
+
+    def match(self, index, **fields):
+        return {'project_material_id': self.material.id, 'external_data': external_record(index, **fields)}
+
+    def test_existing_and_duplicated_links_are_reported(self):
+        existing = Item.objects.create(
+            project=self.project, project_material=self.material, channel_name='github',
+            title='기존', body='본문', link=external_record(1)['link']
+        )
+        matches = [self.match(index) for index in range(1, 6)] + [self.match(3)]
+        with CaptureQueriesContext(connection) as queries:
+            created_items, created_recommendations, errors = create_items_from_matches(
+                self.project, matches, is_fixed=False, create_recommendations=True, batch_size=2
+            )
+
+        lookups = [query for query in queries if query['sql'].startswith('SELECT') and '"items"."link" IN' in query['sql']]
+        self.assertEqual(len(lookups), 3)  # 링크 5개를 2개씩 조회
+        self.assertEqual([item['title'] for item in created_items], [f"외부 레코드 {index}" for index in range(2, 6)])
+        self.assertEqual(len(created_recommendations), 4)
+        self.assertEqual(errors, [
+            {'error': ITEM_EXISTS_ERROR, 'link': external_record(1)['link'], 'item_id': existing.id},
+            {'error': ITEM_EXISTS_ERROR, 'link': external_record(3)['link'],
+             'item_id': Item.objects.get(link=external_record(3)['link']).id},
+        ])
+
+    def test_duplicate_of_failed_row_reports_the_failure(self):
+        matches = [self.match(1), self.match(2, title=None), self.match(2)]
+        created_items, _, errors = create_items_from_matches(self.project, matches, is_fixed=False)
+
+        self.assertEqual([item['link'] for item in created_items], [external_record(1)['link']])
+        self.assertEqual(len(errors), 2)
+        duplicate, failure = errors
+        self.assertEqual(failure['external_data'], matches[1]['external_data'])
+        self.assertIn('NOT NULL', failure['error'])
+        self.assertEqual(duplicate, {
+            'error': failure['error'], 'external_data': matches[2]['external_data'],
+            'project_material_id': self.material.id,
+        })
+
+
+class ItemIdentityMigrationTests(TransactionTestCase):
+    """0013 마이그레이션의 중복 아이템 병합"""
+    before = [('core', '0012_cursor_pagination_indexes')]
+    after = [('core', '0013_item_identity_and_lookup_indexes')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_duplicates_are_merged_with_their_state_and_recommendations(self):
+        apps = self.migrate(self.before)
+        Project = apps.get_model('core', 'Project')
+        ProjectMaterial = apps.get_model('core', 'ProjectMaterial')
+        OldItem = apps.get_model('core', 'Item')
+        OldRecommendation = apps.get_model('core', 'Recommendation')
+        project = Project.objects.create(project_name='병합', author_email='a@example.com', project_code='MERGE')
+        material = ProjectMaterial.objects.create(
+            project=project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        fields = {'project': project, 'project_material': material, 'channel_name': 'github', 'link': 'https://example.com/1'}
+        first = OldItem.objects.create(title='처음', body='본문', is_active=False, **fields)
+        fixed = OldItem.objects.create(title='고정', body='본문', is_fixed=True, is_active=False, **fields)
+        latest = OldItem.objects.create(title='최신', body='새 본문', is_active=True, **fields)
+        OldRecommendation.objects.create(project=project, item=first, project_material=material, is_active=False)
+        OldRecommendation.objects.create(project=project, item=fixed, project_material=material, is_active=True)
+        OldRecommendation.objects.create(project=project, item=latest, project_material=None)
+
+        with self.assertLogs('core.migrations.0013_item_identity_and_lookup_indexes', 'WARNING') as logs:
+            apps = self.migrate(self.after)
+
+        self.assertIn('중복 아이템 2개 병합', logs.output[-1])
+        Item = apps.get_model('core', 'Item')
+        Recommendation = apps.get_model('core', 'Recommendation')
+        item = Item.objects.get()
+        self.assertEqual(item.id, first.id)
+        self.assertEqual((item.title, item.body, item.is_fixed, item.is_active), ('최신', '새 본문', True, True))
+        self.assertEqual(
+            sorted(Recommendation.objects.filter(item=item).values_list('project_material_id', 'is_active'), key=str),
+            sorted([(material.id, True), (None, True)], key=str),
+        )
+
+
+class ExternalSearchEquivalenceTests(TestCase):
+    KEYWORD_SETS = [
+        '배포',
+        'API',
+        'api, 서버',
+        'Api,ci,cd',
+        'AI',  # 3글자 미만 키워드는 trigram 대신 순차 검사
+        'QA,kg, UI',
+        'docker,GITHUB actions',
+        '알림,푸시',
+        '없는키워드',
+    ]
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.fts_path = os.path.join(directory.name, 'fts.sqlite3')
+        self.dataset = ExternalDataStore(os.path.join(settings.BASE_DIR, 'dummy_data.json')).get()
+        self.project = Project.objects.create(project_name='검색', author_email='a@example.com', project_code='FTS')
+        for material_type, material_link in sorted({
+            (record['material_type'], record['material_link']) for record in self.dataset
+        }):
+            ProjectMaterial.objects.create(project=self.project, material_type=material_type, material_link=material_link)
+
+    def matches(self):
+        return [
+            (match['project_material_id'], match['external_data']['link'], match['matched_keywords'])
+            for match in find_matching_external_data(self.project, self.dataset)
+        ]
+
+    def test_fts_matches_sequential_scan(self):
+        with override_settings(EXTERNAL_DATA_FTS_PATH=self.fts_path):
+            self.assertTrue(build_text_index(self.dataset))
+        total = 0
+        for keywords in self.KEYWORD_SETS:
+            self.project.project_keyword = keywords
+            with override_settings(EXTERNAL_DATA_FTS_PATH=''):
+                expected = self.matches()
+            with override_settings(EXTERNAL_DATA_FTS_PATH=self.fts_path):
+                self.assertIsNotNone(search_external_records(self.dataset, parse_keywords(keywords)))
+                self.assertEqual(self.matches(), expected, keywords)
+            total += len(expected)
+        self.assertGreater(total, 0)
+
+    @override_settings(EXTERNAL_DATA_FTS_PATH='')
+    def test_stale_index_falls_back_and_rebuilds_in_background(self):
+        keywords = parse_keywords('배포, API')
+        with override_settings(EXTERNAL_DATA_FTS_PATH=self.fts_path):
+            index = get_text_index()
+            with mock.patch.object(index, 'rebuild', wraps=index.rebuild) as rebuild:
+                # 요청은 인덱스 재생성을 기다리지 않고 순차 검사로 처리합니다.
+                self.assertIsNone(search_external_records(self.dataset, keywords))
+                index._rebuild_thread.join()
+            rebuild.assert_called_once_with(self.dataset)
+            positions = search_external_records(self.dataset, keywords)
+
+        self.assertTrue(positions)
+        self.project.project_keyword = '배포, API'
+        expected = {match['external_data']['link'] for match in find_matching_external_data(self.project, self.dataset)}
+        self.assertEqual({self.dataset.records[position]['link'] for position in positions}, expected)
+
+
+@override_settings(EXTERNAL_DATA_FTS_PATH='', EXTERNAL_DATA_STREAMING=False)
+class MatchAllProjectsTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'data.json')
+        write_external_data(path, [external_record(index, title=f"배포 {index}") for index in range(1, 4)])
+        self.enterContext(override_settings(EXTERNAL_DATA_PATH=path))
+        for code in ('ONE', 'TWO'):
+            project = Project.objects.create(
+                project_name=code, author_email='a@example.com', project_code=code, project_keyword='배포'
+            )
+            ProjectMaterial.objects.create(
+                project=project, material_type='github', material_link='https://github.com/example/repo'
+            )
+
+    def run_command(self, **options):
+        out, err = StringIO(), StringIO()
+        call_command('match_all_projects', mode='keyword', stdout=out, stderr=err, **options)
+        return out.getvalue(), err.getvalue()
+
+    def test_matches_every_project_incrementally(self):
+        self.run_command(workers=1)
+        self.assertEqual(Item.objects.count(), 6)
+        self.assertEqual(Recommendation.objects.count(), 6)
+
+        out, _ = self.run_command(workers=1)
+        self.assertIn('키워드 매칭 0건', out)
+        out, _ = self.run_command(workers=1, full=True)
+        self.assertIn('키워드 매칭 6건', out)
+        self.assertEqual(Item.objects.count(), 6)
+
+    def test_runs_in_process_without_fork(self):
+        with mock.patch('multiprocessing.get_all_start_methods', return_value=['spawn']), \
+                mock.patch('core.management.commands.match_all_projects.ProcessPoolExecutor') as executor:
+            out, err = self.run_command(workers=4)
+        executor.assert_not_called()
+        self.assertIn('fork', err)
+        self.assertIn('workers=1', out)
+        self.assertEqual(Item.objects.count(), 6)
+
+
+@override_settings(EXTERNAL_DATA_FTS_PATH='', EXTERNAL_DATA_STREAMING=False)
+class WatermarkTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'data.json')
+        self.enterContext(override_settings(EXTERNAL_DATA_PATH=self.path))
+        self.project = Project.objects.create(
+            project_name='워터마크', author_email='a@example.com', project_code='WM', project_keyword='배포'
+        )
+        self.material = ProjectMaterial.objects.create(
+            project=self.project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        self.url = f"/api/projects/{self.project.id}/create_items_from_external_matches_by_code/"
+
+    def write(self, records):
+        # 파일 크기가 바뀌므로 스토어가 다시 로드합니다.
+        write_external_data(self.path, records)
+
+    def records(self, count):
+        return [external_record(index, body='WM 변경') for index in range(1, count + 1)]
+
+    def code_watermark(self):
+        self.material.refresh_from_db()
+        return self.material.code_watermark
+
+    def test_incremental_and_full_runs(self):
+        records = self.records(3)
+        self.write(records)
+        data = self.client.post(self.url).json()
+        self.assertEqual((data['total_matches'], data['created_items_count']), (3, 3))
+        self.assertEqual(self.code_watermark(), datetime(2025, 1, 4, tzinfo=UTC))
+
+        data = self.client.post(self.url).json()
+        self.assertEqual((data['incremental'], data['total_matches']), (True, 0))
+
+        data = self.client.post(f"{self.url}?full=true").json()
+        self.assertEqual((data['incremental'], data['total_matches'], data['created_items_count']), (False, 3, 0))
+        self.assertEqual({error['error'] for error in data['errors']}, {ITEM_EXISTS_ERROR})
+
+        # 새로 갱신된 레코드만 다시 확인합니다.
+        self.write(records + [external_record(9, body='WM 변경')])
+        data = self.client.post(self.url).json()
+        self.assertEqual((data['total_matches'], data['created_items_count']), (1, 1))
+        self.assertEqual(self.code_watermark(), datetime(2025, 1, 10, tzinfo=UTC))
+
+    def test_update_resets_watermarks(self):
+        self.write(self.records(3))
+        self.client.post(self.url)
+        self.client.post(f"/api/projects/{self.project.id}/create_items_from_external_matches_by_keyword/")
+        self.assertIsNotNone(self.code_watermark())
+
+        response = self.client.patch(
+            f"/api/projects/{self.project.id}/", {'project_code': 'ZZ'}, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(self.code_watermark())
+        self.assertIsNotNone(self.material.keyword_watermark)
+
+        response = self.client.patch(
+            f"/api/materials/{self.material.id}/",
+            {'material_link': 'https://github.com/example/other'}, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.material.refresh_from_db()
+        self.assertIsNone(self.material.keyword_watermark)
+
+    def test_failed_inserts_hold_the_watermark(self):
+        records = self.records(3)
+        del records[1]['title']
+        self.write(records)
+        data = self.client.post(self.url).json()
+        self.assertEqual((data['created_items_count'], data['errors_count']), (2, 1))
+        # 실패한 레코드(2025-01-03) 직전까지만 이동
+        self.assertEqual(self.code_watermark(), datetime(2025, 1, 3, tzinfo=UTC) - timedelta(microseconds=1))
+
+        records[1]['title'] = '고친 제목'
+        self.write(records)
+        data = self.client.post(self.url).json()
+        self.assertEqual((data['total_matches'], data['created_items_count']), (2, 1))
+        self.assertEqual(self.code_watermark(), datetime(2025, 1, 4, tzinfo=UTC))
+
+
+class ExternalRecordTests(SimpleTestCase):
+    def test_normalized_fields_are_computed_once_on_load(self):
+        title = unicodedata.normalize('NFD', 'API 서버 배포')
+        record = ExternalRecord(external_record(1, title=title, body='Straße DEPLOY', updated_at='2025-01-02T03:04:05'))
+        self.assertEqual(record.title_norm, 'api 서버 배포')
+        self.assertEqual(record.body_norm, 'strasse deploy')
+        # 시간대가 없는 updated_at은 UTC로 봅니다.
+        self.assertEqual(record.updated_at_dt, datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC))
+        self.assertEqual(record_updated_at(record), record.updated_at_dt)
+        # 원본 dict는 그대로 직렬화됩니다.
+        self.assertEqual(json.loads(json.dumps(record)), dict(record))
+        self.assertNotIn('title_norm', record)
+
+    def test_missing_or_invalid_values(self):
+        record = ExternalRecord({'title': None, 'updated_at': 'yesterday'})
+        self.assertEqual((record.title_norm, record.body_norm), ('', ''))
+        self.assertIsNone(record.updated_at_dt)
+        self.assertIsNone(record_updated_at({'updated_at': '2025-13-01T00:00:00Z'}))
+        self.assertEqual(
+            record_updated_at({'updated_at': '2025-01-02T00:00:00Z'}), datetime(2025, 1, 2, tzinfo=UTC)
+        )
+
+    def test_loaded_records_match_decomposed_hangul(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.json')
+            write_external_data(path, [external_record(1, body=unicodedata.normalize('NFD', '서버 배포 완료'))])
+            records = read_external_records(path)
+        self.assertIsInstance(records[0], ExternalRecord)
+        matcher = KeywordMatcher(parse_keywords(normalize_text('배포')))
+        self.assertEqual(matcher.match(records[0].title_norm, records[0].body_norm)[0], '배포')
+
+
+@override_settings(
+    LLM_BACKEND='fake', LLM_FAKE_LATENCY=0.0, SUMMARY_CACHE_TTL=0,
+    SUMMARY_JOB_LEASE_SECONDS=60, SUMMARY_JOB_MAX_ATTEMPTS=3, SUMMARY_JOB_RETRY_DELAY=30,
+)
+class SummaryJobTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(project_name='작업', author_email='a@example.com', project_code='JOB')
+        material = ProjectMaterial.objects.create(
+            project=self.project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        Item.objects.create(
+            project=self.project, project_material=material, channel_name='github',
+            title='배포', body='서버 배포 완료', link='https://github.com/example/repo/pull/1', is_fixed=True
+        )
+
+    def create_job(self, **fields):
+        job = SummaryJob.objects.create(project=self.project, **fields)
+        if 'updated_at' in fields:
+            # auto_now를 피해 임대 만료 시각을 직접 지정합니다.
+            SummaryJob.objects.filter(id=job.id).update(updated_at=fields['updated_at'])
+        return job
+
+    def test_claim_and_run(self):
+        job = self.create_job()
+        claimed = claim_next_job()
+        self.assertEqual((claimed.id, claimed.status, claimed.attempts), (job.id, SummaryJob.STATUS_RUNNING, 1))
+        self.assertIsNone(claim_next_job())
+
+        job = run_summary_job(claimed)
+        job.refresh_from_db()
+        self.assertEqual(job.status, SummaryJob.STATUS_SUCCEEDED)
+        self.assertIsNotNone(job.summary_id)
+
+    def test_expired_leases_are_reclaimed(self):
+        expired = dj_timezone.now() - timedelta(seconds=120)
+        stranded = self.create_job(status=SummaryJob.STATUS_RUNNING, attempts=1, updated_at=expired)
+        exhausted = self.create_job(status=SummaryJob.STATUS_RUNNING, attempts=3, updated_at=expired)
+        alive = self.create_job(status=SummaryJob.STATUS_RUNNING, attempts=1)
+
+        claimed = claim_next_job()
+        self.assertEqual((claimed.id, claimed.attempts), (stranded.id, 2))
+        self.assertIsNone(claim_next_job())
+        exhausted.refresh_from_db()
+        alive.refresh_from_db()
+        self.assertEqual(exhausted.status, SummaryJob.STATUS_FAILED)
+        self.assertEqual((alive.status, alive.attempts), (SummaryJob.STATUS_RUNNING, 1))
+
+        # 임대를 연장한 작업은 다시 가져가지 않습니다.
+        SummaryJob.objects.filter(id=claimed.id).update(updated_at=expired)
+        renew_job_leases([claimed.id])
+        self.assertIsNone(claim_next_job())
+
+    def test_rate_limited_job_is_retried_later(self):
+        self.create_job()
+        job = claim_next_job()
+        error = SummarizationError("LLM API 호출 실패: 한도 초과", 429)
+        with mock.patch('core.summarization.summarize_project_items', side_effect=error):
+            job = run_summary_job(job)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (SummaryJob.STATUS_PENDING, 0))
+        self.assertGreater(job.run_after, dj_timezone.now())
+        self.assertIsNone(claim_next_job())
+
+        SummaryJob.objects.filter(id=job.id).update(run_after=dj_timezone.now())
+        self.assertEqual(claim_next_job().id, job.id)
+
+    def test_other_errors_fail_the_job(self):
+        self.create_job()
+        job = claim_next_job()
+        with mock.patch('core.summarization.summarize_project_items', side_effect=SummarizationError("실패", 500)):
+            run_summary_job(job)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.error), (SummaryJob.STATUS_FAILED, "실패"))
+
+    def test_unexpected_errors_are_logged_and_not_retried(self):
+        self.create_job()
+        job = claim_next_job()
+        with mock.patch('core.summarization.summarize_project_items', side_effect=KeyError('mode')), \
+                self.assertLogs('core.summarization', 'ERROR') as logs:
+            run_summary_job(job)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.error), (SummaryJob.STATUS_FAILED, "'mode'"))
+        self.assertIn('Traceback', logs.output[0])
+
+    def test_result_of_a_reclaimed_attempt_is_ignored(self):
+        self.create_job()
+        job = claim_next_job()
+        # 임대가 만료돼 다른 워커가 다시 가져간 상태
+        SummaryJob.objects.filter(id=job.id).update(attempts=2)
+        job = run_summary_job(job)
+        self.assertEqual((job.status, job.attempts), (SummaryJob.STATUS_RUNNING, 2))
+        self.assertFalse(Summary.objects.filter(jobs=job).exists())
+
+    def test_command_continues_after_a_failed_future(self):
+        first, second = self.create_job(), self.create_job()
+
+        def run(job):
+            if job.id == first.id:
+                raise RuntimeError("연결 끊김")
+            job.status = SummaryJob.STATUS_FAILED
+            job.error = '실패'
+            return job
+
+        out = StringIO()
+        with mock.patch('core.management.commands.process_summary_jobs.run_summary_job_in_thread', side_effect=run), \
+                self.assertLogs('core.management.commands.process_summary_jobs', 'ERROR'):
+            call_command('process_summary_jobs', once=True, workers=1, interval=0.01, stdout=out)
+        self.assertIn(f"작업 {first.id} 처리 중 오류: 연결 끊김", out.getvalue())
+        self.assertIn(f"작업 {second.id} 실패: 실패", out.getvalue())
+
+
+@override_settings(SUMMARY_CACHE_TTL=3600, SUMMARY_CACHE_MAX_ENTRIES=100)
+class SummaryCacheTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(project_name='캐시', author_email='a@example.com', project_code='CACHE')
+        material = ProjectMaterial.objects.create(
+            project=self.project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        Item.objects.create(
+            project=self.project, project_material=material, channel_name='github',
+            title='배포', body='서버 배포 완료', link='https://github.com/example/repo/pull/1', is_fixed=True
+        )
+        self.llm = FakeLLMClient(model_name='fake-a')
+        self.enterContext(mock.patch('core.summarization.get_llm_client', side_effect=lambda: self.llm))
+        self.generate = self.enterContext(mock.patch.object(self.llm, '_generate', wraps=self.llm._generate))
+
+    def test_same_input_reuses_the_response(self):
+        first, info = summarize_project_items(self.project)
+        self.assertIs(info['cache_hit'], False)
+        second, info = summarize_project_items(self.project)
+        self.assertIs(info['cache_hit'], True)
+        self.assertEqual(self.generate.call_count, 1)
+        self.assertEqual(second.ai_request_id, first.ai_request_id)
+        self.assertEqual(second.content, first.content)
+
+        # 모델이 바뀌면 다시 호출합니다.
+        self.llm.model_name = 'fake-b'
+        _, info = summarize_project_items(self.project)
+        self.assertIs(info['cache_hit'], False)
+        self.assertEqual(self.generate.call_count, 2)
+
+    def test_expired_entries_are_not_used(self):
+        summarize_project_items(self.project)
+        AIRequest.objects.update(created_at=dj_timezone.now() - timedelta(hours=2))
+        _, info = summarize_project_items(self.project)
+        self.assertIs(info['cache_hit'], False)
+        self.assertEqual(self.generate.call_count, 2)
+
+    @override_settings(SUMMARY_CACHE_TTL=0)
+    def test_zero_ttl_disables_the_cache(self):
+        summarize_project_items(self.project)
+        _, info = summarize_project_items(self.project)
+        self.assertIs(info['cache_hit'], False)
+        self.assertEqual(self.generate.call_count, 2)
+        self.assertFalse(AIRequest.objects.exclude(content_hash='').exists())
+
+    @override_settings(SUMMARY_CACHE_MAX_ENTRIES=2)
+    def test_eviction_keeps_the_newest_entries(self):
+        for index in range(3):
+            request_llm(f"입력 {index}", '요약 요청')
+        self.assertEqual(AIRequest.objects.exclude(content_hash='').count(), 2)
+        self.assertEqual(AIRequest.objects.get(content_hash='').id, AIRequest.objects.order_by('id').first().id)
+        self.assertEqual(AIRequest.objects.count(), 3)
+
+    @override_settings(SUMMARY_CACHE_MAX_ENTRIES=2)
+    def test_eviction_follows_created_at_not_id(self):
+        now = dj_timezone.now()
+        for index, age in enumerate((1, 3, 2)):
+            request_llm(f"입력 {index}", '요약 요청')
+            AIRequest.objects.filter(content_hash=prompt_hash(f"입력 {index}")).update(
+                created_at=now - timedelta(minutes=age)
+            )
+        evict_summary_cache()
+        # id가 가장 작지 않아도 가장 오래된 항목(입력 1)이 지워집니다.
+        self.assertEqual(
+            sorted(str(text) for text in AIRequest.objects.exclude(content_hash='').values_list('input', flat=True)),
+            ['입력 0', '입력 2'],
+        )
+
+
+@override_settings(LLM_BACKEND='fake', LLM_FAKE_LATENCY=0.0, SUMMARY_CACHE_TTL=0)
+class SummaryChunkingTests(TestCase):
+    BUDGET = 400
+
+    def item_texts(self, count=60):
+        return [
+            (index, f"제목: 아이템 {index}\n내용: " + f"서버 배포와 API 변경 사항 {index}. " * (3 + index * 7 % 11))
+            for index in range(count)
+        ]
+
+    def changed_chunks(self, before, after):
+        before = {chunk_hash(chunk) for chunk in split_into_chunks(before, self.BUDGET)}
+        after = [chunk_hash(chunk) for chunk in split_into_chunks(after, self.BUDGET)]
+        return len(before), sum(1 for key in after if key not in before)
+
+    def test_chunks_respect_the_budget(self):
+        item_texts = self.item_texts() + [(100, '아주 긴 본문 ' * 1000)]
+        chunks = split_into_chunks(item_texts, self.BUDGET)
+        self.assertEqual([item for chunk in chunks for item in chunk], item_texts)
+        for chunk in chunks:
+            tokens = sum(estimate_tokens(text) for _, text in chunk)
+            self.assertTrue(tokens <= self.BUDGET or len(chunk) == 1, chunk)
+        self.assertGreater(len(chunks), 5)
+
+    def test_boundaries_are_stable_under_edits(self):
+        item_texts = self.item_texts()
+        edited = list(item_texts)
+        edited[3] = (3, edited[3][1] + ' 수정')
+        total, changed = self.changed_chunks(item_texts, edited)
+        self.assertGreater(total, 5)
+        self.assertLessEqual(changed, 2)
+
+        # 앞쪽 아이템을 지우거나 추가해도 이후 청크는 그대로입니다.
+        self.assertLessEqual(self.changed_chunks(item_texts, item_texts[1:])[1], 2)
+        self.assertLessEqual(self.changed_chunks(item_texts, [(-1, '새 아이템 ' * 50)] + item_texts)[1], 2)
+
+    @override_settings(SUMMARY_MAX_INPUT_TOKENS=150, SUMMARY_CHUNK_TOKEN_BUDGET=100)
+    def test_large_projects_reduce_hierarchically(self):
+        project = Project.objects.create(project_name='대형', author_email='a@example.com', project_code='HUGE')
+        material = ProjectMaterial.objects.create(
+            project=project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        for index, text in self.item_texts(30):
+            Item.objects.create(
+                project=project, project_material=material, channel_name='github', title='', body=text,
+                link=f"https://github.com/example/repo/pull/{index}", is_fixed=True
+            )
+        summary, info = summarize_project_items(project, 'map_reduce')
+        self.assertGreaterEqual(info['reduce_levels'], 1)
+        self.assertTrue(AIRequest.objects.filter(description__contains='중간 통합').exists())
+        final_input = AIRequest.objects.with_blobs('input').get(id=summary.ai_request_id).input
+        self.assertLessEqual(estimate_tokens(final_input), 150)
+
+
+class InterruptedLLMClient(FakeLLMClient):
+    """첫 조각을 보낸 뒤 연결이 끊기는 fake 백엔드"""
+
+    async def _stream(self, prompt):
+        yield '요약 '
+        raise ConnectionError("stream interrupted")
+
+
+class FlakyLLMClient(FakeLLMClient):
+    """처음 failures번은 연결 오류를 내는 fake 백엔드"""
+
+    def __init__(self, failures, **kwargs):
+        super().__init__(**kwargs)
+        self.failures = failures
+        self.calls = 0
+
+    def _generate(self, prompt):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("connection reset")
+        return super()._generate(prompt)
+
+
+class LLMClientTests(SimpleTestCase):
+    def test_fake_backend_is_deterministic(self):
+        client = FakeLLMClient()
+        self.assertEqual(client.generate('자료'), client.generate('자료'))
+        self.assertNotEqual(client.generate('자료'), client.generate('다른 자료'))
+
+    def test_timeout(self):
+        client = FakeLLMClient(latency=0.05, timeout=0.01, max_retries=0)
+        with self.assertRaises(LLMTimeout):
+            client.generate('자료')
+
+    def test_retries_transient_errors(self):
+        client = FlakyLLMClient(failures=2, max_retries=2, retry_backoff=0)
+        self.assertTrue(client.generate('자료'))
+        self.assertEqual(client.calls, 3)
+
+        client = FlakyLLMClient(failures=3, max_retries=2, retry_backoff=0)
+        with self.assertRaises(LLMError):
+            client.generate('자료')
+
+    @override_settings(LLM_BACKEND='fake', LLM_FAKE_LATENCY=0.0)
+    def test_one_client_per_process(self):
+        client = get_llm_client()
+        self.assertIsInstance(client, FakeLLMClient)
+        self.assertIs(get_llm_client(), client)
+
+
+class LLMLimiterTests(SimpleTestCase):
+    def test_rate_limit_fails_fast(self):
+        limiter = LLMLimiter(rate=0.001, burst=1)
+        with limiter.slot():
+            pass
+        with self.assertRaises(LLMRateLimited):
+            limiter.acquire()
+
+    def test_full_queue_fails_fast(self):
+        limiter = LLMLimiter(max_concurrency=1, max_queue=0)
+        limiter.acquire()
+        started = time.monotonic()
+        with self.assertRaises(LLMOverloaded):
+            limiter.acquire()
+        self.assertLess(time.monotonic() - started, 0.1)
+
+    def test_waits_for_free_slot(self):
+        limiter = LLMLimiter(max_concurrency=1, max_queue=1, queue_timeout=0.05)
+        limiter.acquire()
+        with self.assertRaises(LLMOverloaded):
+            limiter.acquire()
+        threading.Timer(0.01, limiter.release).start()
+        limiter.queue_timeout = 1.0
+        limiter.acquire()
+        self.assertEqual(limiter.stats(), {'active': 1, 'waiting': 0})
+
+    def test_single_flight_shares_result(self):
+        flights = SingleFlight()
+        calls = []
+        results = []
+
+        def work():
+            calls.append(1)
+            time.sleep(0.05)
+            return 'summary'
+
+        threads = [threading.Thread(target=lambda: results.append(flights.do('key', work))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(shared for _, shared in results), [False, True, True, True, True])
+        self.assertEqual({result for result, _ in results}, {'summary'})
+
+    def test_single_flight_followers_use_the_queue(self):
+        limiter = LLMLimiter(max_concurrency=1, max_queue=1)
+        flights = SingleFlight()
+        release = threading.Event()
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flights.do('key', release.wait, limiter=limiter)))
+        leader.start()
+        while not flights._calls:
+            time.sleep(0.001)
+
+        with self.assertRaises(LLMOverloaded):
+            flights.do('key', release.wait, limiter=limiter, timeout=0.01)
+        self.assertEqual(limiter.stats(), {'active': 0, 'waiting': 0})
+
+        follower = threading.Thread(target=lambda: results.append(flights.do('key', release.wait, limiter=limiter)))
+        follower.start()
+        while limiter.stats()['waiting'] < 1:
+            time.sleep(0.001)
+        # follower가 대기열 자리를 차지하고 있으므로 다른 follower는 바로 거절됩니다.
+        with self.assertRaises(LLMOverloaded):
+            flights.do('key', release.wait, limiter=limiter, timeout=1.0)
+        release.set()
+        leader.join()
+        follower.join()
+        self.assertEqual(sorted(shared for _, shared in results), [False, True])
+        self.assertEqual(limiter.stats(), {'active': 0, 'waiting': 0})
+
+
+def parse_sse(content):
+    events = []
+    for block in content.decode('utf-8').strip().split('\n\n'):
+        lines = dict(line.split(': ', 1) for line in block.split('\n'))
+        events.append((lines['event'], json.loads(lines['data'])))
+    return events
+
+
+class SummarizeItemsStreamTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            project_name='스트리밍', author_email='a@example.com', project_code='STREAM'
+        )
+        material = ProjectMaterial.objects.create(
+            project=self.project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        Item.objects.create(
+            project=self.project, project_material=material, channel_name='github',
+            title='배포', body='서버 배포 완료', link='https://github.com/example/repo/pull/1',
+            is_fixed=True, is_active=True
+        )
+        self.url = f'/api/projects/{self.project.id}/summarize-items/stream/'
+
+    async def test_streams_deltas_and_persists_summary(self):
+        client = FakeLLMClient(response='요약 결과')
+        with mock.patch('core.summarization.get_llm_client', return_value=client):
+            response = await self.async_client.post(self.url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['Content-Type'], 'text/event-stream')
+            content = b''.join([chunk async for chunk in response.streaming_content])
+
+        events = parse_sse(content)
+        self.assertEqual([event for event, _ in events], ['start', 'delta', 'delta', 'done'])
+        self.assertEqual(events[0][1]['cache_hit'], False)
+        self.assertEqual([data['text'] for event, data in events if event == 'delta'], ['요약 ', '결과'])
+        self.assertEqual(events[-1][1]['content'], '요약 결과')
+
+        summary = await Summary.objects.with_blobs().aget(project=self.project)
+        self.assertEqual(summary.content, '요약 결과')
+        ai_request = await AIRequest.objects.with_blobs('output').aget(id=summary.ai_request_id)
+        self.assertEqual(ai_request.output, '요약 결과')
+
+    async def test_stream_error_saves_nothing(self):
+        client = InterruptedLLMClient(retry_backoff=0)
+        with mock.patch('core.summarization.get_llm_client', return_value=client):
+            response = await self.async_client.post(self.url)
+            content = b''.join([chunk async for chunk in response.streaming_content])
+
+        events = parse_sse(content)
+        self.assertEqual([event for event, _ in events], ['start', 'delta', 'error'])
+        self.assertFalse(await AIRequest.objects.aexists())
+        self.assertFalse(await Summary.objects.aexists())
+
+    async def test_project_without_items(self):
+        await Item.objects.filter(project=self.project).aupdate(is_fixed=False)
+        response = await self.async_client.post(self.url)
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(LLM_MAX_CONCURRENCY=1, LLM_MAX_QUEUE=0, SUMMARY_CACHE_TTL=0)
+    async def test_unstarted_stream_releases_its_slot(self):
+        limiter = get_llm_limiter()
+        client = FakeLLMClient(response='요약 결과')
+        with mock.patch('core.summarization.get_llm_client', return_value=client):
+            response = await self.async_client.post(self.url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(limiter.stats()['active'], 1)
+            # 응답을 보내기 전에 연결이 끊긴 경우: 제너레이터는 시작되지 않고 close()만 호출됩니다.
+            await sync_to_async(response.close)()
+            self.assertEqual(limiter.stats()['active'], 0)
+
+            response = await self.async_client.post(self.url)
+            content = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(parse_sse(content)[-1][0], 'done')
+        self.assertEqual(limiter.stats()['active'], 0)
+
+    @override_settings(SUMMARY_CACHE_TTL=0)
+    async def test_concurrent_streams_share_one_llm_call(self):
+        client = FakeLLMClient(response='요약 결과', latency=0.05)
+
+        async def consume(response):
+            return parse_sse(b''.join([chunk async for chunk in response.streaming_content]))
+
+        with mock.patch('core.summarization.get_llm_client', return_value=client), \
+                mock.patch.object(client, '_stream', wraps=client._stream) as stream:
+            responses = await asyncio.gather(AsyncClient().post(self.url), AsyncClient().post(self.url))
+            results = await asyncio.gather(*(consume(response) for response in responses))
+
+        self.assertEqual(stream.call_count, 1)
+        self.assertEqual(sorted(events[0][1]['coalesced'] for events in results), [False, True])
+        for events in results:
+            self.assertEqual(events[-1][0], 'done')
+            self.assertEqual(''.join(data['text'] for event, data in events if event == 'delta'), '요약 결과')
+        self.assertEqual(results[0][-1][1]['id'], results[1][-1][1]['id'])
+        self.assertEqual(await Summary.objects.acount(), 1)
+
+    @override_settings(LLM_BACKEND='fake', LLM_FAKE_LATENCY=0.0, SUMMARY_CACHE_TTL=0, SUMMARY_CHUNK_TOKEN_BUDGET=10)
+    async def test_map_step_runs_off_the_request_thread(self):
+        material = await ProjectMaterial.objects.aget(project=self.project)
+        for index in range(2, 6):
+            await Item.objects.acreate(
+                project=self.project, project_material=material, channel_name='github',
+                title=f"배포 {index}", body='서버 배포와 API 변경 사항을 정리했습니다. ' * 3,
+                link=f"https://github.com/example/repo/pull/{index}", is_fixed=True, is_active=True
+            )
+        threads = []
+        generate = summarization.generate_summary_text
+
+        def record_thread(*args):
+            threads.append(threading.current_thread())
+            return generate(*args)
+
+        with mock.patch('core.summarization.generate_summary_text', side_effect=record_thread):
+            response = await self.async_client.post(self.url + '?mode=map_reduce')
+            content = b''.join([chunk async for chunk in response.streaming_content])
+
+        events = parse_sse(content)
+        self.assertEqual(events[0][1]['mode'], 'map_reduce')
+        self.assertGreater(events[0][1]['chunks_count'], 1)
+        self.assertEqual(events[-1][0], 'done')
+        # 부분 요약의 LLM 호출은 ORM을 실행하는 요청 스레드(여기서는 메인 스레드)가 아닌 곳에서 실행됩니다.
+        self.assertEqual(len(threads), events[0][1]['chunks_count'])
+        self.assertNotIn(threading.main_thread(), threads)
+        self.assertEqual(await SummaryChunk.objects.filter(project=self.project).acount(), len(threads))
+
+
+@override_settings(LLM_BACKEND='fake', LLM_FAKE_LATENCY=0.0, LLM_MAX_CONCURRENCY=1, LLM_MAX_QUEUE=0)
+class SummarizeItemsLimitTests(TestCase):
+    def setUp(self):
+        project = Project.objects.create(
+            project_name='제한', author_email='a@example.com', project_code='LIMIT'
+        )
+        material = ProjectMaterial.objects.create(
+            project=project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        Item.objects.create(
+            project=project, project_material=material, channel_name='github',
+            title='배포', body='서버 배포 완료', link='https://github.com/example/repo/pull/1',
+            is_fixed=True, is_active=True
+        )
+        self.url = f'/api/projects/{project.id}/summarize-items/'
+
+    def test_saturated_limiter_returns_503(self):
+        limiter = get_llm_limiter()
+        limiter.acquire()
+        try:
+            response = self.client.post(self.url)
+            stream_response = self.client.post(self.url + 'stream/')
+        finally:
+            limiter.release()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(stream_response.status_code, 503)
+        self.assertFalse(Summary.objects.exists())
+
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 201)
+        self.assertIs(response.json()['coalesced'], False)
+
+    def test_follower_timeout_returns_503(self):
+        overloaded = LLMOverloaded("120초 안에 같은 요청의 결과를 받지 못했습니다.")
+        with mock.patch.object(summarization._summary_flights, 'do', side_effect=overloaded):
+            response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('같은 요청의 결과', response.json()['detail'])
+
+
+class BlobStorageTests(TestCase):
+    def test_texts_are_compressed_and_deduplicated(self):
+        project = Project.objects.create(project_name='블롭', author_email='a@example.com', project_code='BLOB')
+        text = '## 요약\n\n' + '서버 배포와 API 변경 사항을 정리했습니다. ' * 50
+        ai_request = AIRequest.objects.create(input='자료 ' * 100, output=text, description='요약 요청')
+        Summary.objects.create(project=project, ai_request=ai_request, content=text)
+
+        self.assertEqual(TextBlob.objects.count(), 2)
+        blob = TextBlob.objects.get(size=len(text.encode('utf-8')))
+        self.assertLess(len(blob.data), blob.size)
+
+        with self.assertNumQueries(1):
+            summary = Summary.objects.with_blobs().get(project=project)
+            self.assertEqual(summary.content, text)
+        self.assertEqual(AIRequest.objects.get(id=ai_request.id).output, text)
+        self.assertTrue(Summary.objects.filter(content=text).exists())
+
+        summary.content = '수정된 요약'
+        summary.save()
+        self.assertEqual(Summary.objects.get(id=summary.id).content, '수정된 요약')
+
+    def test_only_hash_lookups_are_supported(self):
+        AIRequest.objects.create(input='자료', output='요약', description='요약 요청')
+        self.assertEqual(AIRequest.objects.filter(output__in=['요약', '다른 요약']).count(), 1)
+        self.assertEqual(AIRequest.objects.filter(output__isnull=False).count(), 1)
+        for lookup in ('output__icontains', 'output__contains', 'output__startswith', 'output__lower'):
+            with self.subTest(lookup=lookup), self.assertRaises(FieldError):
+                AIRequest.objects.filter(**{lookup: '요약'}).count()
+
+
+class BlobTransactionTests(TransactionTestCase):
+    def test_blob_is_not_left_behind_when_the_row_fails(self):
+        with self.assertRaises(IntegrityError):
+            AIRequest.objects.create(input='자료 ' * 100, output='요약', description=None)
+        self.assertFalse(TextBlob.objects.exists())
+
+        ai_request = AIRequest.objects.create(input='자료', output='요약', description='요약 요청')
+        with self.assertRaises(IntegrityError):
+            AIRequest.objects.filter(id=ai_request.id).update(output='새 요약 ' * 100, description=None)
+        self.assertEqual(TextBlob.objects.count(), 2)
+
+
+class RenderedHtmlTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_render_cache()
+        self.project = Project.objects.create(project_name='렌더링', author_email='a@example.com', project_code='MD')
+        for index in range(3):
+            Summary.objects.create(project=self.project, content=f"## 요약 {index}\n\n```python\nprint({index})\n```")
+
+    def test_rendered_html_is_optional_and_rendered_once(self):
+        response = self.client.get('/api/summaries/')
+        self.assertNotIn('rendered_html', response.json()['results'][0])
+
+        with mock.patch('core.markdown_render.render_markdown', wraps=markdown.markdown) as render:
+            response = self.client.get('/api/summaries/?rendered_html=true')
+            self.assertEqual(render.call_count, 3)
+            self.client.get('/api/summaries/?rendered_html=true')
+            self.assertEqual(render.call_count, 3)
+
+        html = response.json()['results'][0]['rendered_html']
+        self.assertIn('<h2>', html)
+        # 조회(GET)는 렌더링 결과를 DB에 쓰지 않습니다.
+        self.assertFalse(RenderedMarkdown.objects.exists())
+
+    def test_saved_summaries_store_their_html(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            summary = Summary.objects.create(project=self.project, content="## 새 요약\n\n본문")
+        self.assertIn('<h2>', RenderedMarkdown.objects.with_blobs().get().html)
+
+        clear_render_cache()
+        with mock.patch('core.markdown_render.render_markdown') as render:
+            self.assertIn('<h2>', rendered_html(Summary.objects.get(id=summary.id)))
+        render.assert_not_called()
+
+    def test_render_command_replaces_stale_results(self):
+        call_command('render_summaries', stdout=StringIO())
+        self.assertEqual(RenderedMarkdown.objects.count(), 3)
+        with override_settings(MARKDOWN_EXTENSIONS=['extra']):
+            call_command('render_summaries', stdout=StringIO())
+        self.assertEqual(RenderedMarkdown.objects.count(), 3)
+        self.assertNotIn('codehilite', RenderedMarkdown.objects.with_blobs().first().html)
+
+    def test_concurrent_store_keeps_the_outer_transaction_usable(self):
+        summary = Summary.objects.with_blobs().first()
+        with transaction.atomic():
+            store_rendered_html(summary)
+            # 다른 요청이 조회와 저장 사이에 먼저 저장한 경우와 같이, 조회에서 찾지 못한 채 다시 저장합니다.
+            with mock.patch('core.markdown_render.RenderedMarkdown.objects.filter') as lookup:
+                lookup.return_value.exists.return_value = False
+                store_rendered_html(summary)
+            self.assertEqual(RenderedMarkdown.objects.count(), 1)
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=0)
+class QueryBudgetTests(TestCase):
+    """목록/중첩 엔드포인트의 쿼리 수가 행 수와 관계없이 고정되어 있는지 확인합니다. (응답 캐시 없이 측정)"""
+    # 엔드포인트별 쿼리 예산 (페이지네이션 count 쿼리, 조건부 GET 검증 값 쿼리 포함)
+    BUDGETS = {
+        '/api/projects/{project}/': 6,
+        '/api/projects/{project}/materials/': 2,
+        '/api/projects/{project}/items/': 2,
+        '/api/projects/{project}/summaries/': 2,
+        '/api/projects/{project}/latest-summary/': 2,
+        '/api/materials/': 2,
+        '/api/materials/{material}/': 3,
+        '/api/materials/{material}/items/': 2,
+        '/api/summaries/': 2,
+        '/api/summary-jobs/': 3,
+        '/api/items/': 3,
+        '/api/items/{item}/matching_recommendation/': 2,
+        '/api/recommendations/': 3,
+        '/api/recommendations/by_item/?item_id={item}': 1,
+    }
+
+    def setUp(self):
+        self.project = Project.objects.create(project_name='쿼리', author_email='a@example.com', project_code='QRY')
+        self.material = ProjectMaterial.objects.create(
+            project=self.project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        self.item = None
+
+    def add_rows(self, count):
+        for index in range(count):
+            material = ProjectMaterial.objects.create(
+                project=self.project, material_type='github', material_link=f"https://github.com/example/repo{index}"
+            )
+            item = Item.objects.create(
+                project=self.project, project_material=self.material, channel_name='github',
+                title=f"아이템 {index}", body='본문', link=f"https://github.com/example/repo/pull/{material.id}"
+            )
+            self.item = self.item or item
+            Recommendation.objects.create(project=self.project, item=self.item, project_material=material)
+            summary = Summary.objects.create(project=self.project, content=f"## 요약 {index}")
+            SummaryJob.objects.create(project=self.project, status='completed', summary=summary)
+
+    def count_queries(self):
+        counts = {}
+        for path in self.BUDGETS:
+            url = path.format(project=self.project.id, material=self.material.id, item=self.item.id)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            counts[path] = len(queries)
+        return counts
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.add_rows(2)
+        small = self.count_queries()
+        self.add_rows(25)
+        large = self.count_queries()
+
+        self.assertEqual(small, self.BUDGETS)
+        self.assertEqual(large, self.BUDGETS)
+
+    @override_settings(PROJECT_DETAIL_NESTED_LIMIT=3)
+    def test_project_detail_nested_lists_are_bounded(self):
+        self.add_rows(5)
+        with self.assertNumQueries(6):
+            data = self.client.get(f"/api/projects/{self.project.id}/").json()
+
+        self.assertEqual(len(data['items']), 3)
+        self.assertEqual(data['items_count'], 5)
+        self.assertEqual(data['materials_count'], 6)
+        self.assertEqual([item['title'] for item in data['items']], ['아이템 4', '아이템 3', '아이템 2'])
+        self.assertTrue(data['summaries_url'].endswith(f"/api/summaries/?project_id={self.project.id}"))
+        materials = self.client.get(data['materials_url']).json()
+        self.assertEqual(materials['count'], 6)
+
+
+class CursorPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        project = Project.objects.create(project_name='커서', author_email='a@example.com', project_code='CUR')
+        material = ProjectMaterial.objects.create(
+            project=project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        Item.objects.bulk_create([
+            Item(
+                project=project, project_material=material, channel_name='github',
+                title=f"아이템 {index}", body='본문', link=f"https://github.com/example/repo/pull/{index}"
+            )
+            for index in range(45)
+        ])
+        # created_at이 같은 행이 여러 페이지에 걸쳐도 id로 이어지는지 확인합니다.
+        tied = Item.objects.order_by('id').values_list('id', flat=True)[10:30]
+        Item.objects.filter(id__in=list(tied)).update(created_at=Item.objects.order_by('id')[10].created_at)
+        self.expected = list(Item.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+
+    def test_cursor_pages_cover_all_rows_in_order(self):
+        seen, pages = [], []
+        url = '/api/items/?pagination=cursor'
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                data = self.client.get(url).json()
+            sql = ' '.join(query['sql'] for query in queries).upper()
+            self.assertNotIn('OFFSET', sql)
+            self.assertNotIn('COUNT(', sql)
+            self.assertNotIn('count', data)
+            seen += [item['id'] for item in data['results']]
+            pages.append(data)
+            url = data['next']
+        self.assertEqual(seen, self.expected)
+        self.assertEqual(len(pages), 3)
+        self.assertIsNone(pages[0]['previous'])
+
+        previous = self.client.get(pages[2]['previous']).json()
+        self.assertEqual(previous['results'], pages[1]['results'])
+        first = self.client.get(previous['previous']).json()
+        self.assertEqual(first['results'], pages[0]['results'])
+        self.assertIsNone(first['previous'])
+
+    def test_count_only_when_requested(self):
+        data = self.client.get('/api/items/?pagination=cursor&count=true').json()
+        self.assertEqual(data['count'], 45)
+        self.assertEqual(self.client.get('/api/items/?cursor=invalid').status_code, 404)
+        self.assertEqual(self.client.get('/api/items/').json()['count'], 45)
+
+
+class QueryPlanTests(TestCase):
+    """주요 조회 경로가 items/recommendations/summaries 테이블 전체를 스캔하지 않는지 EXPLAIN QUERY PLAN으로 확인합니다."""
+    TABLES = ('items', 'recommendations', 'summaries')
+
+    def setUp(self):
+        cache.clear()
+        self.project = Project.objects.create(project_name='계획', author_email='a@example.com', project_code='PLAN')
+        self.material = ProjectMaterial.objects.create(
+            project=self.project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        self.item = Item.objects.create(
+            project=self.project, project_material=self.material, channel_name='github',
+            title='아이템', body='본문', link='https://github.com/example/repo/pull/1', is_fixed=True
+        )
+        Recommendation.objects.create(project=self.project, item=self.item, project_material=self.material)
+        Summary.objects.create(project=self.project, content='## 요약')
+
+    def capture(self, run):
+        statements = []
+
+        def execute(execute, sql, params, many, context):
+            if sql.lstrip().upper().startswith('SELECT'):
+                statements.append((sql, params))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(execute):
+            run()
+        return statements
+
+    def full_scans(self, statements):
+        scans = []
+        for sql, params in statements:
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                plan = [row[-1] for row in cursor.fetchall()]
+            for step in plan:
+                # "SCAN items USING INDEX ..."는 인덱스 순서대로 읽는 것이므로 허용합니다.
+                match = re.match(r'SCAN (\w+)(?: AS \w+)?$', step)
+                if match and match.group(1) in self.TABLES:
+                    scans.append((step, sql))
+        return scans
+
+    def test_hot_paths_use_indexes(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('EXPLAIN QUERY PLAN은 SQLite 전용입니다.')
+        project_id, item_id = self.project.id, self.item.id
+        paths = [
+            f"/api/items/{item_id}/matching_recommendation/",
+            f"/api/recommendations/by_item/?item_id={item_id}",
+            f"/api/projects/{project_id}/latest-summary/",
+            "/api/items/?is_fixed=true",
+            f"/api/items/?project_id={project_id}&is_fixed=false",
+            f"/api/items/?project_id={project_id}&pagination=cursor",
+            f"/api/recommendations/?project_id={project_id}&pagination=cursor",
+            f"/api/summaries/?project_id={project_id}&pagination=cursor",
+        ]
+        for path in paths:
+            statements = self.capture(lambda path=path: self.assertEqual(self.client.get(path).status_code, 200))
+            self.assertEqual(self.full_scans(statements), [], path)
+
+        match = {
+            'project_material_id': self.material.id,
+            'external_data': {
+                'title': '새 아이템', 'body': '본문', 'link': 'https://github.com/example/repo/pull/2',
+                'created_at': '2025-01-01T00:00:00Z', 'updated_at': '2025-01-01T00:00:00Z',
+            },
+        }
+        statements = self.capture(lambda: create_items_from_matches(self.project, [match], is_fixed=False))
+        self.assertEqual(self.full_scans(statements), [])
+
+    def test_item_identity_is_unique(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Item.objects.create(
+                project=self.project, project_material=self.material, channel_name='github',
+                title='중복', body='본문', link=self.item.link
+            )
+
+
+class SparseFieldsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.project = Project.objects.create(project_name='필드', author_email='a@example.com', project_code='FLD')
+        material = ProjectMaterial.objects.create(
+            project=self.project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        for index in range(3):
+            item = Item.objects.create(
+                project=self.project, project_material=material, channel_name='github',
+                title=f"아이템 {index}", body='아주 긴 본문 ' * 100, link=f"https://github.com/example/repo/pull/{index}"
+            )
+            Recommendation.objects.create(project=self.project, item=item, project_material=material)
+        Summary.objects.create(project=self.project, content='## 요약\n\n' + '내용 ' * 100)
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        return response.json(), ' '.join(query['sql'] for query in queries)
+
+    def test_fields_are_trimmed_and_pushed_down(self):
+        data, sql = self.get('/api/items/?fields=id,title')
+        self.assertEqual(set(data['results'][0]), {'id', 'title'})
+        self.assertNotIn('"items"."body"', sql)
+        self.assertNotIn('JOIN', sql)
+
+        data, sql = self.get('/api/summaries/?fields=id,project')
+        self.assertEqual(set(data['results'][0]), {'id', 'project'})
+        self.assertNotIn('text_blobs', sql)
+
+    def test_related_fields_only_when_expanded(self):
+        data, sql = self.get('/api/recommendations/')
+        self.assertNotIn('item_title', data['results'][0])
+        self.assertNotIn('JOIN', sql)
+
+        data, sql = self.get('/api/recommendations/?fields=id&expand=item_title')
+        self.assertEqual(set(data['results'][0]), {'id', 'item_title'})
+        self.assertEqual(data['results'][0]['item_title'], '아이템 0')
+        self.assertIn('JOIN "items"', sql)
+        self.assertNotIn('JOIN "projects"', sql)
+
+        data, _ = self.get(f"/api/projects/{self.project.id}/items/?expand=project_name,material_type")
+        self.assertEqual((data[0]['project_name'], data[0]['material_type']), ('필드', 'github'))
+
+    def test_fields_only_trim_write_responses(self):
+        material = ProjectMaterial.objects.get(project=self.project)
+        payload = {
+            'project': self.project.id, 'project_material': material.id, 'channel_name': 'github',
+            'title': '새 아이템', 'body': '본문', 'link': 'https://github.com/example/repo/pull/9',
+        }
+        response = self.client.post('/api/items/?fields=id', payload, content_type='application/json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(set(response.json()), {'id'})
+        item = Item.objects.get(id=response.json()['id'])
+        self.assertEqual((item.title, item.body), ('새 아이템', '본문'))
+
+        response = self.client.patch(
+            f"/api/items/{item.id}/?fields=title&expand=project_name", {'body': '수정한 본문'},
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json(), {'title': '새 아이템', 'project_name': '필드'})
+        item.refresh_from_db()
+        self.assertEqual(item.body, '수정한 본문')
+
+    def test_project_detail_loads_only_requested_lists(self):
+        with self.assertNumQueries(2):
+            data, _ = self.get(f"/api/projects/{self.project.id}/?fields=id,items_count")
+        self.assertEqual(data, {'id': self.project.id, 'items_count': 3})
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=0)
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(project_name='조건부', author_email='a@example.com', project_code='ETAG')
+        self.material = ProjectMaterial.objects.create(
+            project=self.project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        self.item = Item.objects.create(
+            project=self.project, project_material=self.material, channel_name='github',
+            title='아이템', body='본문', link='https://github.com/example/repo/pull/1'
+        )
+
+    def test_unchanged_list_returns_304_before_serializing(self):
+        url = f"/api/items/?project_id={self.project.id}"
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertTrue(response.has_header('Last-Modified'))
+
+        with mock.patch('core.serializers.ItemSerializer.to_representation') as to_representation:
+            with self.assertNumQueries(1):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            to_representation.assert_not_called()
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+        self.item.title = '수정된 아이템'
+        self.item.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_project_detail_changes_with_nested_rows(self):
+        url = f"/api/projects/{self.project.id}/"
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        Summary.objects.create(project=self.project, content='## 요약')
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+        self.assertEqual(self.client.get('/api/projects/0/', HTTP_IF_NONE_MATCH=etag).status_code, 404)
+
+    def test_project_detail_changes_with_watermark_update(self):
+        url = f"/api/projects/{self.project.id}/"
+        etag = self.client.get(url)['ETag']
+
+        # QuerySet.update()로 워터마크만 옮겨도 자료 행이 바뀐 것으로 봐야 합니다.
+        advance_watermarks({self.material.id: dj_timezone.now()}, 'code_watermark')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.json()['materials'][0]['code_watermark'])
+
+    def test_expanded_list_changes_with_related_row(self):
+        url = f"/api/items/?project_id={self.project.id}&expand=material_type"
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        # 확장하지 않은 목록은 자료가 바뀌어도 같은 응답입니다.
+        plain_etag = self.client.get(f"/api/items/?project_id={self.project.id}")['ETag']
+
+        self.material.material_type = 'notion'
+        self.material.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['material_type'], 'notion')
+        self.assertEqual(
+            self.client.get(f"/api/items/?project_id={self.project.id}", HTTP_IF_NONE_MATCH=plain_etag).status_code, 304
+        )
+
+        detail = f"/api/items/{self.item.id}/?expand=material_type"
+        etag = self.client.get(detail)['ETag']
+        self.material.material_type = 'github'
+        self.material.save()
+        self.assertEqual(self.client.get(detail, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=300)
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_response_cache_stats()
+        self.projects = []
+        for code in ('CA', 'CB'):
+            project = Project.objects.create(project_name=code, author_email='a@example.com', project_code=code)
+            material = ProjectMaterial.objects.create(
+                project=project, material_type='github', material_link=f"https://github.com/example/{code}"
+            )
+            Item.objects.create(
+                project=project, project_material=material, channel_name='github',
+                title='아이템', body='본문', link=f"https://github.com/example/{code}/pull/1"
+            )
+            self.projects.append(project)
+
+    def test_hit_skips_database(self):
+        url = f"/api/items/?project_id={self.projects[0].id}"
+        first = self.client.get(url)
+        self.assertEqual(first['X-Cache'], 'MISS')
+
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(not_modified.status_code, 304)
+
+        stats = self.client.get('/api/cache-stats/').json()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+
+    def test_write_invalidates_only_its_project(self):
+        project, other = self.projects
+        urls = [
+            f"/api/items/?project_id={project.id}",
+            f"/api/projects/{project.id}/items/",
+            f"/api/projects/{other.id}/items/",
+        ]
+        for url in urls:
+            self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            item = project.items.get()
+            item.title = '수정된 아이템'
+            item.save()
+
+        for url in urls[:2]:
+            response = self.client.get(url)
+            self.assertEqual(response['X-Cache'], 'MISS', url)
+            self.assertIn('수정된 아이템', response.content.decode())
+        self.assertEqual(self.client.get(urls[2])['X-Cache'], 'HIT')
+
+        # 시그널이 없는 bulk_create도 무효화합니다.
+        match = {
+            'project_material_id': project.materials.get().id,
+            'external_data': {
+                'title': '새 아이템', 'body': '본문', 'link': 'https://github.com/example/CA/pull/2',
+                'created_at': '2025-01-01T00:00:00Z', 'updated_at': '2025-01-01T00:00:00Z',
+            },
+        }
+        create_items_from_matches(project, [match], is_fixed=False)
+        self.assertEqual(len(self.client.get(urls[1]).json()), 2)
+
+    def test_moving_item_invalidates_both_projects(self):
+        project, other = self.projects
+        urls = [f"/api/projects/{project.id}/items/", f"/api/projects/{other.id}/items/"]
+        for url in urls:
+            self.client.get(url)
+
+        item = project.items.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                f"/api/items/{item.id}/",
+                {'project': other.id, 'project_material': other.materials.get().id},
+                content_type='application/json',
+            )
+        self.assertEqual(response.status_code, 200)
+
+        for url, count in zip(urls, (0, 2)):
+            response = self.client.get(url)
+            self.assertEqual(response['X-Cache'], 'MISS', url)
+            self.assertEqual(len(response.json()), count)
+
+    def test_other_process_invalidates_locmem_responses(self):
+        project = self.projects[0]
+        url = f"/api/projects/{project.id}/items/"
+        self.client.get(url)
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+
+        # 워커(관리 명령) 프로세스의 무효화도 이 프로세스의 locmem 응답 캐시에 반영됩니다.
+        subprocess.run(
+            [
+                sys.executable, 'manage.py', 'shell', '-c',
+                f"from core.response_cache import bump_project_version; bump_project_version({project.id})",
+            ],
+            cwd=settings.BASE_DIR, check=True, capture_output=True,
+        )
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+
+    def test_previous_project_is_looked_up_only_when_caching(self):
+        item = self.projects[0].items.get()
+        with self.assertNumQueries(2):
+            item.save()
+        with override_settings(RESPONSE_CACHE_TIMEOUT=0), self.assertNumQueries(1):
+            item.save()
+
+    def test_file_backend(self):
+        with tempfile.TemporaryDirectory() as location:
+            backend = {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location}
+            with override_settings(CACHES={**settings.CACHES, 'default': backend}):
+                url = f"/api/projects/{self.projects[0].id}/"
+                self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+                self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+                self.assertTrue(os.listdir(location))
+
+
+class RendererTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        project = Project.objects.create(project_name='렌더러', author_email='a@example.com', project_code='RND')
+        material = ProjectMaterial.objects.create(
+            project=project, material_type='github', material_link='https://github.com/example/repo'
+        )
+        Item.objects.create(
+            project=project, project_material=material, channel_name='github',
+            title='아이템', body='본문', link='https://github.com/example/repo/pull/1'
+        )
+
+    def test_fast_json_matches_drf_json(self):
+        data = {
+            'created_at': datetime(2025, 1, 1, 9, 30, 0, 123456, tzinfo=UTC),
+            'score': Decimal('1.50'),
+            'detail': gettext_lazy('Not found.'),
+            'text': '한글 \u2028 줄',
+            'results': [{'id': 1, 'tags': ('a', 'b')}],
+        }
+        for media_type in ('application/json', 'application/json; indent=2'):
+            self.assertEqual(
+                FastJSONRenderer().render(data, media_type), JSONRenderer().render(data, media_type), media_type
+            )
+
+    def test_default_response_is_json(self):
+        response = self.client.get('/api/items/')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json()['results'][0]['title'], '아이템')
+
+    def test_msgpack_by_accept(self):
+        response = self.client.get('/api/items/', HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertEqual(_msgpack().unpackb(response.content), self.client.get('/api/items/').json())
+
+    def test_msgpack_not_acceptable_without_package(self):
+        with mock.patch('core.renderers._msgpack', return_value=None):
+            response = self.client.get('/api/items/', HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response.status_code, 406)
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command('benchmark_renderers', page_size=5, repeat=2, stdout=out, stderr=StringIO())
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['items'], 5)
+        self.assertEqual(set(report['renderers']), {'drf-json', 'fast-json (orjson)', 'msgpack'})
+        self.assertEqual(Project.objects.filter(project_name='renderer benchmark').count(), 0)
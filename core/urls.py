@@ -2,17 +2,21 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .api_views import (
     ProjectViewSet, ProjectMaterialViewSet, AIRequestViewSet,
-    SummaryViewSet, ItemViewSet, RecommendationViewSet
+    SummaryViewSet, SummaryJobViewSet, ItemViewSet, RecommendationViewSet
 )
+from .views import cache_stats, summarize_items_stream
 
 router = DefaultRouter()
 router.register(r'projects', ProjectViewSet)
 router.register(r'materials', ProjectMaterialViewSet)
 router.register(r'ai-requests', AIRequestViewSet)
 router.register(r'summaries', SummaryViewSet)
+router.register(r'summary-jobs', SummaryJobViewSet)
 router.register(r'items', ItemViewSet)
 router.register(r'recommendations', RecommendationViewSet)
 
 urlpatterns = [
+    path('api/projects/<int:pk>/summarize-items/stream/', summarize_items_stream, name='project-summarize-items-stream'),
+    path('api/cache-stats/', cache_stats, name='cache-stats'),
     path('api/', include(router.urls)),
 ]
@@ -1,4 +1,224 @@
-from django.http import JsonResponse
+import asyncio
+import json
+import threading
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+from rest_framework import status
+
+from .llm import LLMError, StreamFlight, get_llm_limiter
+from .models import Project
+from .response_cache import response_cache_stats
+from .serializers import SummarySerializer
+from .summarization import (
+    SUMMARY_MODES,
+    SummarizationError,
+    aprepare_summary_request,
+    create_summary,
+    find_cached_ai_request,
+    llm_error_status,
+    prompt_hash,
+    save_ai_request,
+    stream_summary_text,
+    summary_flight_key,
+    summary_item_texts,
+)
+
+# 진행 중인 스트리밍 요약 요청 (프로젝트, 모드, 입력 해시) -> leader의 결과를 담을 Future
+_summary_stream_flights = StreamFlight()
+
 
 def health(request):
     return JsonResponse({"status": "ok"})
+
+
+def cache_stats(request):
+    """조회 API 응답 캐시의 백엔드와 적중/실패 횟수"""
+    return JsonResponse(response_cache_stats())
+
+
+def sse_event(event, data):
+    """Server-Sent Events 메시지 하나를 만듭니다. data는 JSON으로 직렬화합니다."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+class SummaryStreamLease:
+    """
+    요약 스트림 하나가 잡고 있는 자원: LLM 호출 자리(limiter)와 single-flight Future.
+
+    release_slot()/finish()는 한 번만 실행되며 어느 스레드에서든 호출할 수 있습니다.
+    (응답의 close()는 ASGI 핸들러가 sync_to_async로 호출합니다.)
+    """
+
+    def __init__(self, flight_key, future):
+        self.flight_key = flight_key
+        self._future = future
+        self._limiter = None
+        self._lock = threading.Lock()
+
+    def hold(self, limiter):
+        """얻어 둔 호출 자리를 맡깁니다. (release_slot() 또는 close()에서 반납)"""
+        with self._lock:
+            self._limiter = limiter
+
+    def release_slot(self):
+        with self._lock:
+            limiter, self._limiter = self._limiter, None
+        if limiter is not None:
+            limiter.release()
+
+    def finish(self, result=None, error=None):
+        """같은 요청을 기다리는 다른 스트림에 결과(또는 오류)를 전달합니다."""
+        with self._lock:
+            future, self._future = self._future, None
+        if future is not None:
+            _summary_stream_flights.finish(self.flight_key, future, result, error)
+
+    def close(self):
+        self.release_slot()
+        self.finish(error=SummarizationError(
+            "요약 스트림이 완료되지 않았습니다. 다시 시도해주세요.", status.HTTP_503_SERVICE_UNAVAILABLE
+        ))
+
+
+class SummaryStream:
+    """
+    StreamingHttpResponse에 넘기는 비동기 이터러블.
+
+    Django는 스트리밍 내용의 close()만 응답 종료 시 호출하고 비동기 제너레이터의 aclose()는 호출하지 않으므로,
+    제너레이터가 한 번도 시작되지 않은 채 연결이 끊겨도 close()에서 자원을 반납합니다.
+    """
+
+    def __init__(self, iterator, lease=None):
+        self._iterator = iterator
+        self._lease = lease
+
+    def __aiter__(self):
+        return self._iterator.__aiter__()
+
+    def close(self):
+        if self._lease is not None:
+            self._lease.close()
+
+
+async def stream_project_summary(project, input_text, prompt_template, description, info, cached=None, lease=None):
+    """
+    요약문 조각을 'delta' 이벤트로 보내고, 스트림이 끝나면 AIRequest/Summary를 저장한 뒤
+    'done' 이벤트로 Summary를 보냅니다. 실패하면 'error' 이벤트를 보내고 아무것도 저장하지 않습니다.
+
+    lease는 호출 측이 미리 얻어 둔 LLM 호출 자리와 single-flight Future입니다. LLM 호출이 끝나면 자리를 반납하고,
+    결과(또는 오류)를 같은 요청을 기다리는 스트림에 전달합니다.
+    """
+    try:
+        info['cache_hit'] = cached is not None
+        yield sse_event('start', info)
+
+        ai_request = cached
+        if ai_request is None:
+            parts = []
+            try:
+                async for text in stream_summary_text(input_text, prompt_template):
+                    parts.append(text)
+                    yield sse_event('delta', {'text': text})
+            except SummarizationError as e:
+                if lease is not None:
+                    lease.finish(error=e)
+                yield sse_event('error', {'detail': e.detail, 'status_code': e.status_code})
+                return
+            finally:
+                if lease is not None:
+                    lease.release_slot()
+            ai_request = await sync_to_async(save_ai_request)(
+                input_text, ''.join(parts), description,
+                prompt_hash(input_text, prompt_template=prompt_template)
+            )
+        else:
+            yield sse_event('delta', {'text': ai_request.output})
+
+        summary = await sync_to_async(create_summary)(project, ai_request)
+        data = await sync_to_async(lambda: dict(SummarySerializer(summary).data))()
+        if lease is not None:
+            lease.finish(result=(info, ai_request.output, data))
+        yield sse_event('done', data)
+    finally:
+        # 도중에 연결이 끊기거나 저장에 실패한 경우
+        if lease is not None:
+            lease.close()
+
+
+async def follow_project_summary(future):
+    """같은 요청을 먼저 시작한 스트림(leader)의 결과를 기다렸다가 start/delta/done 이벤트로 한 번에 보냅니다."""
+    try:
+        info, output, data = await asyncio.wrap_future(future)
+    except SummarizationError as e:
+        yield sse_event('error', {'detail': e.detail, 'status_code': e.status_code})
+        return
+    yield sse_event('start', {**info, 'coalesced': True})
+    yield sse_event('delta', {'text': output})
+    yield sse_event('done', data)
+
+
+def event_stream_response(stream):
+    response = StreamingHttpResponse(stream, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # nginx 등 리버스 프록시의 응답 버퍼링을 끕니다.
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@csrf_exempt
+@require_http_methods(["GET", "POST"])
+async def summarize_items_stream(request, pk):
+    """
+    summarize-items의 스트리밍 버전 (text/event-stream).
+
+    ASGI 서버에서는 연결마다 스레드를 점유하지 않고 이벤트 루프에서 Gemini 스트리밍 응답을 중계합니다.
+    맵리듀스인 경우 부분 요약(map)을 마친 뒤 최종 요약(reduce)만 스트리밍합니다.
+    같은 프로젝트에 같은 입력으로 동시에 들어온 요청은 먼저 들어온 요청의 LLM 호출과 Summary를 공유합니다.
+    EventSource는 GET만 지원하므로 GET/POST 모두 허용합니다.
+    """
+    mode = request.GET.get('mode', 'auto')
+    if mode not in SUMMARY_MODES:
+        return JsonResponse({"detail": f"mode는 {', '.join(SUMMARY_MODES)} 중 하나여야 합니다."}, status=400)
+
+    project = await Project.objects.filter(pk=pk).afirst()
+    if project is None:
+        return JsonResponse({"detail": "프로젝트를 찾을 수 없습니다."}, status=404)
+
+    try:
+        item_texts = await sync_to_async(summary_item_texts)(project)
+    except SummarizationError as e:
+        return JsonResponse({"detail": e.detail}, status=e.status_code)
+
+    flight_key = summary_flight_key(project, mode, item_texts)
+    future, leader = _summary_stream_flights.join(flight_key)
+    if not leader:
+        return event_stream_response(follow_project_summary(future))
+
+    lease = SummaryStreamLease(flight_key, future)
+    try:
+        input_text, prompt_template, description, info = await aprepare_summary_request(project, mode, item_texts)
+
+        # 같은 입력으로 요청한 적이 있으면 저장된 응답을 한 번에 보냅니다.
+        cached = await sync_to_async(find_cached_ai_request)(prompt_hash(input_text, prompt_template=prompt_template))
+        if cached is None:
+            # 응답을 시작하기 전에 호출 자리를 얻어, 한도를 넘으면 429/503으로 바로 거절합니다.
+            limiter = get_llm_limiter()
+            await limiter.aacquire()
+            lease.hold(limiter)
+    except SummarizationError as e:
+        lease.finish(error=e)
+        return JsonResponse({"detail": e.detail}, status=e.status_code)
+    except LLMError as e:
+        lease.finish(error=SummarizationError(str(e), llm_error_status(e)))
+        return JsonResponse({"detail": str(e)}, status=llm_error_status(e))
+    except BaseException:
+        lease.close()
+        raise
+
+    info['coalesced'] = False
+    return event_stream_response(SummaryStream(
+        stream_project_summary(project, input_text, prompt_template, description, info, cached, lease), lease
+    ))